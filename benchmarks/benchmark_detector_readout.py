@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import os
+import time
+
+import numpy as np
+
+from skZemax.skZemaxClass import skZemaxClass
+
+# Readout time of NCE detector images as a function of detector pixel count.
+# Compares the element-by-element .NET iteration skZemax used to do (np.array(list(...)))
+# with the block memory copy of _dotnet_array_to_numpy_ for rectangular and polar detectors.
+
+PIXELS_PER_SIDE = [100, 250, 500, 1000, 1500, 2000]
+REPEATS = 3
+
+
+def _time_it_(func) -> float:
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return float(np.median(times))
+
+
+def _build_system_(skZemax: skZemaxClass) -> tuple[int, int]:
+    skZemax.Utilities_MakeNewZemaxFile(
+        skZemax.Utilities_skZemaxExampleDir() + os.sep + "benchmark_detectors.zmx"
+    )
+    skZemax.System_SetNonSequentialMode()
+    source = skZemax.NCE_AddNewObject()
+    skZemax.NCE_ChangeObjectType(source, "SourceRectangle")
+    rect_det = skZemax.NCE_AddNewObject()
+    skZemax.NCE_ChangeObjectType(rect_det, "DetectorRectangle")
+    info = skZemax.NCE_GetAllColumnDataOfObject(rect_det)
+    info["Z Position"] = 10.0
+    skZemax.NCE_SetAllColumnDataOfObjectFromDict(rect_det, info)
+    pol_det = skZemax.NCE_AddNewObject()
+    skZemax.NCE_ChangeObjectType(pol_det, "DetectorPolar")
+    return (
+        skZemax._convert_raw_obj_input_(rect_det, return_index=True),
+        skZemax._convert_raw_obj_input_(pol_det, return_index=True),
+    )
+
+
+def _set_pixels_(skZemax: skZemaxClass, in_Object: int, keys: list, npix: int):
+    info = skZemax.NCE_GetAllColumnDataOfObject(in_Object)
+    for key in keys:
+        info[key] = int(npix)
+    skZemax.NCE_SetAllColumnDataOfObjectFromDict(in_Object, info)
+
+
+if __name__ == "__main__":
+    skZemax = skZemaxClass(verbose=False)
+    rect_idx, pol_idx = _build_system_(skZemax)
+
+    print(
+        f"{'detector':>10} {'pixels':>10} {'element [s]':>12} {'block [s]':>12} {'speedup':>8}"
+    )
+    for npix in PIXELS_PER_SIDE:
+        _set_pixels_(skZemax, rect_idx, ["# X Pixels", "# Y Pixels"], npix)
+        _set_pixels_(skZemax, pol_idx, ["# Radial Pixels", "# Angular Pixels"], npix)
+        skZemax.NCE_RunRayTrace()
+        for name, read in (
+            ("rect", lambda: skZemax.TheSystem.NCE.GetAllDetectorDataSafe(rect_idx, 1)),
+            (
+                "polar",
+                lambda: skZemax.TheSystem.NCE.GetAllPolarDetectorDataSafe(
+                    pol_idx, skZemax.ZOSAPI.Editors.NCE.PolarDetectorDataType.Power
+                ),
+            ),
+        ):
+            raw = read()
+            element_time = _time_it_(lambda raw=raw: np.array(list(raw)))
+            block_time = _time_it_(lambda raw=raw: skZemax._dotnet_array_to_numpy_(raw))
+            print(
+                f"{name:>10} {npix * npix:>10} {element_time:>12.4f} {block_time:>12.4f} {element_time / block_time:>8.1f}"
+            )
+
+    del skZemax
+    skZemax = None
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import os
+import time
+
+import numpy as np
+
+from skZemax.skZemaxClass import skZemaxClass
+
+# Compares the local FFT PSF/MTF engine (Wavefront_GetPSFAndMTF, one batch ray trace of the pupil OPD)
+# with the OpticStudio FFT PSF and FFT MTF analyses (one analysis run per field/mode) on an example lens.
+# Reports the run times, the PSF peak (Strehl) differences, and the maximum MTF difference up to the cutoff frequency.
+
+LENS_FILE = (
+    "Sequential" + os.sep + "Objectives" + os.sep + "Double Gauss 28 degree field.zmx"
+)
+PUPIL_SAMPLING = 64
+PADDING_FACTOR = 4
+
+
+def _time_it_(func):
+    start = time.perf_counter()
+    out = func()
+    return out, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    skZemax = skZemaxClass(verbose=False)
+    skZemax.Utilities_OpenZemaxFile(
+        skZemax.Utilities_ZemaxInstallationExampleDir() + os.sep + LENS_FILE
+    )
+
+    local, local_time = _time_it_(
+        lambda: skZemax.Wavefront_GetPSFAndMTF(
+            pupil_sampling=PUPIL_SAMPLING, padding_factor=PADDING_FACTOR
+        )
+    )
+    zemax_psf, psf_time = _time_it_(
+        lambda: skZemax.Analyses_FFTPSF(
+            sample_size=f"{PUPIL_SAMPLING}x{PUPIL_SAMPLING}",
+            use_polarization=False,
+            use_normalization=False,
+        )
+    )
+    zemax_mtf, mtf_time = _time_it_(
+        lambda: skZemax.Analyses_FFTMTF(
+            sample_size=f"{PUPIL_SAMPLING}x{PUPIL_SAMPLING}", use_polarization=False
+        )
+    )
+
+    print(f"{'method':>24} {'time [s]':>10}")
+    print(f"{'Wavefront_GetPSFAndMTF':>24} {local_time:>10.2f}")
+    print(f"{'Analyses_FFTPSF':>24} {psf_time:>10.2f}")
+    print(f"{'Analyses_FFTMTF':>24} {mtf_time:>10.2f}")
+    print()
+
+    print(f"{'field':>6} {'local peak':>12} {'zemax peak':>12} {'max |dMTF|':>12}")
+    cutoff = float(local.attrs["Cutoff_Frequency"])
+    freq = zemax_mtf.freq.values
+    in_band = freq <= cutoff
+    for idx in range(local.field.shape[0]):
+        # Zemax tangential MTF is periodic in x, its sagittal MTF is periodic in y.
+        local_mtf = np.stack(
+            [
+                np.interp(
+                    freq,
+                    local.freq.values,
+                    local.mtf_modulation.isel(field=idx).sel(direction=x).values,
+                )
+                for x in ["y", "x"]
+            ],
+            axis=-1,
+        )
+        zemax_field_mtf = zemax_mtf.modulation.isel(field=idx).values
+        print(
+            f"{int(local.field.values[idx]):>6} "
+            f"{float(local.psf_polychromatic.isel(field=idx).max()):>12.4f} "
+            f"{float(zemax_psf.linear.isel(field=idx).max()):>12.4f} "
+            f"{float(np.abs(local_mtf - zemax_field_mtf)[in_band].max()):>12.4f}"
+        )
@@ -22,6 +22,42 @@ class skZemaxClass(PythonStandaloneApplication):
         """
         super().__init__(path=path)
         self._verbose = verbose
+        # Kept so worker instances (see Parallel_RunAnalyses()) use the same OpticStudio installation.
+        self._zemax_path = path
+        # Cache of NCE detector information. See _NCE_GetDetectorIndex_().
+        self._nce_detector_index = None
+        # Cache of the (static) LDE column enumerators and names. See _LDE_GetSurfaceColumns_().
+        self._lde_surface_columns = None
+        # Cache of the (static) NCE column enumerators and names. See _NCE_GetObjectColumns_().
+        self._nce_object_columns = None
+        # Caches of analysis configuration (.CFG) file bytes. See _Analysis_SetZOSObjectSettingsByDict_().
+        self._analysis_cfg_templates = {}
+        self._analysis_cfg_edited = {}
+        self._analysis_applied_settings = {}
+        # Pool of open analysis objects. See _Analysis_GetZOSObjectAndSettings_().
+        self._analysis_live = {}
+        self._analysis_pool = {}
+        # Analysis objects kept by a sweep. See _Analysis_Sweep_().
+        self._analysis_sweep = None
+        # Cache of Zernike basis matrices by pupil sampling. See _Zernike_GetBasis_().
+        self._zernike_basis_cache = {}
+        # Incremental system fingerprint: hashes by region (and by configuration and LDE/NCE row), and the regions marked as changed. See System_Fingerprint().
+        self._system_fingerprint_hashes = {}
+        self._system_fingerprint_rows = {}
+        self._system_fingerprint_dirty = set()
+        # Cache of system units, mode, field normalization, and wavelengths. See _System_GetMetadata_().
+        self._system_metadata = None
+        # Cache of (state fingerprint, data) of System_GetFirstOrderData(). See _System_StateFingerprint_().
+        self._first_order_cache = None
+        # Opt-in cache of analysis results. See AnalysisCache_Enable().
+        self._analysis_cache_settings = None
+        self._analysis_cache_entries = {}
+        self._analysis_cache_stats = {
+            "hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "bypassed": 0,
+        }
         # To make implementation of raytracing faster, skZemax uses the .dll the 'Help->Help PDF' directs you to:
         # https://optics.ansys.com/hc/en-us/articles/42661765866899-Batch-Processing-of-Ray-Trace-Data-using-ZOS-API-in-MATLAB-or-Python
         # Importing it here
@@ -42,6 +78,7 @@ class skZemaxClass(PythonStandaloneApplication):
 
     # Adding skZemax_subfunctions to skZemaxClass
     from skZemax.skZemax_subfunctions._analyses_functions import (
+        Analyses_CloseAllAnalyses,
         Analyses_ExtractSectionOfTextFile,
         Analyses_ImageSimulation,
         Analyses_FFTMTF,
@@ -49,20 +86,70 @@ class skZemaxClass(PythonStandaloneApplication):
         Analyses_HuygensMTF,
         Analyses_HuygensPSF,
         Analyses_Footprint,
+        Analyses_FootprintFromRayTrace,
         Analyses_GetNamesOfAllAnalyses,
+        Analyses_GetNumberOfLiveAnalyses,
         Analyses_ReportSurfacePrescription,
         Analyses_ReportSystemPrescription,
         Analyses_GetGeneralLensData,
+        Analyses_ReadResults,
         Analyses_RunAnalysesAndGetResults,
+        Analyses_Session,
+        Analyses_ThroughFocus,
+        _Analysis_DataGridRgbToDataset_,
+        _Analysis_DataGridToDataset_,
+        _Analysis_DataScatterPointsToDataset_,
+        _Analysis_DataSeriesToDataset_,
         _Analysis_GeneralDataSeriesReader_,
         _Analysis_GeneralDataGridReader_,
+        _Analysis_ClearSettingsCache_,
+        _Analysis_CloseZOSObjects_,
+        _Analysis_ForgetAppliedSettings_,
+        _Analysis_GetSettingsTemplate_,
         _Analysis_GetZOSObjectAndSettings_,
+        _Analysis_LoadSettingsBytes_,
+        _Analysis_PsfFromRealImaginary_,
+        _Analysis_ReleaseZOSObject_,
+        _Analysis_ResetZOSObjectSettings_,
+        _Analysis_SettingsAlreadyApplied_,
         _Analysis_SetZOSObjectSettingsByBinaryAlteration_,
+        _Analysis_Sweep_,
+        _Analysis_SweepReplay_,
+        _Analysis_SweepReplaying_,
+        _Analysis_ThroughFocusSweep_,
         _Analysis_SetZOSObjectSettingsByDict_,
         _Analysis_CalcLsfEsfFrom2DPsf_,
+        _Analysis_UniqueConfigFilePath_,
+    )
+    from skZemax.skZemax_subfunctions._analyses_cache_functions import (
+        AnalysisCache_Clear,
+        AnalysisCache_Disable,
+        AnalysisCache_Enable,
+        AnalysisCache_GetStatistics,
+        _AnalysisCache_Key_,
+        _AnalysisCache_Lookup_,
+        _AnalysisCache_Store_,
+    )
+    from skZemax.skZemax_subfunctions._analyses_cfg_functions import (
+        AnalysisCfg_Diff,
+        AnalysisCfg_Read,
+        AnalysisCfg_SetSetting,
+        AnalysisCfg_Write,
+    )
+    from skZemax.skZemax_subfunctions._analyses_math_functions import (
+        _Analysis_BestFocusAndDepthOfFocus_,
+        _Analysis_PsfLog_,
+        _Analysis_SquareWaveFromMTF_,
+    )
+    from skZemax.skZemax_subfunctions._analyses_report_functions import (
+        AnalysisReport_IndexSections,
+        AnalysisReport_ParseGeneralLensData,
+        AnalysisReport_ParsePrescription,
+        AnalysisReport_ParseSurfacePrescription,
     )
     from skZemax.skZemax_subfunctions._analyses_plotting_functions import (
         AnalysisPlotting_Footprint,
+        AnalysisPlotting_FootprintRays,
     )
     from skZemax.skZemax_subfunctions._CAD_functions import (
         CAD_ExportSequentialCadSTPFileAs,
@@ -82,6 +169,14 @@ class skZemaxClass(PythonStandaloneApplication):
         Fields_GetNumberOfFields,
         _convert_raw_field_input_,
     )
+    from skZemax.skZemax_subfunctions._image_simulation_functions import (
+        Analyses_ImageSimulationLocal,
+        ImageSimulation_Convolve,
+        ImageSimulation_GetPSFGrid,
+        ImageSimulation_ResamplePSF,
+        _ImageSimulation_CreateZarrStore_,
+        _ImageSimulation_LoadScene_,
+    )
     from skZemax.skZemax_subfunctions._LDE_functions import (
         LDE_AddNewSurface,
         LDE_BuildRayTraceNormalizedUnpolarizedRays,
@@ -91,7 +186,9 @@ class skZemaxClass(PythonStandaloneApplication):
         LDE_ChangeApertureToRectangular,
         LDE_ChangeSurfaceType,
         LDE_CheckIfSurfaceIsStop,
+        LDE_ApplySnapshot,
         LDE_CopyAndInsertSurfacesFromFile,
+        LDE_DiffSnapshot,
         LDE_GetAllColumnDataOfSurface,
         LDE_GetApertureAsCircularObscurationType,
         LDE_GetApertureAsCircularType,
@@ -101,6 +198,7 @@ class skZemaxClass(PythonStandaloneApplication):
         LDE_GetNamesOfAllSurfaceTypes,
         LDE_GetNumberOfSurfaces,
         LDE_GetObjectRotationAndPositionMatrices,
+        LDE_GetSnapshot,
         LDE_GetStopSurface,
         LDE_GetSurface,
         LDE_GetSurfaceApertureType,
@@ -114,7 +212,9 @@ class skZemaxClass(PythonStandaloneApplication):
         LDE_SetTiltDecenterOfSurface,
         _convert_raw_surface_input_,
         _LDE_GetSurfaceCalls_,
+        _LDE_GetSnapshotEditor_,
         _LDE_GetSurfaceColumns_,
+        _LDE_RaysByField_,
         _run_NormUnPol_raytrace_,
     )
     from skZemax.skZemax_subfunctions._MCE_functions import (
@@ -149,21 +249,28 @@ class skZemaxClass(PythonStandaloneApplication):
         NCE_SaveDetectorInZemaxFormat,
         _detector_file_name_checker_,
         _NCE_CheckDetector_GetInfo_,
+        _NCE_CheckDetectorQuantities_,
+        _NCE_GetDetectorIndex_,
         _NCE_GetDetector_InfoAndImage_Coherent_,
         _NCE_GetDetector_InfoAndImage_Incoherent_,
         _NCE_GetDetector_InfoAndImage_Polar_,
         _NCE_GetPolDet_Complete_,
         _NCE_GetRectDet_Complete_,
+        _NCE_InvalidateDetectorIndex_,
+        _NCE_ReadDetectorImage_,
     )
     from skZemax.skZemax_subfunctions._NCE_functions import (
         NCE_AddNewObject,
+        NCE_ApplySnapshot,
         NCE_ChangeObjectType,
         NCE_ColocateObject,
+        NCE_DiffSnapshot,
         NCE_GetAllColumnDataOfObject,
         NCE_GetNumberOfObjects,
         NCE_GetObject,
         NCE_GetObjectColumnEnum,
         NCE_GetObjectRotationAndPositionMatrices,
+        NCE_GetSnapshot,
         NCE_InsertNewObject,
         NCE_ReadZDRFile,
         NCE_RemoveObject,
@@ -172,6 +279,12 @@ class skZemaxClass(PythonStandaloneApplication):
         _convert_raw_obj_input_,
         _NCE_GetObjectCellCalls_,
         _NCE_GetObjectColumns_,
+        _NCE_GetSnapshotEditor_,
+    )
+    from skZemax.skZemax_subfunctions._parallel_functions import (
+        Parallel_GetNumberOfWorkers,
+        Parallel_RunAnalyses,
+        _Parallel_SaveTemporaryCopyOfSystem_,
     )
     from skZemax.skZemax_subfunctions._rayaiming_functions import (
         RayAiming_GetNamesOfAllAimingMethods,
@@ -195,12 +308,15 @@ class skZemaxClass(PythonStandaloneApplication):
     from skZemax.skZemax_subfunctions._system_functions import (
         System_AddMaterialCatalog,
         System_ConvertSequentialToNonSequential,
+        System_Fingerprint,
         System_GetIfInNonSequentialMode,
         System_GetIfInSequentialMode,
         System_GetMode,
         System_GetNamesOfAllApertureSettings,
+        System_GetFirstOrderData,
         System_GetNamesOfAllMaterialCatalogs,
         System_Lockdown,
+        System_Preserve,
         System_SetAdvancedProperty,
         System_SetApertureProperty,
         System_SetEnvironmentProperty,
@@ -208,6 +324,14 @@ class skZemaxClass(PythonStandaloneApplication):
         System_SetNonSequentialMode,
         System_SetPolarizationProperty,
         System_SetSequentialMode,
+        _System_GetMetadata_,
+        _System_HashEditorRow_,
+        _System_HashRegion_,
+        _System_MarkDirty_,
+        _System_StateFingerprint_,
+        _System_RestoreSnapshot_,
+        _System_SuspendUpdates_,
+        _System_TakeSnapshot_,
     )
     from skZemax.skZemax_subfunctions._utility_functions import (
         Utilities_AnalysesFilesDir,
@@ -237,6 +361,14 @@ class skZemaxClass(PythonStandaloneApplication):
         _Visualization_NSC_Common_,
         _Visualization_SEQ_Common_,
     )
+    from skZemax.skZemax_subfunctions._wavefront_functions import (
+        Wavefront_ComputeMTF,
+        Wavefront_ComputePSF,
+        Wavefront_GetPSFAndMTF,
+        Wavefront_GetPupilFunction,
+        _Wavefront_FieldNormalization_,
+        _Wavefront_NormalizedFieldCoordinates_,
+    )
     from skZemax.skZemax_subfunctions._wavelength_functions import (
         Wavelength_AddWavelength,
         Wavelength_SelectWavelengthPreset,
@@ -254,11 +386,18 @@ class skZemaxClass(PythonStandaloneApplication):
         Wavelength_GetPrimaryWavelengthAsMicrometers,
         _convert_raw_wavelength_input_,
     )
+    from skZemax.skZemax_subfunctions._zernike_functions import (
+        Zernike_Evaluate,
+        Zernike_FitRayTraceOPD,
+        Zernike_GetTermIndices,
+        _Zernike_GetBasis_,
+    )
     from skZemax.skZemax_subfunctions._ZOSAPI_interface_functions import (
         __LowLevelZemaxStringCheck__,
         _CheckIfStringValidInDir_,
         _convert_raw_input_worker_,
         _ctype_to_numpy_,
+        _dotnet_array_to_numpy_,
         _SetAttrByStringIfValid_,
     )
 
@@ -15,6 +15,10 @@ from skZemax.skZemax_subfunctions._ZOSAPI_interface_functions import (
     _CheckIfStringValidInDir_,
     _convert_raw_input_worker_,
     _ctype_to_numpy_,
+    _editor_apply_snapshot_,
+    _editor_diff_snapshot_,
+    _editor_get_snapshot_,
+    _set_editor_cell_value_,
 )
 
 
@@ -79,6 +83,7 @@ def LDE_InsertNewSurface(
     :rtype: ZOSAPI_Editors_LDE_ILDERow
     """
 
+    self._System_MarkDirty_("LDE")
     return self.TheSystem.LDE.InsertNewSurfaceAt(
         self._convert_raw_surface_input_(insertSurface, return_index=True)
     )
@@ -92,6 +97,7 @@ def LDE_AddNewSurface(self) -> ZOSAPI_Editors_LDE_ILDERow:
     :rtype: ZOSAPI_Editors_LDE_ILDERow
     """
 
+    self._System_MarkDirty_("LDE")
     return self.TheSystem.LDE.AddSurface()
 
 
@@ -103,6 +109,7 @@ def LDE_RemoveSurface(self, delSurface: int | ZOSAPI_Editors_LDE_ILDERow) -> Non
     :type delSurface: Union[int, ZOSAPI_Editors_LDE_ILDERow]
     """
 
+    self._System_MarkDirty_("LDE")
     self.TheSystem.LDE.RemoveSurfaceAt(
         self._convert_raw_surface_input_(delSurface, return_index=True)
     )
@@ -138,6 +145,7 @@ def LDE_CopyAndInsertSurfacesFromFile(
         self.TheApplication.get_NumberOfOpticalSystems() - 1, False
     )
     del new_system
+    self._System_MarkDirty_("LDE")
 
 
 def LDE_GetNamesOfAllSurfaceTypes(self, print_to_console: bool = False) -> list:
@@ -181,6 +189,7 @@ def LDE_ChangeSurfaceType(
     )
     if surfacetype is not None:
         SurfaceLDE.ChangeType(SurfaceLDE.GetSurfaceTypeSettings(surfacetype))
+        self._System_MarkDirty_("LDE", SurfaceLDE.SurfaceNumber)
     elif self._verbose:
         cp("!@ly!@LDE_ChangeSurfaceType :: Did not change surface type")
     return SurfaceLDE
@@ -291,6 +300,7 @@ def LDE_ChangeApertureToRectangular(
     settings._S_RectangularAperture.ApertureXDecenter = ApertureXDecenter
     settings._S_RectangularAperture.ApertureYDecenter = ApertureYDecenter
     SurfaceLDE.ApertureData.ChangeApertureTypeSettings(settings)
+    self._System_MarkDirty_("LDE", SurfaceLDE.SurfaceNumber)
     return SurfaceLDE
 
 
@@ -356,6 +366,7 @@ def LDE_ChangeApertureToCircular(
     settings._S_CircularAperture.ApertureXDecenter = ApertureXDecenter
     settings._S_CircularAperture.ApertureYDecenter = ApertureYDecenter
     SurfaceLDE.ApertureData.ChangeApertureTypeSettings(settings)
+    self._System_MarkDirty_("LDE", SurfaceLDE.SurfaceNumber)
     return SurfaceLDE
 
 
@@ -421,6 +432,7 @@ def LDE_ChangeApertureToCircularObscuration(
     settings._S_CircularObscuration.ApertureXDecenter = ApertureXDecenter
     settings._S_CircularObscuration.ApertureYDecenter = ApertureYDecenter
     SurfaceLDE.ApertureData.ChangeApertureTypeSettings(settings)
+    self._System_MarkDirty_("LDE", SurfaceLDE.SurfaceNumber)
     return SurfaceLDE
 
 
@@ -473,6 +485,7 @@ def LDE_ChangeApertureToFloating(
         in_Surface=SurfaceLDE, aperture_type="FloatingAperture"
     )
     SurfaceLDE.ApertureData.ChangeApertureTypeSettings(settings)
+    self._System_MarkDirty_("LDE", SurfaceLDE.SurfaceNumber)
     return SurfaceLDE
 
 
@@ -485,6 +498,7 @@ def LDE_SetSurfaceAsStop(self, in_Surface: int | ZOSAPI_Editors_LDE_ILDERow) ->
     """
     in_Surface = self._convert_raw_surface_input_(in_Surface, return_index=False)
     in_Surface.IsStop = True
+    self._System_MarkDirty_("LDE")
 
 
 def LDE_GetStopSurface(self) -> ZOSAPI_Editors_LDE_ILDERow:
@@ -524,10 +538,13 @@ def LDE_CheckIfSurfaceIsStop(
 def _LDE_GetSurfaceColumns_(self) -> tuple:
     """
     Worker function which builds a surface's column names and underlying attributes.
+    The columns are static for the ZOS-API, so they are only built once and then cached.
 
     :return: the surface column call to access the enumerators, and the sting names of the columns
     :rtype: tuple
     """
+    if self._lde_surface_columns is not None:
+        return self._lde_surface_columns
     all_surface_columns = __LowLevelZemaxStringCheck__(
         self, self.ZOSAPI.Editors.LDE.SurfaceColumn
     )
@@ -556,7 +573,8 @@ def _LDE_GetSurfaceColumns_(self) -> tuple:
     surface_column_calls = [
         getattr(self.ZOSAPI.Editors.LDE.SurfaceColumn, x) for x in surface_columns
     ]
-    return surface_column_calls, surface_columns
+    self._lde_surface_columns = (surface_column_calls, surface_columns)
+    return self._lde_surface_columns
 
 
 def _LDE_GetSurfaceCalls_(self, SurfaceLDE: ZOSAPI_Editors_LDE_ILDERow) -> tuple:
@@ -645,6 +663,85 @@ def LDE_GetAllColumnDataOfSurface(
     return out
 
 
+def _LDE_GetSnapshotEditor_(self) -> Box:
+    """
+    Worker function which describes the LDE for the editor snapshot functions (see :func:`_editor_get_snapshot_`).
+
+    :return: The description of the LDE.
+    :rtype: Box
+    """
+    return Box(
+        name="LDE",
+        row_dim="surface",
+        index_base=0,
+        number_of_rows=self.LDE_GetNumberOfSurfaces,
+        columns=self._LDE_GetSurfaceColumns_,
+        get_row=self.TheSystem.LDE.GetSurfaceAt,
+        get_cell=lambda row, column_call: row.GetSurfaceCell(column_call),
+        change_type=self.LDE_ChangeSurfaceType,
+    )
+
+
+def LDE_GetSnapshot(self) -> xr.Dataset:
+    """
+    Reads the column data of every surface of the LDE in a single sweep and returns it as a table indexed by surface and column.
+
+    This is the whole-system equivalent of calling :func:`LDE_GetAllColumnDataOfSurface` on each surface, but much faster:
+    the column enumerators are only built once (see :func:`_LDE_GetSurfaceColumns_`) and the unused columns at the end of each surface are skipped.
+
+    .. code-block:: python
+
+        snapshot = skZemax.LDE_GetSnapshot()
+        snapshot.value.sel(surface=3, column="Thickness")  # As given by the ZOS-API (string)
+        snapshot.numeric_value.sel(column="Radius")  # As floats (NaN where not numeric)
+        snapshot.header.sel(surface=3)  # Column names of the surface type
+
+    The snapshot can be edited and written back to the LDE with :func:`LDE_ApplySnapshot`.
+
+    :return: Dataset with dimensions (surface, column) holding the cell values, their numeric values, and the cell headers, and
+             (surface) holding the surface types. Unused cells have an empty value and a '(unused)' header.
+    :rtype: xr.Dataset
+    """
+    return _editor_get_snapshot_(self, self._LDE_GetSnapshotEditor_())
+
+
+def LDE_DiffSnapshot(self, snapshot: xr.Dataset) -> list:
+    """
+    Compares an (edited) snapshot of :func:`LDE_GetSnapshot` against the live LDE and returns the changes needed to make the LDE match it.
+
+    Cells are edited through the 'value' entries of the snapshot, as strings or numbers (the 'numeric_value' entries are only for reading).
+    Changed surface types are given with the column 'surface_type'. The cells of such a surface are only compared once its type is changed (see :func:`LDE_ApplySnapshot`).
+
+    :param snapshot: The snapshot with the desired state of the LDE.
+    :type snapshot: xr.Dataset
+    :return: list of changes as dict[surface, column, header, current_value, new_value]. None if the snapshot does not have the same number of surfaces as the LDE.
+    :rtype: list
+    """
+    return _editor_diff_snapshot_(self, self._LDE_GetSnapshotEditor_(), snapshot)
+
+
+def LDE_ApplySnapshot(self, snapshot: xr.Dataset) -> int:
+    """
+    Makes the live LDE match an (edited) snapshot of :func:`LDE_GetSnapshot`, writing only the cells which differ (see :func:`LDE_DiffSnapshot`).
+
+    This is the transaction equivalent of calling :func:`LDE_SetAllColumnDataOfSurfaceFromDict` on each surface:
+    the snapshot is edited in python, and the changes are then written in one batch (with the OpticStudio UI updates suspended, if shown).
+
+    .. code-block:: python
+
+        snapshot = skZemax.LDE_GetSnapshot()
+        snapshot.value.loc[dict(surface=3, column="Thickness")] = 12.5
+        snapshot.value.loc[dict(surface=4, column="Material")] = "N-SF11"
+        number_of_writes = skZemax.LDE_ApplySnapshot(snapshot)  # 2
+
+    :param snapshot: The snapshot with the desired state of the LDE.
+    :type snapshot: xr.Dataset
+    :return: The number of writes (cells and surface types) made to the LDE. None if the snapshot could not be applied.
+    :rtype: int
+    """
+    return _editor_apply_snapshot_(self, self._LDE_GetSnapshotEditor_(), snapshot)
+
+
 def LDE_SetAllColumnDataOfSurfaceFromDict(
     self, in_Surface: int | ZOSAPI_Editors_LDE_ILDERow, SurfaceLDE_dict: dict | Box
 ) -> None:
@@ -663,25 +760,16 @@ def LDE_SetAllColumnDataOfSurfaceFromDict(
     :param SurfaceLDE_dict: Column properties and values to set for the surface.
     :type SurfaceLDE_dict: dict|Box
     """
-    surfacecolumn_calls, _surface_columns = self._LDE_GetSurfaceCalls_(
-        self._convert_raw_surface_input_(in_Surface, return_index=False)
-    )
+    SurfaceLDE = self._convert_raw_surface_input_(in_Surface, return_index=False)
+    self._System_MarkDirty_("LDE", SurfaceLDE.SurfaceNumber)
+    surfacecolumn_calls, _surface_columns = self._LDE_GetSurfaceCalls_(SurfaceLDE)
     for scall in surfacecolumn_calls:
         if "(unused)" in scall.Header and "Par 0" not in scall.Header:
             break  # Everything after this should be empty
         if "(unused)" in scall.Header:
             pass
         elif SurfaceLDE_dict[scall.Header] != scall.Value:
-            if isinstance(SurfaceLDE_dict[scall.Header], int):
-                try:
-                    scall.IntegerValue = SurfaceLDE_dict[scall.Header]
-                except Exception:
-                    scall.Value = str(
-                        SurfaceLDE_dict[scall.Header]
-                    )  # If fail, fall back to string input.
-            else:
-                if SurfaceLDE_dict[scall.Header] is not None:
-                    scall.Value = str(SurfaceLDE_dict[scall.Header])
+            _set_editor_cell_value_(scall, SurfaceLDE_dict[scall.Header])
 
 
 def LDE_SetTiltDecenterOfSurface(
@@ -757,6 +845,7 @@ def LDE_SetTiltDecenterOfSurface(
     SurfaceLDE.TiltDecenterData.AfterSurfaceTiltX = AfterSurfaceTiltX
     SurfaceLDE.TiltDecenterData.AfterSurfaceTiltY = AfterSurfaceTiltY
     SurfaceLDE.TiltDecenterData.AfterSurfaceTiltZ = AfterSurfaceTiltZ
+    self._System_MarkDirty_("LDE", SurfaceLDE.SurfaceNumber)
     return SurfaceLDE
 
 
@@ -788,6 +877,7 @@ def LDE_SetTiltDecenterAfterSurfaceMode(
     :rtype: ZOSAPI_Editors_LDE_ILDERow
     """
     SurfaceLDE = self._convert_raw_surface_input_(in_Surface, return_index=False)
+    self._System_MarkDirty_("LDE", SurfaceLDE.SurfaceNumber)
     if isinstance(mode, str):
         if "explicit" in mode.lower():
             SurfaceLDE.TiltDecenterData.SetAfterSurfaceModeExplicit()
@@ -882,13 +972,52 @@ def LDE_RunRayTrace(self, ray_trace_rays: xr.Dataset = None) -> xr.Dataset:
         extra_exclude_filter=["NSC"],
     )
     if "CreateNormUnpol" in str(desired_ray_trace_call):
-        ray_trace_rays = self._run_NormUnPol_raytrace_(
-            opened_batch_ray_trace, desired_ray_trace_call, ray_trace_rays
-        )
+        # The ray trace rewrites the system wavelengths in chunks. They are restored on exit.
+        with self.System_Preserve(wavelengths=True, fields=False, config=False):
+            ray_trace_rays = self._run_NormUnPol_raytrace_(
+                opened_batch_ray_trace, desired_ray_trace_call, ray_trace_rays
+            )
     opened_batch_ray_trace.Close()
     return ray_trace_rays
 
 
+def _LDE_RaysByField_(
+    self, ray_trace_rays: xr.Dataset, fields: np.ndarray | list
+) -> xr.Dataset:
+    """
+    Splits the 'ray' dimension of a ray trace into ('field', 'pupil_ray').
+    This expects the rays to have been built field by field, with the same number of pupil rays per field
+    (as done by :func:`LDE_BuildRayTraceNormalizedUnpolarizedRays` when tracing every pupil point for every field).
+
+    :param ray_trace_rays: Rays (traced or not) from :func:`LDE_BuildRayTraceNormalizedUnpolarizedRays` or :func:`LDE_RunRayTrace`.
+    :type ray_trace_rays: xr.Dataset
+    :param fields: The field numbers the rays were built for, in order.
+    :type fields: np.ndarray | list
+    :return: The rays with the 'ray' dimension replaced by ('field', 'pupil_ray').
+    :rtype: xr.Dataset
+    """
+    fields = np.asarray(fields)
+    rays_per_field = ray_trace_rays.ray.shape[0] // fields.shape[0]
+    if rays_per_field * fields.shape[0] != ray_trace_rays.ray.shape[0]:
+        cp(
+            f"!@lr!@_LDE_RaysByField_ :: [!@lm!@{ray_trace_rays.ray.shape[0]}!@lr!@] rays can not be split evenly over [!@lm!@{fields.shape[0]}!@lr!@] fields."
+        )
+        return None
+    return (
+        ray_trace_rays.assign_coords(
+            {
+                "field": ("ray", np.repeat(fields, rays_per_field)),
+                "pupil_ray": (
+                    "ray",
+                    np.tile(np.arange(rays_per_field), fields.shape[0]),
+                ),
+            }
+        )
+        .set_index(ray=["field", "pupil_ray"])
+        .unstack("ray")
+    )
+
+
 def LDE_BuildRayTraceNormalizedUnpolarizedRays(
     self,
     Hx: np.ndarray = np.array([0]),
@@ -1030,11 +1159,6 @@ def LDE_BuildRayTraceNormalizedUnpolarizedRays(
     initial_system_primary_wavelength_um = (
         self.Wavelength_GetPrimaryWavelengthAsMicrometers()
     )
-    # Enforce new primary in the first index.
-    self.Wavelength_RemoveAllButPrimaryWavelength()
-    self.Wavelength_AddWavelength(primary_wavelength, 1.0)
-    self.Wavelength_SetPrimaryWavelength(2)
-    self.Wavelength_RemoveAllButPrimaryWavelength()
     # Sort out the wavelengths and their indices in batches. The primary wavelength will always be the first wavelength in the
     # wavelenth array. The wavelengths will be broken into batches with lens of [24, <=23, ..., <=23].
     # This is because the primary wavelength must always be in the system and will be the 24th wavelenegth of all chuncks following the first.
@@ -1150,6 +1274,7 @@ def _run_NormUnPol_raytrace_(
     """
     Executes a Normalized Un-polarized Raytrace. This function is expected to be called only by :func:`LDE_RunRayTrace`.
     This particular worker function should be selected by the 'ray_trace_type' property in the xarray of rays to be traced.
+    It rewrites the system wavelengths in chunks, :func:`LDE_RunRayTrace` restores them (see :func:`System_Preserve`).
 
     TODO: I think there is a bug in what Zemax returns through the RayTrae.dll. The X/Y/Z normals of the very last (image) surface are wrong and should
           probably be the same of the surface before(?). This is a probalem if only traceing the last surface and not the whole system. Solution TBD.
@@ -1612,21 +1737,6 @@ def _run_NormUnPol_raytrace_(
     ).values
     ray_trace_rays.angle_in.values[np.isnan(ray_trace_rays.angle_in.values)] = 0.0
     ray_trace_rays.angle_in.values[:, 0, :] = 0.0
-    # Reset the file's wavelengths and return
-    self.Wavelength_RemoveAllButPrimaryWavelength()
-    self.Wavelength_AddWavelength(
-        float(ray_trace_rays.initial_system_primary_wavelength_um)
-    )
-    self.Wavelength_SetPrimaryWavelength(2)
-    self.Wavelength_RemoveAllButPrimaryWavelength()
-    [
-        self.Wavelength_AddWavelength(float(x), float(y))
-        for x, y in zip(
-            ray_trace_rays.initial_system_wavelengths_um,
-            ray_trace_rays.initial_system_weights,
-        )
-        if x != float(ray_trace_rays.initial_system_primary_wavelength_um)
-    ]
     return ray_trace_rays.drop_vars("ray_traceing_chunk_idx")
 
 
@@ -36,6 +36,7 @@ def MCE_AddConfig(self, with_pickups: bool = False):
     :param with_pickups: if set to true, add pickups from the previous configuration, defaults to False
     :type with_pickups: bool, optional
     """
+    self._System_MarkDirty_()
     self.TheSystem.MCE.AddConfiguration(with_pickups)
 
 
@@ -48,6 +49,7 @@ def MCE_InsertConfig(self, config_idx: int, with_pickups: bool = False):
     :param with_pickups: _description_, defaults to False
     :type with_pickups: bool, optional
     """
+    self._System_MarkDirty_()
     self.TheSystem.MCE.InsertConfiguration(config_idx, with_pickups)
 
 
@@ -59,6 +61,7 @@ def MCE_DeleteConfig(self, config_idx: int):
     :type config_idx: int
     """
     if config_idx <= self.MCE_GetNumberOfConfigs() and config_idx > 0:
+        self._System_MarkDirty_()
         self.TheSystem.MCE.DeleteConfiguration(config_idx)
     else:
         if self._verbose:
@@ -75,6 +78,7 @@ def MCE_MakeAllSingleConfig(self, deleteMFEOperands: bool = False):
     :param deleteMFEOperands: If True, merit function operands of the configurations will be removed, else MFE operands will remain, defaults to False
     :type deleteMFEOperands: bool, optional
     """
+    self._System_MarkDirty_()
     self.TheSystem.MCE.MakeSingleConfigurationOpt(deleteMFEOperands)
 
 
@@ -86,6 +90,8 @@ def MCE_SetActiveConfig(self, config_idx: int):
     :type config_idx: int
     """
     if config_idx <= self.MCE_GetNumberOfConfigs() and config_idx > 0:
+        # The editors show the values of the active configuration.
+        self._System_MarkDirty_("config")
         self.TheSystem.MCE.SetCurrentConfiguration(config_idx)
     else:
         if self._verbose:
@@ -135,6 +141,7 @@ def MCE_AddConfigOperand(self) -> ZOSAPI_Editors_MCE_IMCERow:
     :return: The operand object
     :rtype: ZOSAPI_Editors_MCE_IMCERow
     """
+    self._System_MarkDirty_("MCE")
     return self.TheSystem.MCE.AddOperand()
 
 
@@ -145,6 +152,7 @@ def MCE_DeleteConfigOperand(self, in_op: int | ZOSAPI_Editors_MCE_IMCERow):
     :param in_op: The multi-configuration operand to delete (object or index).
     :type in_op: Union[int, ZOSAPI_Editors_MCE_IMCERow]
     """
+    self._System_MarkDirty_("MCE")
     self.TheSystem.MCE.RemoveOperandAt(
         self._convert_raw_MCEOper_input_(in_op, return_index=True)
     )
@@ -161,6 +169,7 @@ def MCE_InsertConfigOperand(
     :return: The new operand object.
     :rtype: ZOSAPI_Editors_MCE_IMCERow
     """
+    self._System_MarkDirty_("MCE")
     return self.TheSystem.MCE.InsertNewOperandAt(
         self._convert_raw_MCEOper_input_(in_op, return_index=True)
     )
@@ -227,6 +236,8 @@ def MCE_SetOperand(
 
     num_of_configs = self.MCE_GetNumberOfConfigs()
     in_op = self._convert_raw_MCEOper_input_(in_op, return_index=False)
+    # The values of the active configuration show in the other editors.
+    self._System_MarkDirty_("MCE")
     in_op.ChangeType(
         self._CheckIfStringValidInDir_(
             self.ZOSAPI.Editors.MCE.MultiConfigOperandType,
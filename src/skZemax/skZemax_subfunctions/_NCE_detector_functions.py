@@ -1,35 +1,176 @@
 from __future__ import annotations
 
 import os
+from typing import Any
 
 import numpy as np
 import xarray as xr
+from box import Box
 
 from skZemax.skZemax_subfunctions._c_print import c_print as cp
+from skZemax.skZemax_subfunctions._ZOSAPI_interface_functions import (
+    _dotnet_array_to_numpy_,
+)
 
 type ZOSAPI_Editors_NCE_INCERow = object  # <- ZOSAPI.Editors.NCE.INCERow # The actual module is referenced by the base PythonStandaloneApplication class.
 type ZOSAPI_Editors_NCE_ObjectColumn = object  # <- ZOSAPI.Editors.NCE.ObjectColumn # The actual module is referenced by the base PythonStandaloneApplication class.
 type ZOSAPI_Editors_NCE_IEditorCell = object  # <- ZOSAPI.Editors.IEditorCell # The actual module is referenced by the base PythonStandaloneApplication class.
 
 
+# Rectangular detector quantities, in the order they are given by :func:`NCE_GetDetectorComplete`.
+_RECT_DET_QUANTITIES_ = [
+    "power",
+    "incoherent_irradiance",
+    "incoherent_radiant_intensity",
+    "incoherent_radiance_position",
+    "incoherent_radiance_angle",
+    "detector_fov_angles",
+    "coherent_irradiance",
+    "coherent_phase",
+    "coherent_real",
+    "coherent_imag",
+    "coherent_amp",
+    "coherent_power",
+]
+# Rectangular detector quantities read directly from OpticStudio, and the (read type, data type) to read them with.
+_RECT_DET_READS_ = {
+    "power": ("Incoherent", 0),
+    "incoherent_irradiance": ("Incoherent", 1),
+    "incoherent_radiant_intensity": ("Incoherent", 2),
+    "coherent_real": ("Coherent", "Real"),
+    "coherent_imag": ("Coherent", "Imag"),
+    "coherent_amp": ("Coherent", "Amp"),
+    "coherent_power": ("Coherent", "Power"),
+}
+# Derived rectangular detector quantities and the detector reads they are built from.
+_RECT_DET_DERIVED_ = {
+    "incoherent_radiance_position": ["incoherent_irradiance"],
+    "incoherent_radiance_angle": ["incoherent_radiant_intensity"],
+    "detector_fov_angles": [],
+    "coherent_irradiance": [
+        "incoherent_irradiance",
+        "coherent_real",
+        "coherent_imag",
+        "coherent_amp",
+    ],
+    "coherent_phase": ["coherent_real", "coherent_imag"],
+}
+# Polar detector quantities, and the ZOSAPI.Editors.NCE.PolarDetectorDataType to read them with.
+_POL_DET_READS_ = {
+    "power": "Power",
+    "radiant_intensity": "PowerSolidAngle",
+    "photopic_flux": "Lumens",
+    "photopic_intensity": "LumensSolidAngle",
+    "tristimulus_x": "TriX",
+    "tristimulus_y": "TriY",
+    "tristimulus_z": "TriZ",
+    "Cx": "Cx",
+    "Cy": "Cy",
+    "uT": "u_T",
+    "uV": "u_V",
+}
+
+
+def _NCE_GetDetectorIndex_(self, refresh: bool = False) -> dict:
+    """
+    A NCE worker function which returns the (cached) index of all detectors in the NCE.
+
+    The index is a dict keyed by NCE object index. Each entry holds the detector `type` (name of its ZOSAPI.Editors.NCE.ObjectType),
+    `rows` and `cols` (as given by GetDetectorDimensions), and the `columns` data of the object (see :func:`NCE_GetAllColumnDataOfObject`).
+
+    It is built once and re-used until invalidated by skZemax's NCE and MCE mutators, including a change of the active configuration
+    (or when a file is opened/created or the system mode changes).
+    Edits made directly through the ZOS-API are not tracked; pass refresh=True after such edits.
+
+    :param refresh: If True will rebuild the index, defaults to False
+    :type refresh: bool, optional
+    :return: The detector index.
+    :rtype: dict
+    """
+    if refresh or self._nce_detector_index is None:
+        detector_index = {}
+        for x in range(1, self.NCE_GetNumberOfObjects() + 1):
+            isDet, Nrows, Ncols = self.TheSystem.NCE.GetDetectorDimensions(x, 0, 0)
+            if isDet:
+                detector_index[x] = Box(
+                    {
+                        "type": str(self.NCE_GetObject(x).Type),
+                        "rows": int(Nrows),
+                        "cols": int(Ncols),
+                        "columns": self.NCE_GetAllColumnDataOfObject(x),
+                    }
+                )
+        self._nce_detector_index = detector_index
+    return self._nce_detector_index
+
+
+def _NCE_InvalidateDetectorIndex_(self) -> None:
+    """
+    A NCE worker function which drops the cached detector index (see :func:`_NCE_GetDetectorIndex_`) so that it is rebuilt on next use.
+    Called by any skZemax function that can add, remove, or change NCE objects.
+    """
+    self._nce_detector_index = None
+
+
 def _NCE_CheckDetector_GetInfo_(self, in_Object: int) -> tuple[dict, int, int]:
     """
     A NCE worker function which gets basic information about a (nominal rectangular) detector.
+    This is looked up from the cached detector index (see :func:`_NCE_GetDetectorIndex_`).
 
     :param in_Object: An NCE object identified by an index.
     :type in_Object: int
     :return: tuple of detector's dict column data, number of detector rows, and number of detector columns
     :rtype: tuple[dict, int, int]
     """
-    isDet, Nrows, Ncols = self.TheSystem.NCE.GetDetectorDimensions(in_Object, 0, 0)
-    if not isDet:
+    detector = self._NCE_GetDetectorIndex_().get(int(in_Object))
+    if detector is None:
         if self._verbose:
             cp(
                 f"!@ly!@_NCE_CheckDetector_GetInfo_ :: NCE object at index of [!@lm!@{in_Object}!@ly!@] is not a detector."
             )
         return None, None, None
-    detector_info = self.NCE_GetAllColumnDataOfObject(self.NCE_GetObject(in_Object))
-    return detector_info, Nrows, Ncols
+    # Copy, so callers can alter the column data without altering the index.
+    return Box(detector.columns), detector.rows, detector.cols
+
+
+def _NCE_ReadDetectorImage_(
+    self, in_Object: int, shape: tuple[int, int], read_type: str, data_type: Any
+) -> np.ndarray:
+    """
+    A NCE worker function which reads one full detector image, without looking up the detector information again.
+
+    :param in_Object: An NCE (detector) object identified by an index.
+    :type in_Object: int
+    :param shape: The (rows, columns) of the detector as given by :func:`_NCE_CheckDetector_GetInfo_`.
+    :type shape: tuple[int, int]
+    :param read_type: One of 'Incoherent', 'Coherent' or 'Polar'.
+    :type read_type: str
+    :param data_type: The data type to read. An int for 'Incoherent' (see :func:`_NCE_GetDetector_InfoAndImage_Incoherent_`),
+                      a name of a ZOSAPI.Editors.NCE.DetectorDataType for 'Coherent', or a name of a ZOSAPI.Editors.NCE.PolarDetectorDataType for 'Polar'.
+    :type data_type: Any
+    :return: The detector image.
+    :rtype: np.ndarray
+    """
+    if read_type == "Incoherent":
+        detector_image = self.TheSystem.NCE.GetAllDetectorDataSafe(
+            in_Object, int(data_type)
+        )
+    elif read_type == "Coherent":
+        detector_image = self.TheSystem.NCE.GetAllCoherentDataSafe(
+            in_Object,
+            self._CheckIfStringValidInDir_(
+                self.ZOSAPI.Editors.NCE.DetectorDataType, data_type
+            ),
+        )
+    else:
+        detector_image = self.TheSystem.NCE.GetAllPolarDetectorDataSafe(
+            in_Object,
+            self._CheckIfStringValidInDir_(
+                self.ZOSAPI.Editors.NCE.PolarDetectorDataType, data_type
+            ),
+        )
+    # text output & FOR loops for OpticStudio will invert the vertical image.
+    return np.flipud(_dotnet_array_to_numpy_(self, detector_image).reshape(shape))
 
 
 def _NCE_GetDetector_InfoAndImage_Incoherent_(
@@ -66,10 +207,9 @@ def _NCE_GetDetector_InfoAndImage_Incoherent_(
     """
     detector_info, Nrows, Ncols = self._NCE_CheckDetector_GetInfo_(in_Object)
     if detector_info is not None:
-        detector_image = self.TheSystem.NCE.GetAllDetectorDataSafe(in_Object, data_type)
-        # text output & FOR loops for OpticStudio will invert the vertical image
-        # place plt.show() after clean up to release OpticStudio from memory
-        detector_image = np.flipud(np.array(list(detector_image)).reshape(Nrows, Ncols))
+        detector_image = self._NCE_ReadDetectorImage_(
+            in_Object, (Nrows, Ncols), "Incoherent", data_type
+        )
         return detector_info, detector_image
     return None, None
 
@@ -89,51 +229,71 @@ def _NCE_GetDetector_InfoAndImage_Coherent_(
     """
     detector_info, Nrows, Ncols = self._NCE_CheckDetector_GetInfo_(in_Object)
     if detector_info is not None:
-        detector_image = self.TheSystem.NCE.GetAllCoherentDataSafe(
-            in_Object,
-            self._CheckIfStringValidInDir_(
-                self.ZOSAPI.Editors.NCE.DetectorDataType, data_type
-            ),
+        detector_image = self._NCE_ReadDetectorImage_(
+            in_Object, (Nrows, Ncols), "Coherent", data_type
         )
-        # text output & FOR loops for OpticStudio will invert the vertical image.
-        detector_image = np.flipud(np.array(list(detector_image)).reshape(Nrows, Ncols))
         return detector_info, detector_image
     return None, None
 
 
-def _NCE_GetRectDet_Complete_(self, in_RetDet: int) -> xr.Dataset:
+def _NCE_CheckDetectorQuantities_(
+    self, quantities: list[str] | str | None, known_quantities: list[str]
+) -> list[str]:
+    """
+    A NCE worker function which checks the detector quantities requested by a user against the ones known for the detector type.
+
+    :param quantities: The requested quantities. None requests all of them.
+    :type quantities: list[str] | str | None
+    :param known_quantities: The names of the quantities the detector type supports.
+    :type known_quantities: list[str]
+    :return: The requested quantities which are known, in the order of known_quantities.
+    :rtype: list[str]
     """
-    Runs both :func:`_NCE_GetDetector_InfoAndImage_Incoherent_` and :func:`_NCE_GetDetector_InfoAndImage_Coherent_` to build all detector data with units as applicable.
+    if quantities is None:
+        return list(known_quantities)
+    if isinstance(quantities, str):
+        quantities = [quantities]
+    for x in quantities:
+        if x not in known_quantities:
+            cp(
+                f"!@ly!@_NCE_CheckDetectorQuantities_ :: Unknown detector quantity [!@lm!@{x}!@ly!@] ignored. Options are [!@lm!@{', '.join(known_quantities)}!@ly!@]."
+            )
+    return [x for x in known_quantities if x in quantities]
+
+
+def _NCE_GetRectDet_Complete_(
+    self, in_RetDet: int, quantities: list[str] | str | None = None
+) -> xr.Dataset:
+    """
+    Reads the incoherent and coherent data of a detector to build all detector data with units as applicable.
     This assumes (at least by naming convention) that the detector object at index in_RetDet is not a faceted detector or detector volume.
     I.e. this function is intended for things like rectangular detectors.
 
+    Each full detector read is issued only if a requested quantity needs it, and derived quantities are computed only from what was read.
+    Statistics in the attributes are only given for the quantities that were read/derived.
+
     :param in_RetDet: An NCE object identified by an index.
     :type in_RetDet: int
-    :return: An xarray of all detector information
+    :param quantities: The names of the data variables to build. Options are "power", "incoherent_irradiance", "incoherent_radiant_intensity",
+                       "incoherent_radiance_position", "incoherent_radiance_angle", "detector_fov_angles", "coherent_irradiance", "coherent_phase",
+                       "coherent_real", "coherent_imag", "coherent_amp", "coherent_power", defaults to None (all of them)
+    :type quantities: list[str] | str | None, optional
+    :return: An xarray of all (requested) detector information
     :rtype: xr.Dataset
     """
-    # Get all detector data.
-    det_info, Incoherent_detector_incho_power = (
-        self._NCE_GetDetector_InfoAndImage_Incoherent_(in_RetDet, 0)
-    )
-    _, Incoherent_detector_incho_irrad = self._NCE_GetDetector_InfoAndImage_Incoherent_(
-        in_RetDet, 1
-    )
-    _, Incoherent_detector_incho_radinten = (
-        self._NCE_GetDetector_InfoAndImage_Incoherent_(in_RetDet, 2)
-    )
-    _, Coherent_Real_detector_image = self._NCE_GetDetector_InfoAndImage_Coherent_(
-        in_RetDet, "Real"
-    )
-    _, Coherent_Img_detector_image = self._NCE_GetDetector_InfoAndImage_Coherent_(
-        in_RetDet, "Imag"
-    )
-    _, Coherent_Amp_detector_image = self._NCE_GetDetector_InfoAndImage_Coherent_(
-        in_RetDet, "Amp"
-    )
-    _, Coherent_Power_detector_image = self._NCE_GetDetector_InfoAndImage_Coherent_(
-        in_RetDet, "Power"
-    )
+    quantities = self._NCE_CheckDetectorQuantities_(quantities, _RECT_DET_QUANTITIES_)
+    det_info, Nrows, Ncols = self._NCE_CheckDetector_GetInfo_(in_RetDet)
+    if det_info is None:
+        return None
+    # Read only the detector data needed for the requested quantities (once each).
+    to_read = set()
+    for x in quantities:
+        to_read.update(_RECT_DET_DERIVED_.get(x, [x]))
+    images = {
+        x: self._NCE_ReadDetectorImage_(in_RetDet, (Nrows, Ncols), *_RECT_DET_READS_[x])
+        for x in _RECT_DET_READS_
+        if x in to_read
+    }
     # Saving netcdfs doesn't like '#' in the attrs, so replace them with 'Num' in the detector information
     keys = list(det_info.keys())
     for key in keys:
@@ -165,32 +325,6 @@ def _NCE_GetRectDet_Complete_(self, in_RetDet: int) -> xr.Dataset:
     )
     det_unit_data["Phase Units"] = "Degrees"
     det_unit_data["Distance Units"] = unit_dict["LensUnits"]
-    # Build images as Zemax does (according to their documentation). I have compared this with the actual Zemax UI and it seems to be correct.
-    phase = np.flipud(
-        np.arctan2(Coherent_Img_detector_image, Coherent_Real_detector_image)
-        * 180
-        / np.pi
-    )
-    # Coherent Radiance is built in one of two ways depending on normalization (and if more than one pixel).
-    if (
-        self.NCE_GetObject(in_RetDet).TypeData.NormalizeCoherentPower
-        and np.prod(Incoherent_detector_incho_irrad.shape) > 1
-    ):
-        Coherent_irrad = (
-            np.nansum(Incoherent_detector_incho_irrad)
-            / np.nansum(Coherent_Amp_detector_image**2)
-        ) * (Coherent_Real_detector_image**2 + Coherent_Img_detector_image**2)
-    else:
-        Coherent_irrad = Incoherent_detector_incho_irrad * (
-            (Coherent_Real_detector_image**2 + Coherent_Img_detector_image**2)
-            / (Coherent_Amp_detector_image**2)
-        )
-    # Make the incoherent radiance as a function of position (Zemax assumes full hemisphere despite what the detector actually does).
-    Inchoerent_radiance_position = Incoherent_detector_incho_irrad / (2 * np.pi)
-    # Make the incoherent radiance as a function of angle.
-    area_of_detector = (
-        float(det_info["X Half Width"]) * 2 * float(det_info["Y Half Width"]) * 2
-    )
     # Making the assumption that angle maps to distance linearly (which I think Zemax does too).
     x_angles = np.linspace(
         float(det_info["X Angle Min"]),
@@ -204,39 +338,57 @@ def _NCE_GetRectDet_Complete_(self, in_RetDet: int) -> xr.Dataset:
     )
     XANG, YANG = np.meshgrid(x_angles, y_angles)
     angle_grid = np.sqrt(XANG**2 + YANG**2)
-    Incoherent_radiance_angle = Incoherent_detector_incho_radinten / (
-        area_of_detector * np.cos(np.deg2rad(angle_grid))
-    )
+    derived = {}
+    if "coherent_phase" in quantities:
+        # Build images as Zemax does (according to their documentation). I have compared this with the actual Zemax UI and it seems to be correct.
+        derived["coherent_phase"] = np.flipud(
+            np.arctan2(images["coherent_imag"], images["coherent_real"]) * 180 / np.pi
+        )
+    if "coherent_irradiance" in quantities:
+        # Coherent Radiance is built in one of two ways depending on normalization (and if more than one pixel).
+        if (
+            self.NCE_GetObject(in_RetDet).TypeData.NormalizeCoherentPower
+            and np.prod(images["incoherent_irradiance"].shape) > 1
+        ):
+            derived["coherent_irradiance"] = (
+                np.nansum(images["incoherent_irradiance"])
+                / np.nansum(images["coherent_amp"] ** 2)
+            ) * (images["coherent_real"] ** 2 + images["coherent_imag"] ** 2)
+        else:
+            derived["coherent_irradiance"] = images["incoherent_irradiance"] * (
+                (images["coherent_real"] ** 2 + images["coherent_imag"] ** 2)
+                / (images["coherent_amp"] ** 2)
+            )
+    if "incoherent_radiance_position" in quantities:
+        # Make the incoherent radiance as a function of position (Zemax assumes full hemisphere despite what the detector actually does).
+        derived["incoherent_radiance_position"] = images["incoherent_irradiance"] / (
+            2 * np.pi
+        )
+    if "incoherent_radiance_angle" in quantities:
+        # Make the incoherent radiance as a function of angle.
+        area_of_detector = (
+            float(det_info["X Half Width"]) * 2 * float(det_info["Y Half Width"]) * 2
+        )
+        derived["incoherent_radiance_angle"] = images[
+            "incoherent_radiant_intensity"
+        ] / (area_of_detector * np.cos(np.deg2rad(angle_grid)))
+    if "detector_fov_angles" in quantities:
+        derived["detector_fov_angles"] = angle_grid
     # Make Statistics
+    stat_names = {
+        "power": "Power",
+        "incoherent_irradiance": "Incoherent Irradiance",
+        "incoherent_radiant_intensity": "Incoherent Radiative Intensity",
+        "incoherent_radiance_position": "Incoherent Radiance Position",
+        "incoherent_radiance_angle": "Incoherent Radiance Angular",
+        "coherent_irradiance": "Coherent Intensity",
+    }
+    data = images | derived
     stat_dict = {}
-    stat_dict["Total Power"] = f"{np.nansum(Incoherent_detector_incho_power):0.4E}"
-    stat_dict["Peak Power"] = f"{np.nanmax(Incoherent_detector_incho_power):0.4E}"
-    stat_dict["Total Incoherent Irradiance"] = (
-        f"{np.nansum(Incoherent_detector_incho_irrad):0.4E}"
-    )
-    stat_dict["Peak Incoherent Irradiance"] = (
-        f"{np.nanmax(Incoherent_detector_incho_irrad):0.4E}"
-    )
-    stat_dict["Total Incoherent Radiative Intensity"] = (
-        f"{np.nansum(Incoherent_detector_incho_radinten):0.4E}"
-    )
-    stat_dict["Peak Incoherent Radiative Intensity"] = (
-        f"{np.nanmax(Incoherent_detector_incho_radinten):0.4E}"
-    )
-    stat_dict["Total Incoherent Radiance Position"] = (
-        f"{np.nansum(Inchoerent_radiance_position):0.4E}"
-    )
-    stat_dict["Peak Incoherent Radiance Position"] = (
-        f"{np.nanmax(Inchoerent_radiance_position):0.4E}"
-    )
-    stat_dict["Total Incoherent Radiance Angular"] = (
-        f"{np.nansum(Incoherent_radiance_angle):0.4E}"
-    )
-    stat_dict["Peak Incoherent Radiance Angular"] = (
-        f"{np.nanmax(Incoherent_radiance_angle):0.4E}"
-    )
-    stat_dict["Total Coherent Intensity"] = f"{np.nansum(Coherent_irrad):0.4E}"
-    stat_dict["Peak Coherent Intensity"] = f"{np.nanmax(Coherent_irrad):0.4E}"
+    for key, name in stat_names.items():
+        if key in data:
+            stat_dict["Total " + name] = f"{np.nansum(data[key]):0.4E}"
+            stat_dict["Peak " + name] = f"{np.nanmax(data[key]):0.4E}"
     stat_dict["Detector Index"] = str(in_RetDet)
     stat_dict["X Pitch"] = (2 * float(det_info["X Half Width"])) / float(
         det_info["Num X Pixels"]
@@ -245,56 +397,19 @@ def _NCE_GetRectDet_Complete_(self, in_RetDet: int) -> xr.Dataset:
         det_info["Num Y Pixels"]
     )
 
+    angle_quantities = ["incoherent_radiance_angle", "detector_fov_angles"]
     out = xr.Dataset(
         {
-            "power": (
-                ("y_pixel", "x_pixel"),
-                Incoherent_detector_incho_power.astype(float),
-            ),
-            "incoherent_irradiance": (
-                ("y_pixel", "x_pixel"),
-                Incoherent_detector_incho_irrad.astype(float),
-            ),
-            "incoherent_radiant_intensity": (
-                ("y_pixel", "x_pixel"),
-                Incoherent_detector_incho_radinten.astype(float),
-            ),
-            "incoherent_radiance_position": (
-                ("y_pixel", "x_pixel"),
-                Inchoerent_radiance_position.astype(float),
-            ),
-            "incoherent_radiance_angle": (
-                ("y_angle", "x_angle"),
-                Incoherent_radiance_angle.astype(float),
-            ),
-            "detector_fov_angles": (("y_angle", "x_angle"), angle_grid.astype(float)),
-            "coherent_irradiance": (
-                ("y_pixel", "x_pixel"),
-                Coherent_irrad.astype(float),
-            ),
-            "coherent_phase": (("y_pixel", "x_pixel"), phase.astype(float)),
-            "coherent_real": (
-                ("y_pixel", "x_pixel"),
-                Coherent_Real_detector_image.astype(float),
-            ),
-            "coherent_imag": (
-                ("y_pixel", "x_pixel"),
-                Coherent_Img_detector_image.astype(float),
-            ),
-            "coherent_amp": (
-                ("y_pixel", "x_pixel"),
-                Coherent_Amp_detector_image.astype(float),
-            ),
-            "coherent_power": (
-                ("y_pixel", "x_pixel"),
-                Coherent_Power_detector_image.astype(float),
-            ),
+            x: (
+                ("y_angle", "x_angle")
+                if x in angle_quantities
+                else ("y_pixel", "x_pixel"),
+                data[x].astype(float),
+            )
+            for x in quantities
         },
         coords={
-            "y_pixel": (
-                "y_pixel",
-                np.arange(0, Incoherent_detector_incho_power.shape[0], 1).astype(int),
-            ),
+            "y_pixel": ("y_pixel", np.arange(0, Nrows, 1).astype(int)),
             "y_distance": (
                 "y_pixel",
                 np.linspace(
@@ -304,10 +419,7 @@ def _NCE_GetRectDet_Complete_(self, in_RetDet: int) -> xr.Dataset:
                 ),
             ),
             "y_angle": ("y_angle", y_angles.astype(int)),
-            "x_pixel": (
-                "x_pixel",
-                np.arange(0, Incoherent_detector_incho_power.shape[1], 1).astype(int),
-            ),
+            "x_pixel": ("x_pixel", np.arange(0, Ncols, 1).astype(int)),
             "x_distance": (
                 "x_pixel",
                 np.linspace(
@@ -339,50 +451,44 @@ def _NCE_GetDetector_InfoAndImage_Polar_(
     """
     detector_info, Nangles, Nradius = self._NCE_CheckDetector_GetInfo_(in_Object)
     if detector_info is not None:
-        detector_image = self.TheSystem.NCE.GetAllPolarDetectorDataSafe(
-            in_Object,
-            self._CheckIfStringValidInDir_(
-                self.ZOSAPI.Editors.NCE.PolarDetectorDataType, data_type
-            ),
-        )
-        # text output & FOR loops for OpticStudio will invert the vertical image.
-        detector_image = np.flipud(
-            np.array(list(detector_image)).reshape(Nangles, Nradius)
+        detector_image = self._NCE_ReadDetectorImage_(
+            in_Object, (Nangles, Nradius), "Polar", data_type
         )
         return detector_info, detector_image
     return None, None
 
 
-def _NCE_GetPolDet_Complete_(self, in_PolDet: int) -> xr.Dataset:
+def _NCE_GetPolDet_Complete_(
+    self, in_PolDet: int, quantities: list[str] | str | None = None
+) -> xr.Dataset:
     """
-    Runs both _NCE_GetDetector_InfoAndImage_Incoherent_() and _NCE_GetDetector_InfoAndImage_Coherent_() to build all detector data with units as applicable.
+    Reads the polar detector data types to build all detector data with units as applicable.
     This assumes (at least by naming convention) that the detector object at index in_PolDet is not a faceted detector or detector volume.
     I.e. this function is intended for things like polar detectors.
 
+    Each full detector read is issued only if it is requested. Statistics in the attributes are only given for the quantities that were read.
+
     :param in_PolDet: An NCE object identified by an index.
     :type in_PolDet: int
-    :return: An xarray of all detector information
+    :param quantities: The names of the data variables to build. Options are "power", "radiant_intensity", "photopic_flux", "photopic_intensity",
+                       "tristimulus_x", "tristimulus_y", "tristimulus_z", "Cx", "Cy", "uT", "uV", defaults to None (all of them)
+    :type quantities: list[str] | str | None, optional
+    :return: An xarray of all (requested) detector information
     :rtype: xr.Dataset
     """
-    # Get all detector data.
-    det_info, Polar_Power = self._NCE_GetDetector_InfoAndImage_Polar_(
-        in_PolDet, "Power"
-    )
-    _, PolarPowerSr = self._NCE_GetDetector_InfoAndImage_Polar_(
-        in_PolDet, "PowerSolidAngle"
-    )
-    _, PolarLumens = self._NCE_GetDetector_InfoAndImage_Polar_(in_PolDet, "Lumens")
-    _, PolarLumensSr = self._NCE_GetDetector_InfoAndImage_Polar_(
-        in_PolDet, "LumensSolidAngle"
-    )
-    _, PolarTriX = self._NCE_GetDetector_InfoAndImage_Polar_(in_PolDet, "TriX")
-    _, PolarTriY = self._NCE_GetDetector_InfoAndImage_Polar_(in_PolDet, "TriY")
-    _, PolarTriZ = self._NCE_GetDetector_InfoAndImage_Polar_(in_PolDet, "TriZ")
-    _, PolarCx = self._NCE_GetDetector_InfoAndImage_Polar_(in_PolDet, "Cx")
-    _, PolarCy = self._NCE_GetDetector_InfoAndImage_Polar_(in_PolDet, "Cy")
-    _, PolaruT = self._NCE_GetDetector_InfoAndImage_Polar_(in_PolDet, "u_T")
-    _, PolaruV = self._NCE_GetDetector_InfoAndImage_Polar_(in_PolDet, "u_V")
-
+    quantities = self._NCE_CheckDetectorQuantities_(
+        quantities, list(_POL_DET_READS_.keys())
+    )
+    det_info, Nangles, Nradius = self._NCE_CheckDetector_GetInfo_(in_PolDet)
+    if det_info is None:
+        return None
+    # Get the requested detector data.
+    images = {
+        x: self._NCE_ReadDetectorImage_(
+            in_PolDet, (Nangles, Nradius), "Polar", _POL_DET_READS_[x]
+        )
+        for x in quantities
+    }
     # Saving netcdfs doesn't like '#' in the attrs, so replace them with 'Num' in the detector information
     keys = list(det_info.keys())
     for key in keys:
@@ -423,47 +529,22 @@ def _NCE_GetPolDet_Complete_(self, in_PolDet: int) -> xr.Dataset:
 
     # Make Statistics
     stat_dict = {}
-    stat_dict["Total Power"] = f"{np.nansum(Polar_Power):0.4E}"
-    stat_dict["Peak Power"] = f"{np.nanmax(Polar_Power):0.4E}"
-    stat_dict["Total Radiative Intensity"] = f"{np.nansum(PolarPowerSr):0.4E}"
-    stat_dict["Peak Radiative Intensity"] = f"{np.nanmax(PolarPowerSr):0.4E}"
-    stat_dict["Total Photopic Power"] = f"{np.nansum(PolarLumens):0.4E}"
-    stat_dict["Peak Photopic Power"] = f"{np.nanmax(PolarLumens):0.4E}"
-    stat_dict["Total Photopic Intensity"] = f"{np.nansum(PolarLumensSr):0.4E}"
-    stat_dict["Peak Photopic Intensity"] = f"{np.nanmax(PolarLumensSr):0.4E}"
+    stat_names = {
+        "power": "Power",
+        "radiant_intensity": "Radiative Intensity",
+        "photopic_flux": "Photopic Power",
+        "photopic_intensity": "Photopic Intensity",
+    }
+    for key, name in stat_names.items():
+        if key in images:
+            stat_dict["Total " + name] = f"{np.nansum(images[key]):0.4E}"
+            stat_dict["Peak " + name] = f"{np.nanmax(images[key]):0.4E}"
     stat_dict["Detector Index"] = str(in_PolDet)
 
     out = xr.Dataset(
         {
-            "power": (("radial_angle", "azimuthal_angle"), Polar_Power.astype(float).T),
-            "radiant_intensity": (
-                ("radial_angle", "azimuthal_angle"),
-                PolarPowerSr.astype(float).T,
-            ),
-            "photopic_flux": (
-                ("radial_angle", "azimuthal_angle"),
-                PolarLumens.astype(float).T,
-            ),
-            "photopic_intensity": (
-                ("radial_angle", "azimuthal_angle"),
-                PolarLumensSr.astype(float).T,
-            ),
-            "tristimulus_x": (
-                ("radial_angle", "azimuthal_angle"),
-                PolarTriX.astype(float).T,
-            ),
-            "tristimulus_y": (
-                ("radial_angle", "azimuthal_angle"),
-                PolarTriY.astype(float).T,
-            ),
-            "tristimulus_z": (
-                ("radial_angle", "azimuthal_angle"),
-                PolarTriZ.astype(float).T,
-            ),
-            "Cx": (("radial_angle", "azimuthal_angle"), PolarCx.astype(float).T),
-            "Cy": (("radial_angle", "azimuthal_angle"), PolarCy.astype(float).T),
-            "uT": (("radial_angle", "azimuthal_angle"), PolaruT.astype(float).T),
-            "uV": (("radial_angle", "azimuthal_angle"), PolaruV.astype(float).T),
+            x: (("radial_angle", "azimuthal_angle"), images[x].astype(float).T)
+            for x in quantities
         },
         coords={
             "azimuthal_deg": ("azimuthal_angle", azimuthal_degs.astype(float)),
@@ -490,41 +571,49 @@ def _NCE_GetPolDet_Complete_(self, in_PolDet: int) -> xr.Dataset:
     return out
 
 
-def NCE_GetDetectorLocations(self) -> list:
+def NCE_GetDetectorLocations(self, refresh: bool = False) -> list:
     """
     This function looks through each NCE object in the system and checks if it is a detector.
     If it is, it returns the object's index in a list.
 
+    The lookup is cached (see :func:`_NCE_GetDetectorIndex_`). Use refresh=True if the NCE was changed outside of skZemax.
+
+    :param refresh: If True will look through the NCE objects again rather than using the cached result, defaults to False
+    :type refresh: bool, optional
     :return: A list of NCE object indicies indicating the indices of detectors.
     :rtype: list
     """
-    return [
-        x
-        for x in range(self.NCE_GetNumberOfObjects())
-        if self.TheSystem.NCE.GetDetectorDimensions(x, 0, 0)[0]
-    ]
+    return list(self._NCE_GetDetectorIndex_(refresh=refresh).keys())
 
 
 def NCE_GetDetectorComplete(
-    self, in_Object: int | ZOSAPI_Editors_NCE_INCERow
+    self,
+    in_Object: int | ZOSAPI_Editors_NCE_INCERow,
+    quantities: list[str] | str | None = None,
 ) -> xr.Dataset:
     """
     This is the recommended and primariy function to get detector information of a Non-sequential ray trace.
 
+    Every quantity costs a full-detector read through the ZOS-API (seven for rectangular detectors, eleven for polar ones).
+    If only some are needed (e.g. only "power"), name them in `quantities` and only the reads these need are done.
+    Derived quantities (e.g. "coherent_irradiance") are built from only the reads they depend on.
+
     :param in_Object: An NCE (detector) object specifed as either an index or an NCE object itself.
     :type in_Object: Union[int, ZOSAPI_Editors_NCE_INCERow]
+    :param quantities: The names of the data variables to get. See :func:`_NCE_GetRectDet_Complete_` and :func:`_NCE_GetPolDet_Complete_`
+                       for the options of each detector type, defaults to None (all of them)
+    :type quantities: list[str] | str | None, optional
     :return: An xarray of the detector infomraiton.
     :rtype: xr.Dataset
     """
-    in_Object = self._convert_raw_obj_input_(in_Object, return_index=False)
-    if "DetectorRectangle".lower() in str(in_Object.Type).lower():
-        return self._NCE_GetRectDet_Complete_(
-            self._convert_raw_obj_input_(in_Object, return_index=True)
-        )
-    if "DetectorPolar".lower() in str(in_Object.Type).lower():
-        return self._NCE_GetPolDet_Complete_(
-            self._convert_raw_obj_input_(in_Object, return_index=True)
-        )
+    in_Object = self._convert_raw_obj_input_(in_Object, return_index=True)
+    detector = self._NCE_GetDetectorIndex_().get(in_Object)
+    if detector is None:
+        return None
+    if "DetectorRectangle".lower() in detector.type.lower():
+        return self._NCE_GetRectDet_Complete_(in_Object, quantities=quantities)
+    if "DetectorPolar".lower() in detector.type.lower():
+        return self._NCE_GetPolDet_Complete_(in_Object, quantities=quantities)
     return None
 
 
@@ -541,17 +630,20 @@ def _detector_file_name_checker_(
     :return: a formatted file name
     :rtype: str
     """
-    in_Object = self._convert_raw_obj_input_(in_Object, return_index=False)
-    if "DetectorRectangle".lower() in str(in_Object.Type).lower():
+    detector = self._NCE_GetDetectorIndex_().get(
+        self._convert_raw_obj_input_(in_Object, return_index=True)
+    )
+    object_type = "" if detector is None else detector.type.lower()
+    if "DetectorRectangle".lower() in object_type:
         if ".ddr" not in in_file_name[-4::].lower():
             in_file_name += ".DDR"
-    if "DetectorColor".lower() in str(in_Object.Type).lower():
+    if "DetectorColor".lower() in object_type:
         if ".ddc" not in in_file_name[-4::].lower():
             in_file_name += ".DDC"
-    if "DetectorPolar".lower() in str(in_Object.Type).lower():
+    if "DetectorPolar".lower() in object_type:
         if ".ddp" not in in_file_name[-4::].lower():
             in_file_name += ".DDP"
-    if "DetectorPVolume".lower() in str(in_Object.Type).lower():
+    if "DetectorPVolume".lower() in object_type:
         if ".ddv" not in in_file_name[-4::].lower():
             in_file_name += ".DDV"
     return os.path.abspath(in_file_name)
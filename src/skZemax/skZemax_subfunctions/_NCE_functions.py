@@ -3,12 +3,17 @@ from __future__ import annotations
 import os
 
 import numpy as np
+import xarray as xr
 from box import Box
 
 from skZemax.skZemax_subfunctions._c_print import c_print as cp
 from skZemax.skZemax_subfunctions._ZOSAPI_interface_functions import (
     _CheckIfStringValidInDir_,
     _convert_raw_input_worker_,
+    _editor_apply_snapshot_,
+    _editor_diff_snapshot_,
+    _editor_get_snapshot_,
+    _set_editor_cell_value_,
 )
 
 type ZOSAPI_Editors_NCE_INCERow = object  # <- ZOSAPI.Editors.NCE.INCERow # The actual module is referenced by the base PythonStandaloneApplication class.
@@ -67,6 +72,8 @@ def NCE_InsertNewObject(
     :return: The newly inserted NCE object
     :rtype: ZOSAPI_Editors_NCE_INCERow
     """
+    self._NCE_InvalidateDetectorIndex_()
+    self._System_MarkDirty_("NCE")
     return self.TheSystem.NCE.InsertNewObjectAt(
         self._convert_raw_obj_input_(insertObject, return_index=True)
     )
@@ -79,6 +86,8 @@ def NCE_AddNewObject(self) -> ZOSAPI_Editors_NCE_INCERow:
     :return: The newly made NCE object
     :rtype: ZOSAPI_Editors_NCE_INCERow
     """
+    self._NCE_InvalidateDetectorIndex_()
+    self._System_MarkDirty_("NCE")
     return self.TheSystem.NCE.AddObject()
 
 
@@ -89,6 +98,8 @@ def NCE_RemoveObject(self, delObject: int | ZOSAPI_Editors_NCE_INCERow) -> None:
     :param delObject: The location of the NCE object to delete. Specified by either an index or a NCE object.
     :type delObject: Union[int, ZOSAPI_Editors_NCE_INCERow]
     """
+    self._NCE_InvalidateDetectorIndex_()
+    self._System_MarkDirty_("NCE")
     self.TheSystem.NCE.RemoveObjectAt(
         self._convert_raw_obj_input_(delObject, return_index=True)
     )
@@ -189,6 +200,10 @@ def NCE_ChangeObjectType(
         self, self.ZOSAPI.Editors.NCE.ObjectType, str(object_type)
     )
     if objecttype is not None:
+        self._NCE_InvalidateDetectorIndex_()
+        self._System_MarkDirty_(
+            "NCE", self._convert_raw_obj_input_(ObjectNCE, return_index=True)
+        )
         ObjectNCE.ChangeType(ObjectNCE.GetObjectTypeSettings(objecttype))
     elif self._verbose:
         cp("!@ly!@NCE_ChangeObjectType :: Did not change object")
@@ -240,10 +255,13 @@ def _NCE_GetObjectColumns_(self) -> tuple[ZOSAPI_Editors_NCE_ObjectColumn, list[
     Worker function which makes a list of good calls for the column data.
     This is required since higher level calls in the underlying ZOS-API don't seem
     to work as intended.
+    The columns are static for the ZOS-API, so they are only built once and then cached.
 
     :return: A tuple of object column attributes and their corresponding column names
     :rtype: tuple[ZOSAPI_Editors_NCE_ObjectColumn, list[str]]
     """
+    if self._nce_object_columns is not None:
+        return self._nce_object_columns
     # Make list of good calls to make for column data
     object_columns = [
         "Comment",
@@ -272,7 +290,8 @@ def _NCE_GetObjectColumns_(self) -> tuple[ZOSAPI_Editors_NCE_ObjectColumn, list[
     object_column_calls = [
         getattr(self.ZOSAPI.Editors.NCE.ObjectColumn, x) for x in object_columns
     ]
-    return object_column_calls, object_columns
+    self._nce_object_columns = (object_column_calls, object_columns)
+    return self._nce_object_columns
 
 
 def _NCE_GetObjectCellCalls_(
@@ -361,6 +380,90 @@ def NCE_GetAllColumnDataOfObject(
     return out
 
 
+def _NCE_GetSnapshotEditor_(self) -> Box:
+    """
+    Worker function which describes the NCE for the editor snapshot functions (see :func:`_editor_get_snapshot_`).
+
+    :return: The description of the NCE.
+    :rtype: Box
+    """
+    return Box(
+        name="NCE",
+        row_dim="object",
+        index_base=1,
+        number_of_rows=self.NCE_GetNumberOfObjects,
+        columns=self._NCE_GetObjectColumns_,
+        get_row=self.TheSystem.NCE.GetObjectAt,
+        get_cell=lambda row, column_call: row.GetObjectCell(column_call),
+        change_type=self.NCE_ChangeObjectType,
+    )
+
+
+def NCE_GetSnapshot(self) -> xr.Dataset:
+    """
+    Reads the column data of every NCE object in a single sweep and returns it as a table indexed by object and column.
+
+    This is the whole-system equivalent of calling :func:`NCE_GetAllColumnDataOfObject` on each object, but much faster for large models:
+    the column enumerators are only built once (see :func:`_NCE_GetObjectColumns_`) and the unused columns at the end of each object are skipped.
+
+    .. code-block:: python
+
+        snapshot = skZemax.NCE_GetSnapshot()
+        snapshot.value.sel(object=3, column="ZPosition")  # As given by the ZOS-API (string)
+        snapshot.numeric_value.sel(column="XPosition")  # As floats (NaN where not numeric)
+        snapshot.header.sel(object=3)  # Column names of the object type
+
+    The snapshot can be edited and written back to the NCE with :func:`NCE_ApplySnapshot`.
+
+    :return: Dataset with dimensions (object, column) holding the cell values, their numeric values, and the cell headers, and
+             (object) holding the object types. Unused cells have an empty value and a '(unused)' header.
+    :rtype: xr.Dataset
+    """
+    return _editor_get_snapshot_(self, self._NCE_GetSnapshotEditor_())
+
+
+def NCE_DiffSnapshot(self, snapshot: xr.Dataset) -> list:
+    """
+    Compares an (edited) snapshot of :func:`NCE_GetSnapshot` against the live NCE and returns the changes needed to make the NCE match it.
+
+    Cells are edited through the 'value' entries of the snapshot, as strings or numbers (the 'numeric_value' entries are only for reading).
+    Changed object types are given with the column 'object_type'. The cells of such an object are only compared once its type is changed (see :func:`NCE_ApplySnapshot`).
+
+    :param snapshot: The snapshot with the desired state of the NCE.
+    :type snapshot: xr.Dataset
+    :return: list of changes as dict[object, column, header, current_value, new_value]. None if the snapshot does not have the same number of objects as the NCE.
+    :rtype: list
+    """
+    return _editor_diff_snapshot_(self, self._NCE_GetSnapshotEditor_(), snapshot)
+
+
+def NCE_ApplySnapshot(self, snapshot: xr.Dataset) -> int:
+    """
+    Makes the live NCE match an (edited) snapshot of :func:`NCE_GetSnapshot`, writing only the cells which differ (see :func:`NCE_DiffSnapshot`).
+
+    This is the bulk equivalent of calling :func:`NCE_SetAllColumnDataOfObjectFromDict` on each object:
+    the snapshot is edited in python, and the changes are then written in one batch (with the OpticStudio UI updates suspended, if shown).
+
+    .. code-block:: python
+
+        snapshot = skZemax.NCE_GetSnapshot()
+        snapshot.value.loc[dict(object=12, column="ZPosition")] = 25.0
+        snapshot.value.loc[dict(object=13, column="Material")] = "N-BK7"
+        number_of_writes = skZemax.NCE_ApplySnapshot(snapshot)  # 2
+
+    :param snapshot: The snapshot with the desired state of the NCE.
+    :type snapshot: xr.Dataset
+    :return: The number of writes (cells and object types) made to the NCE. None if the snapshot could not be applied.
+    :rtype: int
+    """
+    number_of_writes = _editor_apply_snapshot_(
+        self, self._NCE_GetSnapshotEditor_(), snapshot
+    )
+    if number_of_writes:
+        self._NCE_InvalidateDetectorIndex_()
+    return number_of_writes
+
+
 def NCE_SetAllColumnDataOfObjectFromDict(
     self, ObjectNCE: int | ZOSAPI_Editors_NCE_INCERow, ObjectNCE_dict: dict | Box
 ) -> None:
@@ -376,6 +479,10 @@ def NCE_SetAllColumnDataOfObjectFromDict(
     :param ObjectNCE_dict: dict of column data and values. Expected to be the same format as the output of invoking :func:`NCE_GetAllColumnDataOfObject` on the same object.
     :type ObjectNCE_dict: dict|Box
     """
+    self._NCE_InvalidateDetectorIndex_()
+    self._System_MarkDirty_(
+        "NCE", self._convert_raw_obj_input_(ObjectNCE, return_index=True)
+    )
     objectcolumn_calls, _object_columns = self._NCE_GetObjectCellCalls_(
         self._convert_raw_obj_input_(ObjectNCE, return_index=False)
     )
@@ -385,15 +492,7 @@ def NCE_SetAllColumnDataOfObjectFromDict(
         if "(unused)" in ocall.Header:
             pass
         elif ObjectNCE_dict[ocall.Header] != ocall.Value:
-            if isinstance(ObjectNCE_dict[ocall.Header], int):
-                try:
-                    ocall.IntegerValue = ObjectNCE_dict[ocall.Header]
-                except Exception:
-                    ocall.Value = str(
-                        ObjectNCE_dict[ocall.Header]
-                    )  # If fail, fall back to string input.
-            else:
-                ocall.Value = str(ObjectNCE_dict[ocall.Header])
+            _set_editor_cell_value_(ocall, ObjectNCE_dict[ocall.Header])
 
 
 def NCE_GetObjectRotationAndPositionMatrices(
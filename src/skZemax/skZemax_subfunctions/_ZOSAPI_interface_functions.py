@@ -5,6 +5,9 @@ import ctypes
 from typing import Any
 
 import numpy as np
+import System
+import xarray as xr
+from box import Box
 from System.Runtime.InteropServices import GCHandle, GCHandleType
 
 from skZemax.skZemax_subfunctions._c_print import c_print as cp
@@ -235,6 +238,203 @@ def _SetAttrByStringIfValid_(
         return
 
 
+def _editor_cell_values_equal_(current_value: Any, new_value: Any) -> bool:
+    """
+    Compares the values of an editor (LDE/NCE) cell, as numbers if both are numeric and otherwise as strings.
+
+    :param current_value: The value of the cell (as given by the ZOS-API).
+    :type current_value: Any
+    :param new_value: The value to compare to.
+    :type new_value: Any
+    :return: True if the values are the same.
+    :rtype: bool
+    """
+    try:
+        return float(current_value) == float(new_value)
+    except (TypeError, ValueError):
+        return str(current_value) == str(new_value)
+
+
+def _set_editor_cell_value_(cell: Any, value: Any) -> None:
+    """
+    Writes a value to an editor (LDE/NCE) cell: integers as integers (if the cell accepts them), everything else as a string.
+
+    :param cell: The editor cell (e.g. from a `GetSurfaceCell()` or `GetObjectCell()` call).
+    :type cell: Any
+    :param value: The value to write. None is not written.
+    :type value: Any
+    """
+    if isinstance(value, int):
+        try:
+            cell.IntegerValue = value
+        except (TypeError, System.Exception):
+            cell.Value = str(value)  # If fail, fall back to string input.
+    elif value is not None:
+        cell.Value = str(value)
+
+
+def _editor_get_snapshot_(self, editor: Box) -> xr.Dataset:
+    """
+    Worker of :func:`LDE_GetSnapshot` and :func:`NCE_GetSnapshot` which reads every cell of an editor in a single sweep.
+
+    The editor is described by a Box (see :func:`_LDE_GetSnapshotEditor_`) of its 'name' ('LDE' or 'NCE'), the 'row_dim' of its rows ('surface' or 'object'),
+    the 'index_base' of the row numbers, and the functions 'number_of_rows()', 'columns()' (giving the column enumerators and names),
+    'get_row(row_number)', 'get_cell(row, column_enumerator)', and 'change_type(row_number, type_name)'.
+
+    :param editor: Description of the editor.
+    :type editor: Box
+    :return: Dataset with dimensions (row_dim, column) holding the 'value', 'numeric_value', and 'header' of the cells, and (row_dim) holding the row types.
+    :rtype: xr.Dataset
+    """
+    column_calls, column_names = editor.columns()
+    number_of_rows = int(editor.number_of_rows())
+    values = np.full((number_of_rows, len(column_names)), "", dtype=object)
+    headers = np.full(values.shape, "(unused)", dtype=object)
+    row_types = np.full(number_of_rows, "", dtype=object)
+    for row_idx in range(number_of_rows):
+        row = editor.get_row(row_idx + editor.index_base)
+        row_types[row_idx] = str(row.TypeName)
+        for column_idx, column_call in enumerate(column_calls):
+            cell = editor.get_cell(row, column_call)
+            header = str(cell.Header)
+            if "(unused)" in header and "Par 0" not in header:
+                break  # Everything after this should be empty
+            if "(unused)" not in header:
+                headers[row_idx, column_idx] = header
+                values[row_idx, column_idx] = str(cell.Value)
+    numeric_values = np.full(values.shape, np.nan)
+    for idx, value in np.ndenumerate(values):
+        with contextlib.suppress(ValueError):
+            numeric_values[idx] = float(value)
+    return xr.Dataset(
+        data_vars={
+            "value": ([editor.row_dim, "column"], values),
+            "numeric_value": ([editor.row_dim, "column"], numeric_values),
+            "header": ([editor.row_dim, "column"], headers),
+            f"{editor.row_dim}_type": ([editor.row_dim], row_types),
+        },
+        coords={
+            editor.row_dim: np.arange(
+                editor.index_base, number_of_rows + editor.index_base
+            ),
+            "column": column_names,
+        },
+    )
+
+
+def _editor_diff_snapshot_(self, editor: Box, snapshot: xr.Dataset) -> list:
+    """
+    Worker of :func:`LDE_DiffSnapshot` and :func:`NCE_DiffSnapshot` which compares a snapshot against the live editor (see :func:`_editor_get_snapshot_`).
+
+    :param editor: Description of the editor.
+    :type editor: Box
+    :param snapshot: The snapshot with the desired state of the editor.
+    :type snapshot: xr.Dataset
+    :return: list of changes as dict[row_dim, column, header, current_value, new_value]. None if the snapshot does not have the same number of rows as the editor.
+    :rtype: list
+    """
+    current = _editor_get_snapshot_(self, editor)
+    if current.sizes[editor.row_dim] != snapshot.sizes[editor.row_dim]:
+        cp(
+            f"!@lr!@{editor.name}_DiffSnapshot :: The snapshot has [!@lm!@{snapshot.sizes[editor.row_dim]}!@lr!@] {editor.row_dim}s but the {editor.name} has [!@lm!@{current.sizes[editor.row_dim]}!@lr!@]. Add or remove {editor.row_dim}s first."
+        )
+        return None
+    snapshot = snapshot.sel(column=current.column.values)
+    type_column = f"{editor.row_dim}_type"
+    changes = []
+    for row_idx, row_number in enumerate(current[editor.row_dim].values):
+        current_type = str(current[type_column].values[row_idx])
+        new_type = str(snapshot[type_column].values[row_idx])
+        if current_type != new_type:
+            changes.append(
+                Box(
+                    {
+                        editor.row_dim: int(row_number),
+                        "column": type_column,
+                        "header": f"{editor.row_dim.capitalize()} Type",
+                        "current_value": current_type,
+                        "new_value": new_type,
+                    }
+                )
+            )
+            continue
+        for column_idx, column in enumerate(current.column.values):
+            header = str(current.header.values[row_idx, column_idx])
+            if header == "(unused)":
+                continue
+            current_value = current.value.values[row_idx, column_idx]
+            new_value = snapshot.value.values[row_idx, column_idx]
+            if not _editor_cell_values_equal_(current_value, new_value):
+                changes.append(
+                    Box(
+                        {
+                            editor.row_dim: int(row_number),
+                            "column": str(column),
+                            "header": header,
+                            "current_value": current_value,
+                            "new_value": new_value,
+                        }
+                    )
+                )
+    return changes
+
+
+def _editor_apply_snapshot_(self, editor: Box, snapshot: xr.Dataset) -> int:
+    """
+    Worker of :func:`LDE_ApplySnapshot` and :func:`NCE_ApplySnapshot` which writes the cells of a snapshot which differ from the live editor
+    (see :func:`_editor_diff_snapshot_`), with the OpticStudio UI updates suspended.
+    Row types are changed first, after which the cells are compared again (the columns of a row depend on its type).
+
+    :param editor: Description of the editor.
+    :type editor: Box
+    :param snapshot: The snapshot with the desired state of the editor.
+    :type snapshot: xr.Dataset
+    :return: The number of writes (cells and row types) made to the editor. None if the snapshot could not be applied.
+    :rtype: int
+    """
+    changes = _editor_diff_snapshot_(self, editor, snapshot)
+    if changes is None:
+        return None
+    column_calls, column_names = editor.columns()
+    type_column = f"{editor.row_dim}_type"
+    number_of_writes = 0
+    rows = {}
+    with self._System_SuspendUpdates_():
+        type_changes = [x for x in changes if x.column == type_column]
+        for change in type_changes:
+            # Type names are given with spaces (e.g. 'Coordinate Break'), the enumerators are not.
+            editor.change_type(
+                change[editor.row_dim], change.new_value.replace(" ", "")
+            )
+            number_of_writes += 1
+        if len(type_changes) > 0:
+            # The columns of the changed rows are now those of their new type.
+            changes = _editor_diff_snapshot_(self, editor, snapshot)
+        for change in changes:
+            row_number = change[editor.row_dim]
+            if change.column == type_column:
+                if self._verbose:
+                    cp(
+                        f"!@ly!@{editor.name}_ApplySnapshot :: Could not change {editor.row_dim} [!@lm!@{row_number}!@ly!@] to type [!@lm!@{change.new_value}!@ly!@], its cells are not written."
+                    )
+                continue
+            if row_number not in rows:
+                rows[row_number] = editor.get_row(row_number)
+                self._System_MarkDirty_(editor.name, row_number)
+            _set_editor_cell_value_(
+                editor.get_cell(
+                    rows[row_number], column_calls[column_names.index(change.column)]
+                ),
+                change.new_value,
+            )
+            number_of_writes += 1
+    if self._verbose:
+        cp(
+            f"!@lg!@{editor.name}_ApplySnapshot :: Made [!@lm!@{number_of_writes}!@lg!@] writes to [!@lm!@{len(rows)}!@lg!@] {editor.row_dim}s."
+        )
+    return number_of_writes
+
+
 @staticmethod
 def _ctype_to_numpy_(
     self, data: Any, data_length: int, data_type: Any = np.int64
@@ -269,3 +469,39 @@ def _ctype_to_numpy_(
         if src_hndl.IsAllocated:
             src_hndl.Free()
     return npData
+
+
+def _dotnet_array_to_numpy_(self, data: Any, data_type: Any = np.float64) -> np.ndarray:
+    """
+    Copies a (possibly multidimensional) .NET array into a numpy array in a single block memory transfer.
+
+    Iterating a .NET array from python (e.g. `np.array(tuple(data))`) crosses the python/C# boundary once per element,
+    which dominates read time for large analysis grids and detectors. Instead, the .NET array is pinned in memory and
+    copied in one go. The .NET array is row-major, so the returned array has shape (data.GetLength(0), ..., data.GetLength(Rank-1)).
+
+    If the given data is not a .NET array (e.g. already a python sequence), it falls back to a regular numpy conversion.
+
+    :param data: The .NET array (e.g. the `Values` of a data grid, or the return of a `GetAllDetectorDataSafe()` call).
+    :type data: Any
+    :param data_type: The numpy type matching the element type of the .NET array, defaults to np.float64 (C# double)
+    :type data_type: Any, optional
+    :return: A numpy array owning a copy of the data.
+    :rtype: np.ndarray
+    """
+    if data is None:
+        return np.array([], dtype=data_type)
+    try:
+        shape = tuple(int(data.GetLength(dim)) for dim in range(int(data.Rank)))
+    except AttributeError:
+        return np.asarray(list(data), dtype=data_type)
+    out = np.empty(shape, dtype=data_type)
+    if out.size == 0:
+        return out
+    src_hndl = GCHandle.Alloc(data, GCHandleType.Pinned)
+    try:
+        src_ptr = src_hndl.AddrOfPinnedObject().ToInt64()
+        ctypes.memmove(out.ctypes.data, src_ptr, out.nbytes)
+    finally:
+        if src_hndl.IsAllocated:
+            src_hndl.Free()
+    return out
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import copy
+import functools
+import hashlib
+import inspect
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import xarray as xr
+from box import Box
+
+from skZemax.skZemax_subfunctions._c_print import c_print as cp
+
+# Arguments which change how an analysis is run, but not its result. They are left out of the cache keys.
+_ANALYSIS_CACHE_IGNORED_ARGUMENTS_ = ("number_of_workers",)
+
+
+def AnalysisCache_Enable(
+    self, max_entries: int = 32, directory: str | None = None, full_rescan: bool = False
+) -> None:
+    """
+    Turns on the (opt-in) cache of analysis results. Cached analyses (e.g. :func:`Analyses_FFTMTF`, :func:`Analyses_HuygensPSF`, :func:`Analyses_Footprint`)
+    return a copy of a previous result when called again with the same settings on an unchanged system.
+
+    Results are keyed by the analysis name, its settings (all arguments, with defaults filled in), and the fingerprint of the system (see :func:`System_Fingerprint`).
+    Calls with arguments that can not be keyed (e.g. ZOS-API objects rather than indices) are run without the cache.
+
+    .. code-block:: python
+
+        skZemax.AnalysisCache_Enable(max_entries=64, directory="C:/analysis_cache")
+        mtf = skZemax.Analyses_FFTMTF(wavelength=1)  # Runs the analysis.
+        mtf = skZemax.Analyses_FFTMTF(wavelength=1)  # Returned from the cache.
+        skZemax.AnalysisCache_GetStatistics()
+
+    :param max_entries: Number of results kept in memory. The least recently used result is dropped first, defaults to 32
+    :type max_entries: int, optional
+    :param directory: If given, results (xr.Dataset) are also written to NetCDF files in this directory and read from it when not in memory,
+                      so they persist between sessions, defaults to None
+    :type directory: str | None, optional
+    :param full_rescan: If True the whole system is re-read for every cached call, so edits made outside skZemax (directly through the ZOS-API) also invalidate results.
+                        If False only changes made through skZemax functions are tracked, defaults to False
+    :type full_rescan: bool, optional
+    """
+    if directory is not None:
+        Path(directory).mkdir(parents=True, exist_ok=True)
+    self._analysis_cache_settings = Box(
+        max_entries=max(int(max_entries), 1),
+        directory=None if directory is None else str(directory),
+        full_rescan=bool(full_rescan),
+    )
+    self._analysis_cache_entries = {}
+    self._analysis_cache_stats = {"hits": 0, "disk_hits": 0, "misses": 0, "bypassed": 0}
+    if self._verbose:
+        cp(
+            f"!@lg!@AnalysisCache_Enable :: Caching up to [!@lm!@{max_entries}!@lg!@] analysis results in memory"
+            + (
+                "."
+                if directory is None
+                else f" and on disk in [!@lm!@{directory}!@lg!@]."
+            )
+        )
+
+
+def AnalysisCache_Disable(self) -> None:
+    """
+    Turns off the cache of analysis results (see :func:`AnalysisCache_Enable`) and drops the results held in memory. Files on disk are kept.
+    """
+    self._analysis_cache_settings = None
+    self._analysis_cache_entries = {}
+
+
+def AnalysisCache_Clear(self, include_disk: bool = False) -> int:
+    """
+    Drops all cached analysis results (see :func:`AnalysisCache_Enable`).
+
+    :param include_disk: If True the NetCDF files of the cache directory are deleted as well, defaults to False
+    :type include_disk: bool, optional
+    :return: The number of results dropped.
+    :rtype: int
+    """
+    number_dropped = len(self._analysis_cache_entries)
+    self._analysis_cache_entries = {}
+    if (
+        include_disk
+        and self._analysis_cache_settings is not None
+        and self._analysis_cache_settings.directory is not None
+    ):
+        for cache_file in Path(self._analysis_cache_settings.directory).glob(
+            "AnalysisCache_*.nc"
+        ):
+            cache_file.unlink()
+            number_dropped += 1
+    return number_dropped
+
+
+def AnalysisCache_GetStatistics(self) -> Box:
+    """
+    Returns the hit/miss statistics of the cache of analysis results (see :func:`AnalysisCache_Enable`).
+
+    Returned keys are:
+
+    - hits (returned from memory)
+    - disk_hits (returned from the cache directory)
+    - misses (analysis was run)
+    - bypassed (analysis was run, its arguments could not be keyed)
+    - entries (results in memory)
+    - hit_rate (fraction of keyed calls returned from the cache)
+
+    :return: dict[statistic] = value
+    :rtype: Box
+    """
+    stats = Box(self._analysis_cache_stats)
+    stats.entries = len(self._analysis_cache_entries)
+    number_keyed = stats.hits + stats.disk_hits + stats.misses
+    stats.hit_rate = (
+        (stats.hits + stats.disk_hits) / number_keyed if number_keyed > 0 else 0.0
+    )
+    return stats
+
+
+def _AnalysisCache_NormalizeValue_(value):
+    """
+    Worker to turn an analysis argument into a JSON serializable value for the cache key.
+
+    :raises TypeError: If the value can not be represented (e.g. a ZOS-API object).
+    """
+    if value is None or isinstance(value, bool | str):
+        return value
+    if isinstance(value, int | np.integer):
+        return int(value)
+    if isinstance(value, float | np.floating):
+        return float(value)
+    if isinstance(value, list | tuple | np.ndarray):
+        return [_AnalysisCache_NormalizeValue_(x) for x in value]
+    if isinstance(value, dict):
+        return {str(x): _AnalysisCache_NormalizeValue_(value[x]) for x in value}
+    raise TypeError(f"Can not key a value of type {type(value)}.")
+
+
+def _AnalysisCache_Key_(
+    self,
+    analysis_name: str,
+    signature: inspect.Signature,
+    args: tuple,
+    kwargs: dict,
+) -> str:
+    """
+    Worker to compute the cache key of an analysis call from its name, its (normalized) settings, and the system state fingerprint.
+
+    :return: The key, or None if the arguments can not be keyed.
+    :rtype: str
+    """
+    bound = signature.bind(self, *args, **kwargs)
+    bound.apply_defaults()
+    try:
+        settings = {
+            x: _AnalysisCache_NormalizeValue_(bound.arguments[x])
+            for x in list(bound.arguments)[1:]
+            if x not in _ANALYSIS_CACHE_IGNORED_ARGUMENTS_
+        }
+    except TypeError:
+        return None
+    key = json.dumps(
+        {
+            "analysis": analysis_name,
+            "settings": settings,
+            "system": self.System_Fingerprint(
+                full_rescan=self._analysis_cache_settings.full_rescan
+            ),
+        },
+        sort_keys=True,
+    )
+    return f"AnalysisCache_{analysis_name}_{hashlib.sha1(key.encode()).hexdigest()}"
+
+
+def _AnalysisCache_Copy_(result):
+    """
+    Worker to copy a cached result, so callers editing it do not change the cache.
+    """
+    if isinstance(result, xr.Dataset | xr.DataArray):
+        return result.copy(deep=True)
+    return copy.deepcopy(result)
+
+
+def _AnalysisCache_Lookup_(self, key: str):
+    """
+    Worker to look up a result in the memory, then the disk, tier of the analysis cache.
+
+    :return: A copy of the cached result, or None if it is not cached.
+    """
+    if key in self._analysis_cache_entries:
+        # Re-insert to mark as the most recently used.
+        self._analysis_cache_entries[key] = self._analysis_cache_entries.pop(key)
+        self._analysis_cache_stats["hits"] += 1
+        return _AnalysisCache_Copy_(self._analysis_cache_entries[key])
+    directory = self._analysis_cache_settings.directory
+    if directory is not None and os.path.isfile(os.path.join(directory, key + ".nc")):
+        result = xr.load_dataset(os.path.join(directory, key + ".nc"))
+        self._AnalysisCache_Store_(key, result, write_to_disk=False)
+        self._analysis_cache_stats["disk_hits"] += 1
+        return _AnalysisCache_Copy_(result)
+    return None
+
+
+def _AnalysisCache_Store_(self, key: str, result, write_to_disk: bool = True) -> None:
+    """
+    Worker to store a result in the memory (and disk) tier of the analysis cache, dropping the least recently used results beyond the maximum.
+    """
+    self._analysis_cache_entries[key] = _AnalysisCache_Copy_(result)
+    while len(self._analysis_cache_entries) > self._analysis_cache_settings.max_entries:
+        self._analysis_cache_entries.pop(next(iter(self._analysis_cache_entries)))
+    directory = self._analysis_cache_settings.directory
+    if write_to_disk and directory is not None and isinstance(result, xr.Dataset):
+        cache_file = os.path.join(directory, key + ".nc")
+        try:
+            result.to_netcdf(cache_file)
+        except (OSError, ValueError, TypeError) as e:
+            if os.path.isfile(cache_file):
+                os.remove(cache_file)
+            if self._verbose:
+                cp(
+                    f"!@ly!@_AnalysisCache_Store_ :: Could not write [!@lm!@{key}!@ly!@] to disk, it is only cached in memory: {e}"
+                )
+
+
+def _AnalysisCache_Cached_(function):
+    """
+    Decorator which puts an analysis function behind the analysis result cache (see :func:`AnalysisCache_Enable`).
+    When the cache is off the function is called directly.
+    """
+    signature = inspect.signature(function)
+
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        if self._analysis_cache_settings is None:
+            return function(self, *args, **kwargs)
+        key = self._AnalysisCache_Key_(function.__name__, signature, args, kwargs)
+        if key is None:
+            self._analysis_cache_stats["bypassed"] += 1
+            return function(self, *args, **kwargs)
+        result = self._AnalysisCache_Lookup_(key)
+        if result is not None:
+            if self._verbose:
+                cp(
+                    f"!@lg!@{function.__name__} :: Returning cached result [!@lm!@{key.split('_')[-1][0:8]}!@lg!@]."
+                )
+            return result
+        self._analysis_cache_stats["misses"] += 1
+        result = function(self, *args, **kwargs)
+        if result is not None:
+            self._AnalysisCache_Store_(key, result)
+        return result
+
+    return wrapper
@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+import struct
+from pathlib import Path
+
+import numpy as np
+from box import Box
+
+from skZemax.skZemax_subfunctions._c_print import c_print as cp
+
+# Layout of the analysis configuration (.CFG) files OpticStudio writes with SaveTo(). Worked out from the example files
+# in ZemaxConfigFiles (FFTMTF.CFG, HuygensMtf.CFG):
+#   - The file is made of blocks of 9224 bytes (two blocks in the example files).
+#   - Bytes 0-19 of the first block are a header of five little-endian int32 words: [2000, analysis id, ?, ?, ?].
+#   - Settings start at byte 20 in slots of 4 bytes (the slots :func:`_Analysis_SetZOSObjectSettingsByBinaryAlteration_` alters).
+#     Most settings are int32. Some (e.g. the FFT MTF maximum frequency) are float64 spanning two 8-byte aligned slots.
+#   - The remaining blocks start with two int32 words: [analysis id, 8500].
+_CFG_BLOCK_SIZE_ = 9224
+_CFG_HEADER_WORDS_ = 5
+_CFG_SETTINGS_OFFSET_ = 4 * _CFG_HEADER_WORDS_
+_CFG_BLOCK_HEADER_WORDS_ = 2
+
+
+def _AnalysisCfg_SlotOffset_(slot: int) -> int:
+    """
+    Returns the byte offset of a settings slot.
+
+    :param slot: Settings slot index (0 is the first setting, at byte 20).
+    :type slot: int
+    :return: Byte offset in the file.
+    :rtype: int
+    """
+    return _CFG_SETTINGS_OFFSET_ + 4 * int(slot)
+
+
+def _AnalysisCfg_IsDouble_(raw: bytes, offset: int) -> bool:
+    """
+    Heuristic check if the 8 bytes at an offset hold a float64 setting rather than two int32 settings.
+    The offset must be 8 byte aligned, the value finite and of a plausible magnitude,
+    and the upper word must not be a small integer (small integer pairs decode to denormal floats).
+
+    :param raw: The bytes of the configuration file.
+    :type raw: bytes
+    :param offset: Byte offset to check.
+    :type offset: int
+    :return: True if a float64 is likely stored at the offset.
+    :rtype: bool
+    """
+    if offset % 8 != 0 or offset + 8 > len(raw):
+        return False
+    high_word = struct.unpack_from("<i", raw, offset + 4)[0]
+    if abs(high_word) < 2**20:
+        return False
+    value = struct.unpack_from("<d", raw, offset)[0]
+    return bool(np.isfinite(value)) and 1e-12 <= abs(value) <= 1e12
+
+
+@staticmethod
+def AnalysisCfg_Read(in_cfg: str | Path | bytes) -> Box:
+    """
+    Parses an analysis configuration (.CFG) file into typed fields. This is pure-python and does not need OpticStudio,
+    so configuration files can be inspected, diffed, and generated (see :func:`AnalysisCfg_SetSetting` and :func:`AnalysisCfg_Write`) on any machine.
+
+    The returned Box has the keys:
+
+        - header: Box with the five int32 header words (words), the magic number (magic), and the analysis id (analysis_id).
+        - settings: list of Box(slot, offset, dtype, value), one per settings slot up to the last non-zero slot of the first block. dtype is 'int32' or 'float64'.
+        - blocks: list of Box(offset, words) with the two int32 header words of each following block.
+        - raw: the original bytes (everything not described above, such as padding, is written back unchanged).
+
+    The slot numbering is that of the integer array given to :func:`Analyses_RunAnalysesAndGetResults`.
+
+    :param in_cfg: Path to a configuration file, or its bytes.
+    :type in_cfg: str | Path | bytes
+    :return: The parsed configuration file.
+    :rtype: Box
+    """
+    raw = (
+        bytes(in_cfg)
+        if isinstance(in_cfg, (bytes, bytearray))
+        else Path(in_cfg).read_bytes()
+    )
+    if len(raw) < _CFG_SETTINGS_OFFSET_:
+        cp(
+            f"!@lr!@AnalysisCfg_Read :: Configuration data of [!@lm!@{len(raw)}!@lr!@] bytes is too short to hold a header."
+        )
+        return None
+    header_words = list(struct.unpack_from(f"<{_CFG_HEADER_WORDS_}i", raw, 0))
+    out = Box(
+        {
+            "header": {
+                "words": header_words,
+                "magic": header_words[0],
+                "analysis_id": header_words[1],
+            },
+            "settings": [],
+            "blocks": [],
+            "raw": raw,
+        }
+    )
+    first_block_end = min(len(raw), _CFG_BLOCK_SIZE_)
+    first_block = np.frombuffer(
+        raw[_CFG_SETTINGS_OFFSET_ : first_block_end - (first_block_end % 4)],
+        dtype="<i4",
+    )
+    nonzero_slots = np.nonzero(first_block)[0]
+    number_of_slots = 0 if nonzero_slots.size == 0 else int(nonzero_slots[-1]) + 1
+    slot = 0
+    while slot < number_of_slots:
+        offset = _AnalysisCfg_SlotOffset_(slot)
+        if _AnalysisCfg_IsDouble_(raw, offset):
+            value = struct.unpack_from("<d", raw, offset)[0]
+            out.settings.append(
+                Box(
+                    {"slot": slot, "offset": offset, "dtype": "float64", "value": value}
+                )
+            )
+            slot += 2
+        else:
+            value = int(first_block[slot])
+            out.settings.append(
+                Box({"slot": slot, "offset": offset, "dtype": "int32", "value": value})
+            )
+            slot += 1
+    for offset in range(
+        _CFG_BLOCK_SIZE_, len(raw) - 4 * _CFG_BLOCK_HEADER_WORDS_ + 1, _CFG_BLOCK_SIZE_
+    ):
+        out.blocks.append(
+            Box(
+                {
+                    "offset": offset,
+                    "words": list(
+                        struct.unpack_from(f"<{_CFG_BLOCK_HEADER_WORDS_}i", raw, offset)
+                    ),
+                }
+            )
+        )
+    return out
+
+
+@staticmethod
+def AnalysisCfg_Write(in_cfg: Box, out_file: str | Path | None = None) -> bytes:
+    """
+    Encodes a configuration parsed by :func:`AnalysisCfg_Read` back into bytes, optionally writing them to a file
+    which can then be loaded by OpticStudio (e.g. by giving its path as settings to :func:`Analyses_RunAnalysesAndGetResults`).
+
+    :param in_cfg: The parsed configuration file.
+    :type in_cfg: Box
+    :param out_file: Path to write the configuration file to, defaults to None (not written)
+    :type out_file: str | Path | None, optional
+    :return: The bytes of the configuration file.
+    :rtype: bytes
+    """
+    data = bytearray(in_cfg.raw)
+    end_of_settings = max(
+        [_CFG_SETTINGS_OFFSET_]
+        + [x.offset + (8 if x.dtype == "float64" else 4) for x in in_cfg.settings]
+    )
+    if end_of_settings > len(data):
+        data.extend(bytes(end_of_settings - len(data)))
+    struct.pack_into(f"<{_CFG_HEADER_WORDS_}i", data, 0, *in_cfg.header.words)
+    for setting in in_cfg.settings:
+        if setting.dtype == "float64":
+            struct.pack_into("<d", data, setting.offset, float(setting.value))
+        else:
+            struct.pack_into("<i", data, setting.offset, int(setting.value))
+    for block in in_cfg.blocks:
+        struct.pack_into(
+            f"<{_CFG_BLOCK_HEADER_WORDS_}i", data, block.offset, *block.words
+        )
+    data = bytes(data)
+    if out_file is not None:
+        Path(out_file).write_bytes(data)
+    return data
+
+
+@staticmethod
+def AnalysisCfg_SetSetting(
+    in_cfg: Box, slot: int, value: int | float, dtype: str | None = None
+) -> Box:
+    """
+    Sets the value of a settings slot of a configuration parsed by :func:`AnalysisCfg_Read`.
+    Unlike the binary alteration of :func:`Analyses_RunAnalysesAndGetResults`, the whole 4 (int32) or 8 (float64) bytes of the slot are written.
+
+    :param in_cfg: The parsed configuration file. Modified in place.
+    :type in_cfg: Box
+    :param slot: Settings slot index (0 is the first setting).
+    :type slot: int
+    :param value: Value to set.
+    :type value: int | float
+    :param dtype: 'int32' or 'float64', defaults to None (type of the existing setting, or 'int32' for a new slot)
+    :type dtype: str | None, optional
+    :return: The modified configuration.
+    :rtype: Box
+    """
+    existing = [x for x in in_cfg.settings if x.slot == slot]
+    if dtype is None:
+        dtype = existing[0].dtype if len(existing) > 0 else "int32"
+    if dtype not in ["int32", "float64"]:
+        cp(
+            f"!@lr!@AnalysisCfg_SetSetting :: dtype [!@lm!@{dtype}!@lr!@] not recognized. Must be 'int32' or 'float64'."
+        )
+        return in_cfg
+    occupied = [slot, slot + 1] if dtype == "float64" else [slot]
+    # Clear the half of a replaced float64 setting that the new setting does not cover.
+    freed = [
+        y
+        for x in in_cfg.settings
+        if x.dtype == "float64" and (x.slot in occupied or x.slot + 1 in occupied)
+        for y in [x.slot, x.slot + 1]
+        if y not in occupied
+    ]
+    in_cfg.settings = [
+        x
+        for x in in_cfg.settings
+        if x.slot not in occupied + freed
+        and not (x.dtype == "float64" and x.slot + 1 in occupied)
+    ]
+    in_cfg.settings.append(
+        Box(
+            {
+                "slot": int(slot),
+                "offset": _AnalysisCfg_SlotOffset_(slot),
+                "dtype": dtype,
+                "value": float(value) if dtype == "float64" else int(value),
+            }
+        )
+    )
+    for freed_slot in freed:
+        in_cfg.settings.append(
+            Box(
+                {
+                    "slot": freed_slot,
+                    "offset": _AnalysisCfg_SlotOffset_(freed_slot),
+                    "dtype": "int32",
+                    "value": 0,
+                }
+            )
+        )
+    in_cfg.settings.sort(key=lambda x: x.slot)
+    return in_cfg
+
+
+@staticmethod
+def AnalysisCfg_Diff(
+    cfg_a: Box | str | Path | bytes,
+    cfg_b: Box | str | Path | bytes,
+    print_to_console: bool = False,
+) -> list[Box]:
+    """
+    Lists the differences between two configuration files. Useful to find which slot an option in the Zemax settings
+    menu is stored in: save the configuration, change the option, save again, and diff.
+
+    :param cfg_a: A configuration parsed by :func:`AnalysisCfg_Read`, or anything it accepts.
+    :type cfg_a: Box | str | Path | bytes
+    :param cfg_b: A configuration parsed by :func:`AnalysisCfg_Read`, or anything it accepts.
+    :type cfg_b: Box | str | Path | bytes
+    :param print_to_console: If True will print the differences to console, defaults to False
+    :type print_to_console: bool, optional
+    :return: list of Box(name, offset, dtype, a, b) for each differing header word, setting, or block word.
+    :rtype: list[Box]
+    """
+    cfg_a = cfg_a if isinstance(cfg_a, Box) else AnalysisCfg_Read(cfg_a)
+    cfg_b = cfg_b if isinstance(cfg_b, Box) else AnalysisCfg_Read(cfg_b)
+    raw_a = AnalysisCfg_Write(cfg_a)
+    raw_b = AnalysisCfg_Write(cfg_b)
+
+    def _read_(raw: bytes, offset: int, dtype: str) -> int | float:
+        if offset + (8 if dtype == "float64" else 4) > len(raw):
+            return 0
+        return struct.unpack_from("<d" if dtype == "float64" else "<i", raw, offset)[0]
+
+    out = []
+    for word, (a, b) in enumerate(zip(cfg_a.header.words, cfg_b.header.words)):
+        if a != b:
+            out.append(
+                Box(
+                    {
+                        "name": f"header_word_{word}",
+                        "offset": 4 * word,
+                        "dtype": "int32",
+                        "a": a,
+                        "b": b,
+                    }
+                )
+            )
+    dtypes_a = {x.slot: x.dtype for x in cfg_a.settings}
+    dtypes_b = {x.slot: x.dtype for x in cfg_b.settings}
+    for slot in sorted(set(dtypes_a) | set(dtypes_b)):
+        offset = _AnalysisCfg_SlotOffset_(slot)
+        dtype_a = dtypes_a.get(slot, dtypes_b.get(slot))
+        dtype_b = dtypes_b.get(slot, dtype_a)
+        a = _read_(raw_a, offset, dtype_a)
+        b = _read_(raw_b, offset, dtype_b)
+        if a != b or dtype_a != dtype_b:
+            out.append(
+                Box(
+                    {
+                        "name": f"slot_{slot}",
+                        "offset": offset,
+                        "dtype": dtype_a
+                        if dtype_a == dtype_b
+                        else f"{dtype_a}/{dtype_b}",
+                        "a": a,
+                        "b": b,
+                    }
+                )
+            )
+    for block_a, block_b in zip(cfg_a.blocks, cfg_b.blocks):
+        for word, (a, b) in enumerate(zip(block_a.words, block_b.words)):
+            if a != b:
+                out.append(
+                    Box(
+                        {
+                            "name": f"block_{block_a.offset // _CFG_BLOCK_SIZE_}_word_{word}",
+                            "offset": block_a.offset + 4 * word,
+                            "dtype": "int32",
+                            "a": a,
+                            "b": b,
+                        }
+                    )
+                )
+    if len(raw_a) != len(raw_b) and print_to_console:
+        cp(
+            f"!@ly!@AnalysisCfg_Diff :: Configuration sizes differ [!@lm!@{len(raw_a)}!@ly!@] vs [!@lm!@{len(raw_b)}!@ly!@] bytes."
+        )
+    if print_to_console:
+        cp("\n!@lg!@AnalysisCfg_Diff :: Differences:")
+        [
+            cp(f"   !@lm!@{x.name}!@lg!@ (byte {x.offset}, {x.dtype}): {x.a} -> {x.b}")
+            for x in out
+        ]
+        cp("\n")
+    return out
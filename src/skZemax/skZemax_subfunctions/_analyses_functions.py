@@ -1,28 +1,48 @@
 from __future__ import annotations
 
+import contextlib
+import inspect
 import os
 from pathlib import Path
+from typing import Any
 from scipy.integrate import cumulative_trapezoid
 import numpy as np
 import xarray as xr
 from box import Box
 from PIL import Image
 import shutil
+import uuid
+import warnings
+from System import Array, Double, Single
 
+from skZemax.skZemax_subfunctions._analyses_cache_functions import (
+    _AnalysisCache_Cached_,
+)
+from skZemax.skZemax_subfunctions._analyses_cfg_functions import AnalysisCfg_Write
+from skZemax.skZemax_subfunctions._analyses_report_functions import (
+    AnalysisReport_ParsePrescription,
+    AnalysisReport_ParseSurfacePrescription,
+    _AnalysisReport_IterLines_,
+)
 from skZemax.skZemax_subfunctions._c_print import c_print as cp
 from skZemax.skZemax_subfunctions._LDE_functions import (
     ZOSAPI_Editors_LDE_ILDERow,
     _convert_raw_surface_input_,
 )
+from skZemax.skZemax_subfunctions._wavefront_functions import (
+    _MICROMETERS_PER_LENS_UNIT_,
+)
 from skZemax.skZemax_subfunctions._wavelength_functions import (
     ZOSAPI_SystemData_IWavelength,
 )
+from skZemax.skZemax_subfunctions._system_functions import _System_Preserved_
 from skZemax.skZemax_subfunctions._field_functions import (
     ZOSAPI_SystemData_IField,
 )
 from skZemax.skZemax_subfunctions._ZOSAPI_interface_functions import (
     __LowLevelZemaxStringCheck__,
     _CheckIfStringValidInDir_,
+    _dotnet_array_to_numpy_,
 )
 
 type ZOSAPI_Analysis_Data_IA = object  # <- ZOSAPI.Analysis.IA_ # The actual module is referenced by the base PythonStandaloneApplication class.
@@ -62,30 +82,241 @@ def _Analysis_CalcLsfEsfFrom2DPsf_(
     return lsf_x, lsf_y, esf_x, esf_y
 
 
+def _Analysis_DataGridToDataset_(self, data_grid: Any) -> xr.Dataset:
+    """Worker to bulk-copy one data grid (`IAR_DataGrid`) of an analysis result into a labelled xarray.
+
+    :param data_grid: A data grid as returned by `results.GetDataGrid(idx)`.
+    :type data_grid: Any
+    :return: Dataset of the grid "value" on (y, x), with the grid spacing/minimum metadata as attributes.
+    :rtype: xr.Dataset
+    """
+    nx = int(data_grid.Nx)
+    ny = int(data_grid.Ny)
+    return xr.Dataset(
+        {
+            "value": (
+                ("y", "x"),
+                _dotnet_array_to_numpy_(self, data_grid.Values).reshape(ny, nx),
+                {"label": str(data_grid.ValueLabel)},
+            )
+        },
+        coords={
+            "x": (
+                "x",
+                data_grid.MinX + np.arange(nx) * data_grid.Dx,
+                {"label": str(data_grid.XLabel)},
+            ),
+            "y": (
+                "y",
+                data_grid.MinY + np.arange(ny) * data_grid.Dy,
+                {"label": str(data_grid.YLabel)},
+            ),
+        },
+        attrs={
+            "Description": str(data_grid.Description),
+            "Nx": nx,
+            "Ny": ny,
+            "Dx": float(data_grid.Dx),
+            "Dy": float(data_grid.Dy),
+            "MinX": float(data_grid.MinX),
+            "MinY": float(data_grid.MinY),
+        },
+    )
+
+
+def _Analysis_DataSeriesToDataset_(self, data_series: Any) -> xr.Dataset:
+    """Worker to bulk-copy one data series (`IAR_DataSeries`) of an analysis result into a labelled xarray.
+
+    :param data_series: A data series as returned by `results.GetDataSeries(idx)`.
+    :type data_series: Any
+    :return: Dataset of the series "value" on (x, series), or on (x) when the analysis gives the y data as a 1-D array.
+    :rtype: xr.Dataset
+    """
+    x = _dotnet_array_to_numpy_(self, data_series.XData.Data)
+    y = _dotnet_array_to_numpy_(self, data_series.YData.Data)
+    coords = {"x": ("x", x, {"label": str(data_series.XLabel)})}
+    if y.ndim == 1:
+        return xr.Dataset(
+            {"value": (("x"), y)},
+            coords=coords,
+            attrs={"Description": str(data_series.Description)},
+        )
+    labels = [str(lbl) for lbl in data_series.SeriesLabels]
+    if len(labels) != y.shape[1]:
+        labels = [str(idx) for idx in range(y.shape[1])]
+    coords["series"] = ("series", np.array(labels).astype(str))
+    return xr.Dataset(
+        {"value": (("x", "series"), y)},
+        coords=coords,
+        attrs={"Description": str(data_series.Description)},
+    )
+
+
+def _Analysis_DataGridRgbToDataset_(self, data_grid_rgb: Any) -> xr.Dataset:
+    """Worker to bulk-copy one RGB data grid (`IAR_DataGridRgb`) of an analysis result into a labelled xarray.
+    The colour planes are transferred with a single `FillValues()` call into pre-allocated .NET buffers.
+
+    :param data_grid_rgb: An RGB data grid as returned by `results.GetDataGridRgb(idx)`.
+    :type data_grid_rgb: Any
+    :return: Dataset of the grid "value" on (y, x, rgb), with the grid spacing/minimum metadata as attributes.
+    :rtype: xr.Dataset
+    """
+    nx = int(data_grid_rgb.Nx)
+    ny = int(data_grid_rgb.Ny)
+    planes = [Array.CreateInstance(Single, nx * ny) for _ in range(3)]
+    data_grid_rgb.FillValues(nx * ny, *planes)
+    values = np.stack(
+        [
+            _dotnet_array_to_numpy_(self, plane, data_type=np.float32).reshape(ny, nx)
+            for plane in planes
+        ],
+        axis=-1,
+    )
+    return xr.Dataset(
+        {
+            "value": (
+                ("y", "x", "rgb"),
+                values,
+                {"label": str(data_grid_rgb.ValueLabel)},
+            )
+        },
+        coords={
+            "x": (
+                "x",
+                data_grid_rgb.MinX + np.arange(nx) * data_grid_rgb.Dx,
+                {"label": str(data_grid_rgb.XLabel)},
+            ),
+            "y": (
+                "y",
+                data_grid_rgb.MinY + np.arange(ny) * data_grid_rgb.Dy,
+                {"label": str(data_grid_rgb.YLabel)},
+            ),
+            "rgb": ("rgb", np.array(["r", "g", "b"])),
+        },
+        attrs={
+            "Description": str(data_grid_rgb.Description),
+            "Nx": nx,
+            "Ny": ny,
+            "Dx": float(data_grid_rgb.Dx),
+            "Dy": float(data_grid_rgb.Dy),
+            "MinX": float(data_grid_rgb.MinX),
+            "MinY": float(data_grid_rgb.MinY),
+        },
+    )
+
+
+def _Analysis_DataScatterPointsToDataset_(self, scatter_points: Any) -> xr.Dataset:
+    """Worker to bulk-copy one scatter point set (`IAR_DataScatterPoints`) of an analysis result into a labelled xarray.
+    The points are transferred with a single `FillValues()` call into pre-allocated .NET buffers.
+
+    :param scatter_points: A scatter point set as returned by `results.GetDataScatterPoint(idx)`.
+    :type scatter_points: Any
+    :return: Dataset of the point "x", "y" (and "value" where the analysis provides it) on (point). None if it could not be read.
+    :rtype: xr.Dataset
+    """
+    npoints = int(scatter_points.NumberOfPoints)
+    buffers = [Array.CreateInstance(Double, npoints) for _ in range(3)]
+    # Point sets come with or without a value per point depending on the analysis.
+    for nbuffers in (3, 2):
+        try:
+            scatter_points.FillValues(npoints, *buffers[0:nbuffers])
+            break
+        except TypeError:
+            # No FillValues() overload with this many buffers.
+            pass
+    else:
+        cp(
+            "!@ly!@_Analysis_DataScatterPointsToDataset_ :: Could not read scatter points. Skipping."
+        )
+        return None
+    data = {
+        "x": (
+            ("point"),
+            _dotnet_array_to_numpy_(self, buffers[0]),
+            {"label": str(scatter_points.XLabel)},
+        ),
+        "y": (
+            ("point"),
+            _dotnet_array_to_numpy_(self, buffers[1]),
+            {"label": str(scatter_points.YLabel)},
+        ),
+    }
+    if nbuffers == 3:
+        data["value"] = (("point"), _dotnet_array_to_numpy_(self, buffers[2]))
+    return xr.Dataset(
+        data,
+        coords={"point": ("point", np.arange(npoints))},
+        attrs={"Description": str(scatter_points.Description)},
+    )
+
+
+def Analyses_ReadResults(self, results: ZOSAPI_Analysis_Data_IAR) -> Box:
+    """
+    Reads everything an analysis `GetResults()` call returns into numpy/xarray in one pass. This is the unified reader
+    the `Analyses_*` wrappers use, and is useful for processing the output of :func:`Analyses_RunAnalysesAndGetResults`
+    for analyses without a wrapper.
+
+    Every .NET array is moved with a single block memory copy (see :func:`_dotnet_array_to_numpy_`) rather than
+    element by element, which matters for large grids such as a 1024x1024 Huygens PSF.
+
+    :param results: The return of an analysis GetResults() call.
+    :type results: ZOSAPI_Analysis_Data_IAR
+    :return: A boxed dictionary with lists of xr.Dataset under `data_grids`, `data_series`, `data_grids_rgb` and `scatter_points`,
+             and the text header of the results under `header`.
+    :rtype: Box
+    """
+    out = Box(
+        {
+            "data_grids": [],
+            "data_series": [],
+            "data_grids_rgb": [],
+            "scatter_points": [],
+            "header": [],
+        }
+    )
+    if results is None:
+        return out
+    out.data_grids = [
+        _Analysis_DataGridToDataset_(self, results.GetDataGrid(idx))
+        for idx in range(results.NumberOfDataGrids)
+    ]
+    out.data_series = [
+        _Analysis_DataSeriesToDataset_(self, results.GetDataSeries(idx))
+        for idx in range(results.NumberOfDataSeries)
+    ]
+    out.data_grids_rgb = [
+        _Analysis_DataGridRgbToDataset_(self, results.GetDataGridRgb(idx))
+        for idx in range(results.NumberOfDataGridsRgb)
+    ]
+    out.scatter_points = [
+        x
+        for x in (
+            _Analysis_DataScatterPointsToDataset_(
+                self, results.GetDataScatterPoint(idx)
+            )
+            for idx in range(results.NumberOfDataScatterPoints)
+        )
+        if x is not None
+    ]
+    if results.HeaderData is not None:
+        out.header = [str(x) for x in results.HeaderData.Lines]
+    return out
+
+
 def _Analysis_GeneralDataSeriesReader_(self, results: ZOSAPI_Analysis_Data_IAR):
     """Germanized worker for reading X and Y data from data series returned from an analysis GetResults() call.
+    The Y data of each series keeps the shape given by the analysis: (x) for 1-D data, or (x, series).
 
     :param results: The return of an analysis GetResults() call.
     :type results: ZOSAPI_Analysis_Data_IAR
     """
-    xar = []
-    yar = []
-    for seriesNum in range(results.NumberOfDataSeries):
-        data = results.GetDataSeries(seriesNum)
-        xRaw = data.XData.Data
-        yRaw = data.YData.Data
-        xar.append(np.array(tuple(xRaw)))
-        try:
-            yar.append(
-                np.array(
-                    np.asarray(tuple(yRaw)).reshape(
-                        data.YData.Data.GetLength(0), data.YData.Data.GetLength(1)
-                    )
-                )
-            )
-        except Exception:
-            yar.append(np.array(np.asarray(tuple(yRaw))))
-    return np.array(xar), np.array(yar)
+    series = [
+        _Analysis_DataSeriesToDataset_(self, results.GetDataSeries(idx))
+        for idx in range(results.NumberOfDataSeries)
+    ]
+    return np.array([x.x.values for x in series]), np.array(
+        [x.value.values for x in series]
+    )
 
 
 def _Analysis_GeneralDataGridReader_(self, results: ZOSAPI_Analysis_Data_IAR):
@@ -94,20 +325,15 @@ def _Analysis_GeneralDataGridReader_(self, results: ZOSAPI_Analysis_Data_IAR):
     :param results: The return of an analysis GetResults() call.
     :type results: ZOSAPI_Analysis_Data_IAR
     """
-    gar = []
-    xar = []
-    yar = []
-    for gridNum in range(results.NumberOfDataGrids):
-        data = results.GetDataGrid(gridNum)
-        gRaw = data.Values
-        dx = data.Dx
-        dy = data.Dy
-        xmin = data.MinX
-        ymin = data.MinY
-        xar.append(xmin + np.arange(data.Nx) * dx)
-        yar.append(ymin + np.arange(data.Ny) * dy)
-        gar.append(np.array(tuple(gRaw)).reshape(data.Ny, data.Nx))
-    return np.array(gar), np.array(xar), np.array(yar)
+    grids = [
+        _Analysis_DataGridToDataset_(self, results.GetDataGrid(idx))
+        for idx in range(results.NumberOfDataGrids)
+    ]
+    return (
+        np.array([x.value.values for x in grids]),
+        np.array([x.x.values for x in grids]),
+        np.array([x.y.values for x in grids]),
+    )
 
 
 def _Analysis_GetZOSObjectAndSettings_(
@@ -117,6 +343,12 @@ def _Analysis_GetZOSObjectAndSettings_(
     Worker function which looks up the specified analysis object and settings - which some condition checking.
     A tuple of None values is returned if the analysis is not recognized, or not applicable to the type of sequential mode.
 
+    Analysis objects are pooled per analysis type: an idle analysis of the same type (see :func:`_Analysis_ReleaseZOSObject_`) is reused
+    before a new one is opened in OpticStudio. The analysis should be handed back with :func:`_Analysis_ReleaseZOSObject_` when done.
+    A reused analysis keeps the settings of its last use; callers which do not set all settings should first call :func:`_Analysis_ResetZOSObjectSettings_`.
+    In an :func:`_Analysis_Sweep_`, the analyses of the first pass are kept for the sweep, and handed out again (in the same order) on the later passes.
+    A RuntimeError is raised if a later pass requests a different analysis type, or more analyses, than the first pass (see :func:`_Analysis_SweepReplay_` for fewer).
+
     :param analysis: The name of the analysis to perform. See output of :func:`Analyses_GetNamesOfAllAnalyses` for names.
     :type analysis: str
     :return: OSAPI.Analysis.Data object, the ZOSAPI.Analysis.Settings object, and the ZOS-API name of the specified analysis.
@@ -127,6 +359,36 @@ def _Analysis_GetZOSObjectAndSettings_(
     )
     if analysis_enum is None:
         return None, None, None
+    if self._Analysis_SweepReplaying_():
+        sweep = self._analysis_sweep
+        position = sweep["position"]
+        kept = (
+            self._analysis_live[id(sweep["objects"][position])][0]
+            if position < len(sweep["objects"])
+            else None
+        )
+        if kept != str(analysis_enum):
+            # The kept analysis is configured for another request of the first pass, so its results would be silently wrong.
+            expected = (
+                f"[{kept}]"
+                if kept is not None
+                else f"no more than the [{len(sweep['objects'])}] analyses of the first pass"
+            )
+            raise RuntimeError(
+                f"_Analysis_GetZOSObjectAndSettings_ :: Analysis sweep replay expected {expected} as analysis [{position}] of the pass, "
+                f"but [{analysis_enum!s}] was requested. Every pass of an _Analysis_Sweep_() must request the same analyses in the same order."
+            )
+        sweep["position"] += 1
+        _, analysis_obj, analysis_settings_obj = self._analysis_live[
+            id(sweep["objects"][position])
+        ]
+        return analysis_obj, analysis_settings_obj, str(analysis_enum)
+    idle = self._analysis_pool.get(str(analysis_enum), [])
+    if len(idle) > 0:
+        _, analysis_obj, analysis_settings_obj = self._analysis_live[idle.pop()]
+        if self._analysis_sweep is not None:
+            self._analysis_sweep["objects"].append(analysis_obj)
+        return analysis_obj, analysis_settings_obj, str(analysis_enum)
     analysis_obj = self.TheSystem.Analyses.New_Analysis(analysis_enum)
     if analysis_obj is None:
         if self._verbose:
@@ -136,6 +398,7 @@ def _Analysis_GetZOSObjectAndSettings_(
         return None, None, None
     analysis_settings_obj = analysis_obj.GetSettings()
     if analysis_settings_obj is None:
+        analysis_obj.Close()
         del analysis_obj
         analysis_obj = None
         if self._verbose:
@@ -143,9 +406,306 @@ def _Analysis_GetZOSObjectAndSettings_(
                 f"!@ly!@_Analysis_GetZOSObjectAndSettings_ :: Analysis [!@lm!@{analysis_enum!s}!@ly!@] is not applicable to [!@lm!@{self.System_GetMode()}!@ly!@] mode."
             )
         return None, None, None
+    self._analysis_live[id(analysis_obj)] = (
+        str(analysis_enum),
+        analysis_obj,
+        analysis_settings_obj,
+    )
+    # A new analysis has the default settings. Keep them as the template of the analysis type, and record them as applied.
+    self._Analysis_GetSettingsTemplate_(analysis_settings_obj, str(analysis_enum))
+    self._analysis_applied_settings[id(analysis_settings_obj)] = (
+        analysis_settings_obj,
+        (str(analysis_enum), "defaults"),
+    )
+    if self._analysis_sweep is not None:
+        self._analysis_sweep["objects"].append(analysis_obj)
     return analysis_obj, analysis_settings_obj, str(analysis_enum)
 
 
+def _Analysis_ReleaseZOSObject_(self, analysis_obj: ZOSAPI_Analysis_Data_IA) -> None:
+    """
+    Hands an analysis object from :func:`_Analysis_GetZOSObjectAndSettings_` back to the pool so later calls for the same analysis type can reuse it.
+    The analysis stays open in OpticStudio until :func:`Analyses_CloseAllAnalyses` is called, or the :func:`Analyses_Session` it was opened in ends.
+
+    :param analysis_obj: The analysis object.
+    :type analysis_obj: ZOSAPI_Analysis_Data_IA
+    """
+    if id(analysis_obj) not in self._analysis_live:
+        return
+    if self._analysis_sweep is not None and any(
+        x is analysis_obj for x in self._analysis_sweep["objects"]
+    ):
+        # Kept for the rest of the sweep. See _Analysis_Sweep_().
+        return
+    analysis_enum = self._analysis_live[id(analysis_obj)][0]
+    idle = self._analysis_pool.setdefault(analysis_enum, [])
+    if id(analysis_obj) not in idle:
+        idle.append(id(analysis_obj))
+
+
+def _Analysis_CloseZOSObjects_(self, analysis_ids: list[int]) -> int:
+    """
+    Closes pooled analyses in OpticStudio and removes them from the pool.
+
+    :param analysis_ids: The id() of the analysis objects to close.
+    :type analysis_ids: list[int]
+    :return: The number of analyses closed.
+    :rtype: int
+    """
+    number_closed = 0
+    for analysis_id in analysis_ids:
+        if analysis_id not in self._analysis_live:
+            continue
+        analysis_enum, analysis_obj, analysis_settings_obj = self._analysis_live.pop(
+            analysis_id
+        )
+        if analysis_id in self._analysis_pool.get(analysis_enum, []):
+            self._analysis_pool[analysis_enum].remove(analysis_id)
+        self._Analysis_ForgetAppliedSettings_(analysis_settings_obj)
+        analysis_obj.Close()
+        number_closed += 1
+    return number_closed
+
+
+def Analyses_CloseAllAnalyses(self) -> int:
+    """
+    Closes all analyses skZemax opened in OpticStudio (pooled, idle or not).
+
+    :return: The number of analyses closed.
+    :rtype: int
+    """
+    number_closed = self._Analysis_CloseZOSObjects_(list(self._analysis_live))
+    if self._verbose and number_closed > 0:
+        cp(
+            f"!@lg!@Analyses_CloseAllAnalyses :: Closed [!@lm!@{number_closed}!@lg!@] analyses."
+        )
+    return number_closed
+
+
+def Analyses_GetNumberOfLiveAnalyses(
+    self, count_all_open_in_system: bool = False
+) -> int:
+    """
+    Returns the number of analyses skZemax currently has open in OpticStudio. Useful to check long runs for leaking analyses.
+
+    :param count_all_open_in_system: If True counts every analysis open in the system (including those not opened by skZemax), defaults to False
+    :type count_all_open_in_system: bool, optional
+    :return: The number of open analyses.
+    :rtype: int
+    """
+    if count_all_open_in_system:
+        return int(self.TheSystem.Analyses.NumberOfAnalyses)
+    return len(self._analysis_live)
+
+
+@contextlib.contextmanager
+def Analyses_Session(self):
+    """
+    Context manager in which analysis objects are reused across calls, and all analyses opened inside of it are closed when it exits.
+
+    .. code-block:: python
+
+        with skZemax.Analyses_Session():
+            for config in range(1, skZemax.MCE_GetNumberOfConfigs() + 1):
+                skZemax.MCE_SetActiveConfig(config)
+                results = skZemax.Analyses_RunAnalysesAndGetResults("FftMtf")
+                ...
+        # All FftMtf analyses opened above are now closed.
+
+    :yield: This skZemax instance.
+    """
+    open_before = set(self._analysis_live)
+    try:
+        yield self
+    finally:
+        self._Analysis_CloseZOSObjects_(
+            [x for x in list(self._analysis_live) if x not in open_before]
+        )
+
+
+@contextlib.contextmanager
+def _Analysis_Sweep_(self):
+    """
+    Context manager for running the same analyses repeatedly while only the system changes (see :func:`_Analysis_ThroughFocusSweep_`).
+
+    On the first pass, every analysis handed out by :func:`_Analysis_GetZOSObjectAndSettings_` is kept for the sweep (and configured as usual).
+    After each :func:`_Analysis_SweepReplay_`, the same calls - in the same order - get the same analyses back with their settings in place,
+    so the settings are not applied again (see :func:`_Analysis_SweepReplaying_`) and only `ApplyAndWaitForCompletion()` and `GetResults()` are run.
+    The analyses are handed back to the pool when the context exits.
+
+    :yield: This skZemax instance.
+    """
+    previous_sweep = self._analysis_sweep
+    self._analysis_sweep = {"objects": [], "position": None}
+    try:
+        yield self
+    finally:
+        sweep_objects = self._analysis_sweep["objects"]
+        self._analysis_sweep = previous_sweep
+        for analysis_obj in sweep_objects:
+            self._Analysis_ReleaseZOSObject_(analysis_obj)
+
+
+def _Analysis_SweepReplay_(self) -> None:
+    """
+    Starts the next pass of an :func:`_Analysis_Sweep_`, which reuses the analyses of the first pass.
+    A RuntimeError is raised if the previous replayed pass requested fewer analyses than the first pass.
+    """
+    sweep = self._analysis_sweep
+    if sweep["position"] is not None and sweep["position"] != len(sweep["objects"]):
+        raise RuntimeError(
+            f"_Analysis_SweepReplay_ :: Analysis sweep pass requested [{sweep['position']}] analyses, but the first pass requested "
+            f"[{len(sweep['objects'])}]. Every pass of an _Analysis_Sweep_() must request the same analyses in the same order."
+        )
+    sweep["position"] = 0
+
+
+def _Analysis_SweepReplaying_(self) -> bool:
+    """
+    Checks if the analyses are handed out by a later pass of an :func:`_Analysis_Sweep_`, in which case they are already configured.
+
+    :return: True when the analysis settings should not be applied again.
+    :rtype: bool
+    """
+    return (
+        self._analysis_sweep is not None
+        and self._analysis_sweep["position"] is not None
+    )
+
+
+def _Analysis_UniqueConfigFilePath_(self, analysis_enum: str) -> str:
+    """
+    Returns a uniquely named configuration file path in :func:`Utilities_ConfigFilesDir`.
+    Unique names avoid collisions when several skZemax instances share the configuration directory.
+
+    :param analysis_enum: the ZOS-API name of the specified analysis
+    :type analysis_enum: str
+    :return: Path to a (not yet existing) configuration file.
+    :rtype: str
+    """
+    return (
+        self.Utilities_ConfigFilesDir()
+        + os.sep
+        + str(analysis_enum)
+        + "_"
+        + uuid.uuid4().hex
+        + ".CFG"
+    )
+
+
+def _Analysis_GetSettingsTemplate_(
+    self, analysis_settings_obj: ZOSAPI_Analysis_Data_IAS, analysis_enum: str
+) -> bytes:
+    """
+    Returns the default configuration file bytes of an analysis type.
+    The first call for an analysis type saves the settings of the (freshly made) analysis object to disk once and keeps the bytes in memory.
+    This is done by :func:`_Analysis_GetZOSObjectAndSettings_` when it opens a new analysis, so reused analyses never give the template.
+
+    :param analysis_settings_obj: Analysis settings object
+    :type analysis_settings_obj: ZOSAPI_Analysis_Data_IAS
+    :param analysis_enum: the ZOS-API name of the specified analysis
+    :type analysis_enum: str
+    :return: The bytes of the default configuration file.
+    :rtype: bytes
+    """
+    if analysis_enum not in self._analysis_cfg_templates:
+        cfgFile = self._Analysis_UniqueConfigFilePath_(analysis_enum)
+        analysis_settings_obj.SaveTo(cfgFile)
+        self._analysis_cfg_templates[analysis_enum] = Path(cfgFile).read_bytes()
+        os.remove(cfgFile)
+    return self._analysis_cfg_templates[analysis_enum]
+
+
+def _Analysis_LoadSettingsBytes_(
+    self,
+    settings_bytes: bytes,
+    analysis_settings_obj: ZOSAPI_Analysis_Data_IAS,
+    analysis_enum: str,
+) -> None:
+    """
+    Writes configuration file bytes to a uniquely named file, loads it into the analysis settings object, and removes the file.
+
+    :param settings_bytes: The bytes of the configuration file.
+    :type settings_bytes: bytes
+    :param analysis_settings_obj: Analysis settings object
+    :type analysis_settings_obj: ZOSAPI_Analysis_Data_IAS
+    :param analysis_enum: the ZOS-API name of the specified analysis
+    :type analysis_enum: str
+    """
+    cfgFile = self._Analysis_UniqueConfigFilePath_(analysis_enum)
+    Path(cfgFile).write_bytes(settings_bytes)
+    analysis_settings_obj.LoadFrom(cfgFile)
+    os.remove(cfgFile)
+
+
+def _Analysis_SettingsAlreadyApplied_(
+    self, analysis_settings_obj: ZOSAPI_Analysis_Data_IAS, settings_key: tuple
+) -> bool:
+    """
+    Checks if the given settings are the last ones applied to this analysis settings object.
+
+    :param analysis_settings_obj: Analysis settings object
+    :type analysis_settings_obj: ZOSAPI_Analysis_Data_IAS
+    :param settings_key: Hashable description of the settings.
+    :type settings_key: tuple
+    :return: True if the settings were the last applied to this object.
+    :rtype: bool
+    """
+    applied = self._analysis_applied_settings.get(id(analysis_settings_obj))
+    return (
+        applied is not None
+        and applied[0] is analysis_settings_obj
+        and applied[1] == settings_key
+    )
+
+
+def _Analysis_ForgetAppliedSettings_(
+    self, analysis_settings_obj: ZOSAPI_Analysis_Data_IAS
+) -> None:
+    """
+    Removes the record of the last settings applied to an analysis settings object. Call this when the analysis is closed.
+
+    :param analysis_settings_obj: Analysis settings object
+    :type analysis_settings_obj: ZOSAPI_Analysis_Data_IAS
+    """
+    self._analysis_applied_settings.pop(id(analysis_settings_obj), None)
+
+
+def _Analysis_ResetZOSObjectSettings_(
+    self, analysis_settings_obj: ZOSAPI_Analysis_Data_IAS, analysis_enum: str
+) -> None:
+    """
+    Loads the default settings of the analysis type (see :func:`_Analysis_GetSettingsTemplate_`) into an analysis settings object,
+    so a reused (pooled) analysis does not keep the settings of its last use. Nothing is done if the object already has the default settings.
+
+    :param analysis_settings_obj: Analysis settings object
+    :type analysis_settings_obj: ZOSAPI_Analysis_Data_IAS
+    :param analysis_enum: the ZOS-API name of the specified analysis
+    :type analysis_enum: str
+    """
+    settings_key = (str(analysis_enum), "defaults")
+    if self._Analysis_SettingsAlreadyApplied_(analysis_settings_obj, settings_key):
+        return
+    self._Analysis_LoadSettingsBytes_(
+        self._Analysis_GetSettingsTemplate_(analysis_settings_obj, analysis_enum),
+        analysis_settings_obj,
+        analysis_enum,
+    )
+    self._analysis_applied_settings[id(analysis_settings_obj)] = (
+        analysis_settings_obj,
+        settings_key,
+    )
+
+
+def _Analysis_ClearSettingsCache_(self) -> None:
+    """
+    Clears all cached analysis configuration bytes. Called when a different Zemax file is opened, as default settings may differ between systems.
+    """
+    self._analysis_cfg_templates = {}
+    self._analysis_cfg_edited = {}
+    self._analysis_applied_settings = {}
+
+
 def _Analysis_SetZOSObjectSettingsByDict_(
     self,
     analysis_settings: dict | Box,
@@ -156,6 +716,10 @@ def _Analysis_SetZOSObjectSettingsByDict_(
     A worker function which will set analysis settings through the ModifySettings() scheme documented in Section 10.2.14.92. MODIFYSETTINGS (keywords).
     This is done by making, configuring, and then loading a configuration file. This config file method seems to be the only robust way to configure analysis settings.
 
+    The default configuration of each analysis type and the result of each set of keyword edits are kept in memory,
+    so repeated calls only write the (uniquely named) file OpticStudio loads. Nothing is done if the settings equal
+    the last ones applied to the same settings object.
+
     :param analysis_settings: A python dictatory to adjust settings of the analysis. Formatted as dict[MODIFYSETTINGS KEYWORD] = str(value), defaults to None
     :type analysis_settings: dict|Box
     :param analysis_settings_obj: Analysis settings object
@@ -164,14 +728,40 @@ def _Analysis_SetZOSObjectSettingsByDict_(
     :type analysis_enum: str
     """
     if analysis_settings is not None:
-        # Set all settings through the configuration file "ModifySettings()" function.
-        cfgFile = self.Utilities_ConfigFilesDir() + os.sep + analysis_enum + ".CFG"
-        analysis_settings_obj.SaveTo(cfgFile)
-        [
-            analysis_settings_obj.ModifySettings(cfgFile, x, str(analysis_settings[x]))
-            for x in analysis_settings
-        ]
-        analysis_settings_obj.LoadFrom(cfgFile)
+        settings_key = (
+            str(analysis_enum),
+            "keywords",
+            tuple((str(x), str(analysis_settings[x])) for x in analysis_settings),
+        )
+        if self._Analysis_SettingsAlreadyApplied_(analysis_settings_obj, settings_key):
+            return
+        if settings_key not in self._analysis_cfg_edited:
+            # Set all settings through the configuration file "ModifySettings()" function.
+            cfgFile = self._Analysis_UniqueConfigFilePath_(analysis_enum)
+            Path(cfgFile).write_bytes(
+                self._Analysis_GetSettingsTemplate_(
+                    analysis_settings_obj, analysis_enum
+                )
+            )
+            [
+                analysis_settings_obj.ModifySettings(
+                    cfgFile, x, str(analysis_settings[x])
+                )
+                for x in analysis_settings
+            ]
+            self._analysis_cfg_edited[settings_key] = Path(cfgFile).read_bytes()
+            analysis_settings_obj.LoadFrom(cfgFile)
+            os.remove(cfgFile)
+        else:
+            self._Analysis_LoadSettingsBytes_(
+                self._analysis_cfg_edited[settings_key],
+                analysis_settings_obj,
+                analysis_enum,
+            )
+        self._analysis_applied_settings[id(analysis_settings_obj)] = (
+            analysis_settings_obj,
+            settings_key,
+        )
 
 
 def _Analysis_SetZOSObjectSettingsByBinaryAlteration_(
@@ -182,6 +772,7 @@ def _Analysis_SetZOSObjectSettingsByBinaryAlteration_(
 ) -> None:
     """
     A worker function to set a analysis configuration file through direct modification.
+    The modification is done on an in-memory copy of the default configuration of the analysis type (see :func:`_Analysis_GetSettingsTemplate_`).
 
     Disclaimer: I worked out this hack thanks to seeing it in ZOSpy.
 
@@ -193,20 +784,28 @@ def _Analysis_SetZOSObjectSettingsByBinaryAlteration_(
     :type analysis_enum: str
     """
     if analysis_settings is not None:
-        cfgFile = self.Utilities_ConfigFilesDir() + os.sep + str(analysis_enum) + ".CFG"
-        analysis_settings_obj.SaveTo(cfgFile)
-        cfgFile_path = Path(cfgFile)
-        settings_bytestring = cfgFile_path.read_bytes()
-        settings_bytearray = bytearray(settings_bytestring)
+        settings_key = (
+            str(analysis_enum),
+            "binary",
+            tuple(int(x) for x in np.asarray(analysis_settings).ravel()),
+        )
+        if self._Analysis_SettingsAlreadyApplied_(analysis_settings_obj, settings_key):
+            return
+        settings_bytearray = bytearray(
+            self._Analysis_GetSettingsTemplate_(analysis_settings_obj, analysis_enum)
+        )
         # I believe byte indices 0-19 is effectively header information. Analysis settings begin at index 20 and increments by 4 per option.
         for idx, binidx in enumerate(
             np.arange(20, 20 + analysis_settings.shape[0] * 4, 4)
         ):
             settings_bytearray[binidx] = analysis_settings[idx]
-        cfgFile_path.write_bytes(settings_bytearray)
-        del cfgFile_path
-        cfgFile_path = None
-        analysis_settings_obj.LoadFrom(cfgFile)
+        self._Analysis_LoadSettingsBytes_(
+            bytes(settings_bytearray), analysis_settings_obj, analysis_enum
+        )
+        self._analysis_applied_settings[id(analysis_settings_obj)] = (
+            analysis_settings_obj,
+            settings_key,
+        )
 
 
 def Analyses_GetNamesOfAllAnalyses(self, print_to_console: bool = False) -> list:
@@ -231,7 +830,9 @@ def Analyses_GetNamesOfAllAnalyses(self, print_to_console: bool = False) -> list
 
 
 def Analyses_RunAnalysesAndGetResults(
-    self, analysis: str, analysis_settings: dict | Box | np.ndarray[int] = None
+    self,
+    analysis: str,
+    analysis_settings: dict | Box | np.ndarray[int] | str | Path = None,
 ) -> ZOSAPI_Analysis_Data_IAR:
     """
     This is a generalized function to run a Zemax analysis on the optical system.
@@ -281,10 +882,17 @@ def Analyses_RunAnalysesAndGetResults(
 
         ... and yes, I know this sucks ... one of the reasons for the wrapper functions in skZemax.
 
+    The analysis object is reused by later calls for the same analysis type (see :func:`Analyses_Session`),
+    so the returned results should be read before the same type of analysis is run again.
+    Without settings, the analysis is run with its default settings (also when a reused analysis object had other settings).
+
+    Finally, a complete configuration file can be given - either as a path to a .CFG file or as a configuration parsed by :func:`AnalysisCfg_Read` -
+    which is loaded as is. Such files can be made ahead of time, without OpticStudio, with the functions of :ref:`analysiscfgfunctions`.
+
     :param analysis: The name of the analysis to perform. See output of :func:`Analyses_GetNamesOfAllAnalyses` for names.
     :type analysis: str
     :param analysis_settings: User settings of the analysis. See descriptions above, defaults to None
-    :type analysis_settings: Union[dict, np.ndarray[int]], optional
+    :type analysis_settings: Union[dict, np.ndarray[int], str, Box], optional
     :return: The output of the analysis `GetResults()` function call.
     :rtype: ZOSAPI_Analysis_Data_IAR
     """
@@ -293,19 +901,32 @@ def Analyses_RunAnalysesAndGetResults(
     )
     if analysis_obj is None or analysis_settings_obj is None:
         return None
-    if analysis_settings is not None and isinstance(analysis_settings, dict):
+    if self._Analysis_SweepReplaying_():
+        # Configured on the first pass of the sweep. See _Analysis_Sweep_().
+        pass
+    elif analysis_settings is None:
+        self._Analysis_ResetZOSObjectSettings_(analysis_settings_obj, analysis_enum)
+    elif isinstance(analysis_settings, (str, Path)):
+        self._Analysis_ForgetAppliedSettings_(analysis_settings_obj)
+        analysis_settings_obj.LoadFrom(str(analysis_settings))
+    elif isinstance(analysis_settings, Box) and "raw" in analysis_settings:
+        self._Analysis_ForgetAppliedSettings_(analysis_settings_obj)
+        self._Analysis_LoadSettingsBytes_(
+            AnalysisCfg_Write(analysis_settings), analysis_settings_obj, analysis_enum
+        )
+    elif isinstance(analysis_settings, dict):
         self._Analysis_SetZOSObjectSettingsByDict_(
             analysis_settings=analysis_settings,
             analysis_settings_obj=analysis_settings_obj,
             analysis_enum=analysis_enum,
         )
-    elif analysis_settings is not None and isinstance(analysis_settings, np.ndarray):
+    elif isinstance(analysis_settings, np.ndarray):
         self._Analysis_SetZOSObjectSettingsByBinaryAlteration_(
             analysis_settings=analysis_settings,
             analysis_settings_obj=analysis_settings_obj,
             analysis_enum=analysis_enum,
         )
-    elif analysis_settings is not None:
+    else:
         if self._verbose:
             cp(
                 "!@ly!@Analyses_RunAnalysesAndGetResults :: WARNING :: Settings supplied but format not recognized. Nothing configured."
@@ -318,19 +939,22 @@ def Analyses_RunAnalysesAndGetResults(
     if self._verbose:
         cp("!@lg!@Analyses_RunAnalysesAndGetResults :: Done.")
     results = analysis_obj.GetResults()
+    self._Analysis_ReleaseZOSObject_(analysis_obj)
     return results
 
 
 def Analyses_ReportSystemPrescription(
-    self, save_textfile_path: str | None = None
-) -> list:
+    self, save_textfile_path: str | None = None, parse: bool = False
+) -> list | Box:
     """
      Constructs the prescription report of the optical system. This is returned as text information which can be saved in a .txt file.
 
     :param save_textfile_path:save_textfile_path: Full absolute .txt file path to save prescription data text file, defaults to None (no custom saving)
     :type save_textfile_path: str, optional
-    :return: A list where each element is a line of the prescription report.
-    :rtype: list
+    :param parse: If True the report is returned parsed into structured data (see :func:`AnalysisReport_ParsePrescription`), defaults to False
+    :type parse: bool, optional
+    :return: A list where each element is a line of the prescription report, or the parsed report.
+    :rtype: list | Box
     """
     if save_textfile_path is None:
         save_path = (
@@ -342,21 +966,22 @@ def Analyses_ReportSystemPrescription(
         save_path = save_textfile_path
     result = self.Analyses_RunAnalysesAndGetResults(analysis="PrescriptionDataSettings")
     result.GetTextFile(save_path)
-    with open(save_path, errors="replace") as file:
-        content = file.read()
+    if parse:
+        content = AnalysisReport_ParsePrescription(save_path)
+    else:
+        content = list(_AnalysisReport_IterLines_(save_path))
     if save_textfile_path is None:
         # Delete the default .txt file if no custom save path was given
         os.remove(save_path)
-    return [
-        x for x in content.replace("\x00", "").strip("ÿþ").split("\n") if len(x) > 0
-    ]
+    return content
 
 
 def Analyses_ReportSurfacePrescription(
     self,
     in_Surface: int | ZOSAPI_Editors_LDE_ILDERow,
     save_textfile_path: str | None = None,
-) -> list:
+    parse: bool = False,
+) -> list | Box:
     """
     Constructs the prescription report of a sequential (LDE) surface in optical system. This is returned as text information which can be saved in a .txt file.
 
@@ -364,8 +989,10 @@ def Analyses_ReportSurfacePrescription(
     :type in_Surface: Union[int, ZOSAPI_Editors_LDE_ILDERow]
     :param save_textfile_path: Full absolute .txt file path to save prescription data text file, defaults to None (no custom saving)
     :type save_textfile_path: str, optional
-    :return: A list where each element is a line of the prescription report.
-    :rtype: list
+    :param parse: If True the report is returned parsed into structured data (see :func:`AnalysisReport_ParseSurfacePrescription`), defaults to False
+    :type parse: bool, optional
+    :return: A list where each element is a line of the prescription report, or the parsed report.
+    :rtype: list | Box
     """
     if save_textfile_path is None:
         save_path = (
@@ -382,14 +1009,14 @@ def Analyses_ReportSurfacePrescription(
         ),
     )
     result.GetTextFile(save_path)
-    with open(save_path, errors="replace") as file:
-        content = file.read()
+    if parse:
+        content = AnalysisReport_ParseSurfacePrescription(save_path)
+    else:
+        content = list(_AnalysisReport_IterLines_(save_path))
     if save_textfile_path is None:
         # Delete the default .txt file if no custom save path was given
         os.remove(save_path)
-    return [
-        x for x in content.replace("\x00", "").strip("ÿþ").split("\n") if len(x) > 0
-    ]
+    return content
 
 
 def Analyses_GetGeneralLensData(self) -> Box(dict()):
@@ -397,54 +1024,9 @@ def Analyses_GetGeneralLensData(self) -> Box(dict()):
     in a way that is nice to use in python (a boxed dict).
 
     There are functions like self.TheSystem.LDE.GetPupil() to get (most) of these values separately, but this is a succinct way to get most things one is interested in.
+    See :func:`System_GetFirstOrderData` for a faster (cached) read of the first-order quantities.
     """
-    self.Analyses_ReportSystemPrescription(
-        save_textfile_path=self.Utilities_AnalysesFilesDir()
-        + os.sep
-        + "PrescriptionDataSettings.txt"
-    )
-    general_data = self.Analyses_ExtractSectionOfTextFile(
-        in_file=self.Utilities_AnalysesFilesDir()
-        + os.sep
-        + "PrescriptionDataSettings.txt",
-        start_marker="GENERAL LENS DATA:",
-        end_marker="Fields",
-    )
-    os.remove(
-        self.Utilities_AnalysesFilesDir() + os.sep + "PrescriptionDataSettings.txt"
-    )
-
-    def _format_datatype_(in_key: str, in_value: str):
-        in_key = in_key.strip().title().replace(" ", "")
-        in_value = in_value.replace("\t", "").strip()
-        if in_key == "EffectiveFocalLength":
-            # Handle the special case of EFL having two entries with description in the values
-            in_key += in_value.split("(")[-1].strip(")").title().replace(" ", "")
-            in_value = in_value.split("(")[0]
-        try:
-            return in_key, int(in_value)
-        except ValueError:
-            try:
-                return in_key, float(in_value)
-            except ValueError:
-                if in_value.lower() == "on":
-                    return in_key, True
-                elif in_value.lower() == "off":
-                    return in_key, False
-                else:
-                    return in_key, in_value
-
-    out = Box(
-        dict(
-            sorted(  # Sort keys alphabetically
-                (
-                    _format_datatype_(key, value)
-                    for key, value in (line.split(":", 1) for line in general_data[:-1])
-                )
-            )
-        )
-    )
-    return out
+    return self.Analyses_ReportSystemPrescription(parse=True).general_lens_data
 
 
 @staticmethod
@@ -468,11 +1050,7 @@ def Analyses_ExtractSectionOfTextFile(
     :rtype: list
     """
     if isinstance(in_file, str):
-        with open(in_file, errors="replace") as file:
-            content = file.read()
-        in_file = [
-            x for x in content.replace("\x00", "").strip("ÿþ").split("\n") if len(x) > 0
-        ]
+        in_file = _AnalysisReport_IterLines_(in_file)
     section = []
     inside = start_marker is None
     for line in in_file:
@@ -486,6 +1064,8 @@ def Analyses_ExtractSectionOfTextFile(
     return section
 
 
+@_AnalysisCache_Cached_
+@_System_Preserved_(config=True)
 def Analyses_Footprint(
     self, in_Surface: int | ZOSAPI_Editors_LDE_ILDERow, delete_vignetted: bool = False
 ) -> xr.Dataset:
@@ -507,6 +1087,7 @@ def Analyses_Footprint(
 
     Note that this information does not capture any footprint descriptions beyond plotting an ellipse.
     Any more realistic ray-tracing is lost through the ZOS-API and needs to be examined directly in Zemax - or run your own ray trace using functions like :func:`LDE_RunRayTrace`.
+    See :func:`Analyses_FootprintFromRayTrace` for a much faster equivalent that also keeps the ray hits.
 
     This function loops through all fields/wavelengths/configurations individually and records the above information in an xarray for user analysis.
     See :func:`AnalysisPlotting_Footprint`.
@@ -518,7 +1099,6 @@ def Analyses_Footprint(
     """
     CURRENT_VERBOSE = bool(self._verbose)
     self._verbose = False
-    CURRENT_CONFIG = int(self.MCE_GetCurrentConfig())
     save_path = self.Utilities_AnalysesFilesDir() + os.sep + "Footprint.txt"
     blank_array = (
         np.ones(
@@ -629,10 +1209,146 @@ def Analyses_Footprint(
         cp("!@lg!@Analyses_Footprint :: Done.")
     # Reset to settings before loop
     self._verbose = CURRENT_VERBOSE
-    self.MCE_SetActiveConfig(int(CURRENT_CONFIG))
     return out
 
 
+@_AnalysisCache_Cached_
+@_System_Preserved_(config=True)
+def Analyses_FootprintFromRayTrace(
+    self,
+    in_Surface: int | ZOSAPI_Editors_LDE_ILDERow,
+    pupil_sampling: int = 32,
+    delete_vignetted: bool = False,
+    keep_rays: bool = True,
+) -> xr.Dataset:
+    """
+    Produces footprint data from batch ray traces (see :func:`LDE_RunRayTrace`) rather than the footprint analysis.
+
+    A square grid of rays over the (circular) entrance pupil is traced to the surface for every field and wavelength, in one batch ray trace per configuration.
+    The same statistics as :func:`Analyses_Footprint` (x_min, x_max, y_min, y_max, rad_max, x_cntr, y_cntr, x_half, y_half, wavelength_um) are then computed
+    from the ray hits, so the output can be used in its place (e.g. with :func:`AnalysisPlotting_Footprint`).
+    Unlike the footprint analysis, the ray hits themselves can be kept to plot the real footprint shapes (see :func:`AnalysisPlotting_FootprintRays`).
+
+    The statistics are taken over the traced pupil grid, so they approach the footprint analysis values as `pupil_sampling` increases.
+
+    :param in_Surface: The surface to study. Can be an index or LDE surface object.
+    :type in_Surface: Union[int, ZOSAPI_Editors_LDE_ILDERow]
+    :param pupil_sampling: Number of rays across the pupil diameter, defaults to 32
+    :type pupil_sampling: int, optional
+    :param delete_vignetted: If True wil delete vignetted rays, defaults to False
+    :type delete_vignetted: bool, optional
+    :param keep_rays: If True the ray hits are kept as 'ray_x' and 'ray_y' on (conf, wvln, fld, pupil_ray), defaults to True
+    :type keep_rays: bool, optional
+    :return: Footprint data on (conf, wvln, fld).
+    :rtype: xr.Dataset
+    """
+    surface = _convert_raw_surface_input_(
+        self, in_surface=in_Surface, return_index=True
+    )
+    system_wavelengths_um = self.Wavelength_GetAllSystemWavelengthsAsMicrometers()
+    fields = np.arange(1, self.Fields_GetNumberOfFields() + 1)
+    pupil_coords = np.linspace(-1, 1, int(pupil_sampling))
+    PX, PY = np.meshgrid(pupil_coords, pupil_coords)
+    inside = np.sqrt(PX**2 + PY**2) <= 1
+    number_of_configs = self.MCE_GetNumberOfConfigs()
+    shape = (
+        number_of_configs,
+        system_wavelengths_um.shape[0],
+        fields.shape[0],
+        int(inside.sum()),
+    )
+    ray_x = np.full(shape, np.nan)
+    ray_y = np.full(shape, np.nan)
+    if self._verbose:
+        cp(
+            f"!@lg!@Analyses_FootprintFromRayTrace :: Tracing [!@lm!@{np.prod(shape)}!@lg!@] rays to surface [!@lm!@{surface}!@lg!@] over [!@lm!@{number_of_configs}!@lg!@] configurations ..."
+        )
+    for confidx in range(1, number_of_configs + 1):
+        self.MCE_SetActiveConfig(int(confidx))
+        H = self._Wavefront_NormalizedFieldCoordinates_(fields)
+        rays = self.LDE_BuildRayTraceNormalizedUnpolarizedRays(
+            Hx=np.repeat(H[:, 0], inside.sum()),
+            Hy=np.repeat(H[:, 1], inside.sum()),
+            Px=np.tile(PX[inside], fields.shape[0]),
+            Py=np.tile(PY[inside], fields.shape[0]),
+            ending_surface=surface,
+            do_all_surfaces_to_ending=False,
+            wavelengths=system_wavelengths_um.astype(float),
+            should_take_rays_one_to_one=True,
+        )
+        traced = self._LDE_RaysByField_(
+            self.LDE_RunRayTrace(rays).isel(surf=-1), fields
+        ).transpose("wvln", "field", "pupil_ray")
+        valid = ~traced.error.values.astype(bool)
+        if delete_vignetted:
+            valid = np.logical_and(valid, traced.vignette.values == 0)
+        # The ray trace orders the wavelengths with the primary first. Put them back in system order.
+        order = [
+            int(np.argmin(np.abs(traced.wavelengths.values - x)))
+            for x in system_wavelengths_um
+        ]
+        ray_x[confidx - 1] = np.where(valid, traced.X.values, np.nan)[order]
+        ray_y[confidx - 1] = np.where(valid, traced.Y.values, np.nan)[order]
+    with np.errstate(invalid="ignore"), warnings.catch_warnings():
+        # All-nan slices (fully vignetted fields) are left as nan.
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        x_min = np.nanmin(ray_x, axis=-1)
+        x_max = np.nanmax(ray_x, axis=-1)
+        y_min = np.nanmin(ray_y, axis=-1)
+        y_max = np.nanmax(ray_y, axis=-1)
+        rad_max = np.nanmax(np.hypot(ray_x, ray_y), axis=-1)
+    dims = ("conf", "wvln", "fld")
+    out = xr.Dataset(
+        {
+            "x_min": (dims, x_min),
+            "x_max": (dims, x_max),
+            "y_min": (dims, y_min),
+            "y_max": (dims, y_max),
+            "rad_max": (dims, rad_max),
+            "x_cntr": (dims, (x_max + x_min) / 2),
+            "y_cntr": (dims, (y_max + y_min) / 2),
+            "x_half": (dims, (x_max - x_min) / 2),
+            "y_half": (dims, (y_max - y_min) / 2),
+            "wavelength_um": (
+                dims,
+                np.broadcast_to(
+                    system_wavelengths_um[np.newaxis, :, np.newaxis], x_min.shape
+                ).astype(float),
+            ),
+        },
+        coords={
+            "configuration_index": ("conf", np.arange(1, number_of_configs + 1)),
+            "wavelength_index": (
+                "wvln",
+                np.arange(1, system_wavelengths_um.shape[0] + 1),
+            ),
+            "field_index": ("fld", fields),
+        },
+        attrs={
+            "Surface": int(surface),
+            "Pupil_Sampling": int(pupil_sampling),
+            "Lens_Units": str(self.Utilities_GetAllSystemUnits()["LensUnits"]),
+        },
+    )
+    if keep_rays:
+        out = out.assign(
+            {
+                "ray_x": (dims + ("pupil_ray",), ray_x),
+                "ray_y": (dims + ("pupil_ray",), ray_y),
+            }
+        ).assign_coords(
+            {
+                "pupil_x": ("pupil_ray", PX[inside]),
+                "pupil_y": ("pupil_ray", PY[inside]),
+            }
+        )
+    if self._verbose:
+        cp("!@lg!@Analyses_FootprintFromRayTrace :: Done.")
+    return out
+
+
+@_AnalysisCache_Cached_
+@_System_Preserved_(config=True)
 def Analyses_FFTMTF(
     self,
     wavelength: int | float | ZOSAPI_SystemData_IWavelength = 0,
@@ -642,10 +1358,17 @@ def Analyses_FFTMTF(
     max_freq: float = 0,
     use_polarization: bool = True,
     configuration: int = None,
+    from_real_and_imaginary: bool = False,
+    validate: bool = False,
+    number_of_workers: int = 1,
 ) -> xr.Dataset:
     """
     Get the (sequential) FFT MTF of the system.
 
+    By default the analysis is run five times (modulation, phase, real, imaginary, and square wave).
+    With `from_real_and_imaginary` it is only run for the real and imaginary parts, from which the modulation and phase
+    (in degrees) are computed directly and the square wave response through the Coltman series (see :func:`_Analysis_SquareWaveFromMTF_`).
+
     :param wavelength: System wavelength (as index, microns, or object) to do the MTF on. An int of 0 selects all all wavelengths, Defaults to 0.
     :type wavelength: int | float | ZOSAPI_SystemData_IWavelength, optional
     :param field: System field (index of object) to do the MTF on.  An int of 0 selects all fields, defaults to 0
@@ -660,13 +1383,17 @@ def Analyses_FFTMTF(
     :type use_polarization: bool, optional
     :param configuration: MCE configration to perform the analysis on. If None will use the active configuration, defaults to None.
     :type configuration: bool, optional
+    :param from_real_and_imaginary: If True, only runs the real and imaginary analyses and derives the rest, defaults to False
+    :type from_real_and_imaginary: bool, optional
+    :param validate: If True (and from_real_and_imaginary), also runs the modulation, phase, and square wave analyses and
+                     stores the maximum absolute difference to the derived values as 'Validation_MaxAbsDiff_*' attributes, defaults to False
+    :type validate: bool, optional
+    :param number_of_workers: If more than 1, the fields are split over this many worker OpticStudio instances (see :func:`Parallel_RunAnalyses`), defaults to 1
+    :type number_of_workers: int, optional
     :return: The x and y data of the FFTMTF analysis.
     :rtype: tuple[np.ndarray, np.ndarray]
     """
-    CURRENT_CONFIG = int(self.MCE_GetCurrentConfig())
-    if configuration is None:
-        self.MCE_SetActiveConfig(CURRENT_CONFIG)
-    else:
+    if configuration is not None:
         self.MCE_SetActiveConfig(configuration)
     # convert wavelength/fields/surface
     if not (isinstance(wavelength, int) and wavelength == 0):
@@ -676,6 +1403,32 @@ def Analyses_FFTMTF(
     if not (isinstance(surface, int) and surface == 0):
         surface = self._convert_raw_field_input_(surface, return_index=True)
 
+    if number_of_workers > 1 and isinstance(field, int) and field == 0:
+        # The diffraction limited MTF does not depend on the field, so it is taken from the first worker.
+        out = self.Parallel_RunAnalyses(
+            "Analyses_FFTMTF",
+            [
+                {
+                    "wavelength": int(wavelength),
+                    "field": int(x),
+                    "surface": int(surface),
+                    "sample_size": sample_size,
+                    "max_freq": max_freq,
+                    "use_polarization": use_polarization,
+                    "configuration": int(self.MCE_GetCurrentConfig()),
+                    "from_real_and_imaginary": from_real_and_imaginary,
+                    "validate": validate,
+                }
+                for x in range(1, self.Fields_GetNumberOfFields() + 1)
+            ],
+            number_of_workers=number_of_workers,
+            concat_dim="field",
+            data_vars="minimal",
+            coords="minimal",
+            compat="override",
+        )
+        return out
+
     def _do_mtf_mode_(MTF_type: str):
         # Settings. Example API calls for it do not work. Found a work around through configuration files.
         # MODIFYSETTINGS are defined in the ZPL help files: The Programming Tab > About the ZPL > Keywords
@@ -711,11 +1464,46 @@ def Analyses_FFTMTF(
         )
         return xar, yar
 
-    freq, mod_y = _do_mtf_mode_("modulation")
-    _, phase_y = _do_mtf_mode_("phase")
-    _, real_y = _do_mtf_mode_("real")
-    _, imag_y = _do_mtf_mode_("imaginary")
-    _, square_y = _do_mtf_mode_("squarewave")
+    validation = {}
+    if from_real_and_imaginary:
+        freq, real_y = _do_mtf_mode_("real")
+        _, imag_y = _do_mtf_mode_("imaginary")
+        real_y = real_y.astype(float)
+        imag_y = imag_y.astype(float)
+        mod_y = np.hypot(real_y, imag_y)
+        phase_y = np.rad2deg(np.arctan2(imag_y, real_y))
+        square_y = self._Analysis_SquareWaveFromMTF_(
+            freq[0].astype(float), mod_y, axis=1
+        )
+        if validate:
+            for name, derived, mode in [
+                ("modulation", mod_y, "modulation"),
+                ("phase", phase_y, "phase"),
+                ("square_wave", square_y, "squarewave"),
+            ]:
+                _, reference = _do_mtf_mode_(mode)
+                difference = np.abs(derived - reference.astype(float))
+                if name == "phase":
+                    difference = np.minimum(difference, 360.0 - difference)
+                validation[f"Validation_MaxAbsDiff_{name}"] = float(
+                    np.nanmax(difference)
+                )
+            if self._verbose:
+                cp(
+                    "!@lg!@Analyses_FFTMTF :: Derived vs. analysis maximum absolute differences: "
+                    + ", ".join(
+                        [
+                            f"{x.split('_', 2)[-1]} [!@lm!@{validation[x]:.3g}!@lg!@]"
+                            for x in validation
+                        ]
+                    )
+                )
+    else:
+        freq, mod_y = _do_mtf_mode_("modulation")
+        _, phase_y = _do_mtf_mode_("phase")
+        _, real_y = _do_mtf_mode_("real")
+        _, imag_y = _do_mtf_mode_("imaginary")
+        _, square_y = _do_mtf_mode_("squarewave")
     if field != 0:
         fields = [self.Field_GetField(field)]
     else:
@@ -763,12 +1551,54 @@ def Analyses_FFTMTF(
             "Field_Type": str(self.Field_GetFieldType()),
             "Lens_Units": str(units["LensUnits"]),
             "MCE_Configuration": int(self.MCE_GetCurrentConfig()),
+            **validation,
         },
     )
-    self.MCE_SetActiveConfig(CURRENT_CONFIG)
     return out
 
 
+def _Analysis_PsfFromRealImaginary_(
+    self,
+    real_part: np.ndarray,
+    imag_part: np.ndarray,
+    grid_attrs: dict,
+    normalize: bool = True,
+) -> Box:
+    """
+    Worker to compute the PSF views of a single pass PSF analysis from the real and imaginary parts of the complex amplitude.
+    The grid spacing and center point are taken from the data grid metadata (see :func:`_Analysis_DataGridToDataset_`) rather than the analysis text output.
+
+    :param real_part: Real part of the PSF amplitude.
+    :type real_part: np.ndarray
+    :param imag_part: Imaginary part of the PSF amplitude.
+    :type imag_part: np.ndarray
+    :param grid_attrs: Attributes (Dx, Dy, MinX, MinY) of the data grid the parts were read from.
+    :type grid_attrs: dict
+    :param normalize: If True the linear PSF is normalized to a peak of 1, defaults to True
+    :type normalize: bool, optional
+    :return: Box with linear (|amplitude|^2), phase (degrees), data_spacing, and center_point (1-based row, column).
+    :rtype: Box
+    """
+    real_part = np.asarray(real_part, dtype=float)
+    imag_part = np.asarray(imag_part, dtype=float)
+    linear = real_part**2 + imag_part**2
+    if normalize and np.nanmax(linear) > 0:
+        linear = linear / np.nanmax(linear)
+    return Box(
+        {
+            "linear": linear,
+            "phase": np.rad2deg(np.arctan2(imag_part, real_part)),
+            "data_spacing": float(grid_attrs["Dx"]),
+            "center_point": (
+                int(np.round(-grid_attrs["MinY"] / grid_attrs["Dy"])) + 1,
+                int(np.round(-grid_attrs["MinX"] / grid_attrs["Dx"])) + 1,
+            ),
+        }
+    )
+
+
+@_AnalysisCache_Cached_
+@_System_Preserved_(config=True)
 def Analyses_FFTPSF(
     self,
     wavelength: int | float | ZOSAPI_SystemData_IWavelength = 0,
@@ -780,6 +1610,8 @@ def Analyses_FFTPSF(
     use_polarization: bool = True,
     use_normalization: bool = True,
     configuration: int = None,
+    single_pass: bool = False,
+    number_of_workers: int = 1,
 ) -> xr.Dataset:
     """
     Get the (sequential) FFT PSF of the system.
@@ -802,13 +1634,17 @@ def Analyses_FFTPSF(
     :type use_normalization: bool, optional
     :param configuration: MCE configration to perform the analysis on. If None will use the active configuration, defaults to None.
     :type configuration: bool, optional
+    :param single_pass: If True, the analysis is only run for the real and imaginary parts of the PSF. The other views are computed from them
+                        (see :func:`_Analysis_PsfFromRealImaginary_`). The log view is the log10 of the linear PSF relative to its peak, floored at 10^-5
+                        (see :func:`_Analysis_PsfLog_`). No text output is written or parsed: the data spacing and center point are read from
+                        the data grid, and the pupil/image grid sizes are the sample/output sizes. Defaults to False
+    :type single_pass: bool, optional
+    :param number_of_workers: If more than 1, the fields are split over this many worker OpticStudio instances (see :func:`Parallel_RunAnalyses`), defaults to 1
+    :type number_of_workers: int, optional
     :return: The x and y data of the FFTMTF analysis.
     :rtype: tuple[np.ndarray, np.ndarray]
     """
-    CURRENT_CONFIG = int(self.MCE_GetCurrentConfig())
-    if configuration is None:
-        self.MCE_SetActiveConfig(CURRENT_CONFIG)
-    else:
+    if configuration is not None:
         self.MCE_SetActiveConfig(configuration)
     # convert wavelength/fields/surface
     if not (isinstance(wavelength, int) and wavelength == 0):
@@ -820,33 +1656,61 @@ def Analyses_FFTPSF(
     if not (isinstance(surface, int) and surface == 0):
         surface = self._convert_raw_field_input_(surface, return_index=True)
 
-    def _do_psf_mode_(PSF_type: str, field_idx: int):
+    if number_of_workers > 1 and len(field) > 1:
+        out = self.Parallel_RunAnalyses(
+            "Analyses_FFTPSF",
+            [
+                {
+                    "wavelength": int(wavelength),
+                    "field": int(x),
+                    "surface": int(surface),
+                    "sample_size": sample_size,
+                    "output_size": output_size,
+                    "image_delta_microns": image_delta_microns,
+                    "use_polarization": use_polarization,
+                    "use_normalization": use_normalization,
+                    "configuration": int(self.MCE_GetCurrentConfig()),
+                    "single_pass": single_pass,
+                }
+                for x in field
+            ],
+            number_of_workers=number_of_workers,
+            concat_dim="field",
+            join="exact",
+        )
+        return out
+
+    def _do_psf_mode_(PSF_type: str, field_idx: int, read_info: bool = True):
         # "OutputSize" is not docummented or seemignly accessable through what :func:`Analyses_RunAnalysesAndGetResults` would do.
         # This actually seems to be build on a "newer" version of the Zemax settings API which is much less abstractable it seems.
         # Doing manual assignmnet below through the use of `analysis_settings_obj.__implementation__`.
         analysis_obj, analysis_settings_obj, analysis_enum = (
             self._Analysis_GetZOSObjectAndSettings_(analysis="FftPsf")
         )
-        analysis_settings_obj = analysis_settings_obj.__implementation__
-        analysis_settings_obj.SampleSize = self._CheckIfStringValidInDir_(
-            self.ZOSAPI.Analysis.Settings.Psf.PsfSampling,
-            sample_size,
-            extra_include_filter="S_",
-        )
-        analysis_settings_obj.OutputSize = self._CheckIfStringValidInDir_(
-            self.ZOSAPI.Analysis.Settings.Psf.PsfSampling,
-            output_size,
-            extra_include_filter="S_",
-        )
-        analysis_settings_obj.Wavelength.SetWavelengthNumber(int(wavelength))
-        analysis_settings_obj.Field.SetFieldNumber(int(field_idx))
-        analysis_settings_obj.Type = self._CheckIfStringValidInDir_(
-            self.ZOSAPI.Analysis.Settings.Psf.FftPsfType, PSF_type
-        )
-        analysis_settings_obj.Surface.SetSurfaceNumber(int(surface))
-        analysis_settings_obj.UsePolarization = use_polarization
-        analysis_settings_obj.Normalize = use_normalization
-        analysis_settings_obj.ImageDelta = float(image_delta_microns)
+        if not self._Analysis_SweepReplaying_():
+            # The settings are edited directly below, so start from the defaults and drop the record of the applied settings.
+            self._Analysis_ResetZOSObjectSettings_(analysis_settings_obj, analysis_enum)
+            self._Analysis_ForgetAppliedSettings_(analysis_settings_obj)
+            analysis_settings_obj = analysis_settings_obj.__implementation__
+            analysis_settings_obj.SampleSize = self._CheckIfStringValidInDir_(
+                self.ZOSAPI.Analysis.Settings.Psf.PsfSampling,
+                sample_size,
+                extra_include_filter="S_",
+            )
+            analysis_settings_obj.OutputSize = self._CheckIfStringValidInDir_(
+                self.ZOSAPI.Analysis.Settings.Psf.PsfSampling,
+                output_size,
+                extra_include_filter="S_",
+            )
+            analysis_settings_obj.Wavelength.SetWavelengthNumber(int(wavelength))
+            analysis_settings_obj.Field.SetFieldNumber(int(field_idx))
+            analysis_settings_obj.Type = self._CheckIfStringValidInDir_(
+                self.ZOSAPI.Analysis.Settings.Psf.FftPsfType, PSF_type
+            )
+            analysis_settings_obj.Surface.SetSurfaceNumber(int(surface))
+            analysis_settings_obj.UsePolarization = use_polarization
+            analysis_settings_obj.Normalize = use_normalization
+            analysis_settings_obj.ImageDelta = float(image_delta_microns)
         if self._verbose:
             cp(
                 "!@lg!@Analyses_FFTPSF :: Calculating FFT PSF [!@lm!@%s!@lg!@]..."
@@ -854,18 +1718,19 @@ def Analyses_FFTPSF(
             )
         analysis_obj.ApplyAndWaitForCompletion()
         results = analysis_obj.GetResults()
-        results.GetTextFile(
-            self.Utilities_AnalysesFilesDir() + os.sep + "HuygensPSF.txt"
-        )
-        info = self.Analyses_ExtractSectionOfTextFile(
-            in_file=self.Utilities_AnalysesFilesDir() + os.sep + "HuygensPSF.txt",
-            start_marker="Date",
-            end_marker="Values",
-        )
-        gar, xar, yar = self._Analysis_GeneralDataGridReader_(results)
-        analysis_obj.Close()
-        del analysis_obj
-        return gar[0], xar[0], yar[0], info
+        info = None
+        if read_info:
+            results.GetTextFile(
+                self.Utilities_AnalysesFilesDir() + os.sep + "HuygensPSF.txt"
+            )
+            info = self.Analyses_ExtractSectionOfTextFile(
+                in_file=self.Utilities_AnalysesFilesDir() + os.sep + "HuygensPSF.txt",
+                start_marker="Date",
+                end_marker="Values",
+            )
+        grid = self._Analysis_DataGridToDataset_(results.GetDataGrid(0))
+        self._Analysis_ReleaseZOSObject_(analysis_obj)
+        return grid.value.values, grid.x.values, grid.y.values, info, grid.attrs
 
     out_list = []
     for fieldidx in field:
@@ -873,11 +1738,49 @@ def Analyses_FFTPSF(
             cp(
                 f"!@lg!@Analyses_FFTPSF :: Calculating FFT PSF for field [!@lm!@{fieldidx}!@lg!@]."
             )
-        ling, x, y, info = _do_psf_mode_("linear", field_idx=fieldidx)
-        logg, _, _, _ = _do_psf_mode_("log", field_idx=fieldidx)
-        phaseg, _, _, _ = _do_psf_mode_("phase", field_idx=fieldidx)
-        realg, _, _, _ = _do_psf_mode_("real", field_idx=fieldidx)
-        imagg, _, _, _ = _do_psf_mode_("imaginary", field_idx=fieldidx)
+        if single_pass:
+            # No text output is written. Spacing and center come from the data grid, the grid sizes from the settings.
+            realg, x, y, _, grid_attrs = _do_psf_mode_(
+                "real", field_idx=fieldidx, read_info=False
+            )
+            imagg, _, _, _, _ = _do_psf_mode_(
+                "imaginary", field_idx=fieldidx, read_info=False
+            )
+            psf = self._Analysis_PsfFromRealImaginary_(
+                realg, imagg, grid_attrs, normalize=use_normalization
+            )
+            ling = psf.linear
+            logg = self._Analysis_PsfLog_(ling, 5)
+            phaseg = psf.phase
+            data_spacing = psf.data_spacing
+            data_spacing_units = "µm"
+            center_point = psf.center_point
+            pupil_grid = sample_size.lower().replace("x", " by ")
+            image_grid = output_size.lower().replace("x", " by ")
+        else:
+            ling, x, y, info, _ = _do_psf_mode_("linear", field_idx=fieldidx)
+            logg, _, _, _, _ = _do_psf_mode_("log", field_idx=fieldidx, read_info=False)
+            phaseg, _, _, _, _ = _do_psf_mode_(
+                "phase", field_idx=fieldidx, read_info=False
+            )
+            realg, _, _, _, _ = _do_psf_mode_(
+                "real", field_idx=fieldidx, read_info=False
+            )
+            imagg, _, _, _, _ = _do_psf_mode_(
+                "imaginary", field_idx=fieldidx, read_info=False
+            )
+            data_spacing = float(
+                info[2].split("is")[-1].strip(" ").strip(".").split(" ")[0]
+            )
+            data_spacing_units = (
+                info[2].split("is")[-1].strip(" ").strip(".").split(" ")[1]
+            )
+            center_point = [
+                int(x.split(" ")[-1].strip(" ").strip(","))
+                for x in info[8].split(":")[-1].strip(" ").strip(".").split(", ")
+            ]
+            pupil_grid = str(info[6].split(":")[-1].strip(" ").strip("."))
+            image_grid = str(info[7].split(":")[-1].strip(" ").strip("."))
         units = self.Utilities_GetAllSystemUnits()
         lsf_x, lsf_y, esf_x, esf_y = self._Analysis_CalcLsfEsfFrom2DPsf_(
             psf=ling, x=x, y=y, normalize=True
@@ -898,24 +1801,8 @@ def Analyses_FFTPSF(
                     "imag_part": (("field", "y", "x"), imagg.astype(float)[np.newaxis]),
                     "data_spacing": (
                         "field",
-                        np.array(
-                            [
-                                float(
-                                    info[2]
-                                    .split("is")[-1]
-                                    .strip(" ")
-                                    .strip(".")
-                                    .split(" ")[0]
-                                )
-                            ]
-                        ),
-                        {
-                            "units": info[2]
-                            .split("is")[-1]
-                            .strip(" ")
-                            .strip(".")
-                            .split(" ")[1]
-                        },
+                        np.array([data_spacing]),
+                        {"units": data_spacing_units},
                     ),
                 },
                 coords={
@@ -931,36 +1818,8 @@ def Analyses_FFTPSF(
                         "field",
                         np.array([float(self.Field_GetField(fieldidx).Y)]),
                     ),
-                    "center_point_row": (
-                        ("field"),
-                        np.array(
-                            [
-                                [
-                                    int(x.split(" ")[-1].strip(" ").strip(","))
-                                    for x in info[8]
-                                    .split(":")[-1]
-                                    .strip(" ")
-                                    .strip(".")
-                                    .split(", ")
-                                ][0]
-                            ]
-                        ),
-                    ),
-                    "center_point_col": (
-                        ("field"),
-                        np.array(
-                            [
-                                [
-                                    int(x.split(" ")[-1].strip(" ").strip(","))
-                                    for x in info[8]
-                                    .split(":")[-1]
-                                    .strip(" ")
-                                    .strip(".")
-                                    .split(", ")
-                                ][1]
-                            ]
-                        ),
-                    ),
+                    "center_point_row": (("field"), np.array([center_point[0]])),
+                    "center_point_col": (("field"), np.array([center_point[1]])),
                     "x": (
                         ("field", "x"),
                         x.astype(float)[np.newaxis],
@@ -975,18 +1834,19 @@ def Analyses_FFTPSF(
                 attrs={
                     "Field_Type": str(self.Field_GetFieldType()),
                     "Lens_Units": str(units["LensUnits"]),
-                    "Pupil_Grid": str(info[6].split(":")[-1].strip(" ").strip(".")),
-                    "Image_Grid": str(info[7].split(":")[-1].strip(" ").strip(".")),
+                    "Pupil_Grid": pupil_grid,
+                    "Image_Grid": image_grid,
                     "MCE_Configuration": int(self.MCE_GetCurrentConfig()),
                     "LSF_ESF_NOTE": "This may differ from Zemax FFT LSF/ESF specific analysis even given the same (as possible) settings. The integration done here is correct, but Zemax LSF/ESF specific analysis adjusts the sampeling in a way that is unclear to reproduce. It also has a coherent version which this cannot do.",
                 },
             )
         )
 
-    self.MCE_SetActiveConfig(CURRENT_CONFIG)
     return xr.concat(out_list, dim="field", join="exact")
 
 
+@_AnalysisCache_Cached_
+@_System_Preserved_(config=True)
 def Analyses_HuygensMTF(
     self,
     wavelength: int | float | ZOSAPI_SystemData_IWavelength = 0,
@@ -997,6 +1857,7 @@ def Analyses_HuygensMTF(
     max_freq: float = 0,
     use_polarization: bool = True,
     configuration: int = None,
+    number_of_workers: int = 1,
 ) -> xr.Dataset:
     """
     Get the Huygens MTF of the system. Simply, this is more accurate than the FFT version, but (possibly much) slower.
@@ -1019,13 +1880,12 @@ def Analyses_HuygensMTF(
     :type use_polarization: bool, optional
     :param configuration: MCE configration to perform the analysis on. If None will use the active configuration, defaults to None.
     :type configuration: bool, optional
+    :param number_of_workers: If more than 1, the fields are split over this many worker OpticStudio instances (see :func:`Parallel_RunAnalyses`), defaults to 1
+    :type number_of_workers: int, optional
     :return: The x and y data of the FFTMTF analysis.
     :rtype: tuple[np.ndarray, np.ndarray]
     """
-    CURRENT_CONFIG = int(self.MCE_GetCurrentConfig())
-    if configuration is None:
-        self.MCE_SetActiveConfig(CURRENT_CONFIG)
-    else:
+    if configuration is not None:
         self.MCE_SetActiveConfig(configuration)
     # Code wise this is just an adapt of the FFT MTF
     # convert wavelength/fields/surface
@@ -1033,6 +1893,30 @@ def Analyses_HuygensMTF(
         wavelength = self._convert_raw_wavelength_input_(wavelength, return_index=True)
     if not (isinstance(field, int) and field == 0):
         field = self._convert_raw_field_input_(field, return_index=True)
+    if number_of_workers > 1 and isinstance(field, int) and field == 0:
+        out = self.Parallel_RunAnalyses(
+            "Analyses_HuygensMTF",
+            [
+                {
+                    "wavelength": int(wavelength),
+                    "field": int(x),
+                    "pupil_sample_size": pupil_sample_size,
+                    "image_sample_size": image_sample_size,
+                    "image_delta_microns": image_delta_microns,
+                    "max_freq": max_freq,
+                    "use_polarization": use_polarization,
+                    "configuration": int(self.MCE_GetCurrentConfig()),
+                }
+                for x in range(1, self.Fields_GetNumberOfFields() + 1)
+            ],
+            number_of_workers=number_of_workers,
+            concat_dim="field",
+            data_vars="minimal",
+            coords="minimal",
+            compat="override",
+        )
+        return out
+
     PupilSampSizeIdx = self._CheckIfStringValidInDir_(
         self.ZOSAPI.Analysis.SampleSizes, pupil_sample_size, extra_include_filter="S_"
     )
@@ -1095,10 +1979,11 @@ def Analyses_HuygensMTF(
             "MCE_Configuration": int(self.MCE_GetCurrentConfig()),
         },
     )
-    self.MCE_SetActiveConfig(CURRENT_CONFIG)
     return out
 
 
+@_AnalysisCache_Cached_
+@_System_Preserved_(config=True)
 def Analyses_HuygensPSF(
     self,
     wavelength: int | float | ZOSAPI_SystemData_IWavelength = 0,
@@ -1111,6 +1996,8 @@ def Analyses_HuygensPSF(
     use_normalization: bool = True,
     use_centroid: bool = False,
     configuration: int = None,
+    single_pass: bool = False,
+    number_of_workers: int = 1,
 ) -> xr.Dataset:
     """
     Get the (sequential) Huygens PSF of the system. Simply, this is more accurate than the FFT version, but (possibly much) slower.
@@ -1137,13 +2024,19 @@ def Analyses_HuygensPSF(
     :type use_centroid: bool, optional
     :param configuration: MCE configration to perform the analysis on. If None will use the active configuration, defaults to None.
     :type configuration: bool, optional
+    :param single_pass: If True, the analysis is only run for the real and imaginary parts of the PSF. The other views are computed from them
+                        (see :func:`_Analysis_PsfFromRealImaginary_`). The log views are the log10 of the linear PSF relative to its peak, floored at 10^-N
+                        (see :func:`_Analysis_PsfLog_`).
+                        No text output is written or parsed: the data spacing and center point are read from the data grid, the pupil/image grid sizes are
+                        the sample sizes, and the Strehl ratio is read from the results header (NaN if not given there). The center, center offset, and
+                        centroid coordinates are only in the text output, so they are not returned. Defaults to False
+    :type single_pass: bool, optional
+    :param number_of_workers: If more than 1, the fields are split over this many worker OpticStudio instances (see :func:`Parallel_RunAnalyses`), defaults to 1
+    :type number_of_workers: int, optional
     :return: The x and y data of the FFTMTF analysis.
     :rtype: tuple[np.ndarray, np.ndarray]
     """
-    CURRENT_CONFIG = int(self.MCE_GetCurrentConfig())
-    if configuration is None:
-        self.MCE_SetActiveConfig(CURRENT_CONFIG)
-    else:
+    if configuration is not None:
         self.MCE_SetActiveConfig(configuration)
     # convert wavelength/fields/surface
     if not (isinstance(wavelength, int) and wavelength == 0):
@@ -1153,33 +2046,62 @@ def Analyses_HuygensPSF(
     else:
         field = np.arange(1, self.Fields_GetNumberOfFields() + 1)
 
-    def _do_psf_mode_(PSF_type: str, field_idx: int):
+    if number_of_workers > 1 and len(field) > 1:
+        out = self.Parallel_RunAnalyses(
+            "Analyses_HuygensPSF",
+            [
+                {
+                    "wavelength": int(wavelength),
+                    "field": int(x),
+                    "pupil_size": pupil_size,
+                    "image_size": image_size,
+                    "image_delta_microns": image_delta_microns,
+                    "rotation": rotation,
+                    "use_polarization": use_polarization,
+                    "use_normalization": use_normalization,
+                    "use_centroid": use_centroid,
+                    "configuration": int(self.MCE_GetCurrentConfig()),
+                    "single_pass": single_pass,
+                }
+                for x in field
+            ],
+            number_of_workers=number_of_workers,
+            concat_dim="field",
+            join="exact",
+        )
+        return out
+
+    def _do_psf_mode_(PSF_type: str, field_idx: int, read_info: bool = True):
         # Like the FFT PSF, this has options that are not docummented or seemignly accessable through what :func:`Analyses_RunAnalysesAndGetResults` would do.
         # This actually seems to be build on a "newer" version of the Zemax settings API which is much less abstractable it seems.
         # Doing manual assignmnet below through the use of `analysis_settings_obj.__implementation__`.
         analysis_obj, analysis_settings_obj, analysis_enum = (
             self._Analysis_GetZOSObjectAndSettings_(analysis="HuygensPsf")
         )
-        analysis_settings_obj = analysis_settings_obj.__implementation__
-        #
-        analysis_settings_obj.ImageSampleSize = self._CheckIfStringValidInDir_(
-            self.ZOSAPI.Analysis.SampleSizes, image_size, extra_include_filter="S_"
-        )
-        analysis_settings_obj.PupilSampleSize = self._CheckIfStringValidInDir_(
-            self.ZOSAPI.Analysis.SampleSizes, pupil_size, extra_include_filter="S_"
-        )
-        analysis_settings_obj.Rotation = self._CheckIfStringValidInDir_(
-            self.ZOSAPI.Analysis.Settings.Rotations, str(rotation)
-        )
-        analysis_settings_obj.Wavelength.SetWavelengthNumber(int(wavelength))
-        analysis_settings_obj.Field.SetFieldNumber(int(field_idx))
-        analysis_settings_obj.Type = self._CheckIfStringValidInDir_(
-            self.ZOSAPI.Analysis.Settings.HuygensPsfTypes, PSF_type
-        )
-        analysis_settings_obj.UsePolarization = use_polarization
-        analysis_settings_obj.Normalize = use_normalization
-        analysis_settings_obj.UseCentroid = use_centroid
-        analysis_settings_obj.ImageDelta = float(image_delta_microns)
+        if not self._Analysis_SweepReplaying_():
+            # The settings are edited directly below, so start from the defaults and drop the record of the applied settings.
+            self._Analysis_ResetZOSObjectSettings_(analysis_settings_obj, analysis_enum)
+            self._Analysis_ForgetAppliedSettings_(analysis_settings_obj)
+            analysis_settings_obj = analysis_settings_obj.__implementation__
+            #
+            analysis_settings_obj.ImageSampleSize = self._CheckIfStringValidInDir_(
+                self.ZOSAPI.Analysis.SampleSizes, image_size, extra_include_filter="S_"
+            )
+            analysis_settings_obj.PupilSampleSize = self._CheckIfStringValidInDir_(
+                self.ZOSAPI.Analysis.SampleSizes, pupil_size, extra_include_filter="S_"
+            )
+            analysis_settings_obj.Rotation = self._CheckIfStringValidInDir_(
+                self.ZOSAPI.Analysis.Settings.Rotations, str(rotation)
+            )
+            analysis_settings_obj.Wavelength.SetWavelengthNumber(int(wavelength))
+            analysis_settings_obj.Field.SetFieldNumber(int(field_idx))
+            analysis_settings_obj.Type = self._CheckIfStringValidInDir_(
+                self.ZOSAPI.Analysis.Settings.HuygensPsfTypes, PSF_type
+            )
+            analysis_settings_obj.UsePolarization = use_polarization
+            analysis_settings_obj.Normalize = use_normalization
+            analysis_settings_obj.UseCentroid = use_centroid
+            analysis_settings_obj.ImageDelta = float(image_delta_microns)
         if self._verbose:
             cp(
                 "!@lg!@Analyses_HuygensPSF :: Calculating Huygens PSF [!@lm!@%s!@lg!@]..."
@@ -1187,16 +2109,22 @@ def Analyses_HuygensPSF(
             )
         analysis_obj.ApplyAndWaitForCompletion()
         results = analysis_obj.GetResults()
-        results.GetTextFile(
-            self.Utilities_AnalysesFilesDir() + os.sep + "HuygensPSF.txt"
-        )
-        info = self.Analyses_ExtractSectionOfTextFile(
-            in_file=self.Utilities_AnalysesFilesDir() + os.sep + "HuygensPSF.txt",
-            start_marker="Date",
-            end_marker="Values",
-        )
-        gar, xar, yar = self._Analysis_GeneralDataGridReader_(results)
-        return gar[0], xar[0], yar[0], info
+        info = None
+        if read_info:
+            results.GetTextFile(
+                self.Utilities_AnalysesFilesDir() + os.sep + "HuygensPSF.txt"
+            )
+            info = self.Analyses_ExtractSectionOfTextFile(
+                in_file=self.Utilities_AnalysesFilesDir() + os.sep + "HuygensPSF.txt",
+                start_marker="Date",
+                end_marker="Values",
+            )
+        elif results.HeaderData is not None:
+            # The in-memory header lines of the results (no text file is written).
+            info = [str(x) for x in results.HeaderData.Lines]
+        grid = self._Analysis_DataGridToDataset_(results.GetDataGrid(0))
+        self._Analysis_ReleaseZOSObject_(analysis_obj)
+        return grid.value.values, grid.x.values, grid.y.values, info, grid.attrs
 
     out_list = []
     for fieldidx in field:
@@ -1204,15 +2132,215 @@ def Analyses_HuygensPSF(
             cp(
                 f"!@lg!@Analyses_HuygensPSF :: Calculating PSF for field [!@lm!@{fieldidx}!@lg!@]."
             )
-        ling, x, y, info = _do_psf_mode_("Linear", field_idx=fieldidx)
-        logm1g, _, _, _ = _do_psf_mode_("Log_Minus_1", field_idx=fieldidx)
-        logm2g, _, _, _ = _do_psf_mode_("Log_Minus_2", field_idx=fieldidx)
-        logm3g, _, _, _ = _do_psf_mode_("Log_Minus_3", field_idx=fieldidx)
-        logm4g, _, _, _ = _do_psf_mode_("Log_Minus_4", field_idx=fieldidx)
-        logm5g, _, _, _ = _do_psf_mode_("Log_Minus_5", field_idx=fieldidx)
-        phaseg, _, _, _ = _do_psf_mode_("phase", field_idx=fieldidx)
-        realg, _, _, _ = _do_psf_mode_("real", field_idx=fieldidx)
-        imagg, _, _, _ = _do_psf_mode_("imaginary", field_idx=fieldidx)
+        if single_pass:
+            # No text output is written. Spacing and center come from the data grid, the grid sizes from the settings,
+            # and the Strehl ratio from the results header (if given there).
+            realg, x, y, header, grid_attrs = _do_psf_mode_(
+                "real", field_idx=fieldidx, read_info=False
+            )
+            imagg, _, _, _, _ = _do_psf_mode_(
+                "imaginary", field_idx=fieldidx, read_info=False
+            )
+            psf = self._Analysis_PsfFromRealImaginary_(
+                realg, imagg, grid_attrs, normalize=use_normalization
+            )
+            ling = psf.linear
+            logm1g, logm2g, logm3g, logm4g, logm5g = [
+                self._Analysis_PsfLog_(ling, n) for n in range(1, 6)
+            ]
+            phaseg = psf.phase
+            data_spacing = psf.data_spacing
+            data_spacing_units = "µm"
+            center_point = psf.center_point
+            strehl_ratio = np.nan
+            for line in header or []:
+                if "strehl" in line.lower():
+                    with contextlib.suppress(ValueError):
+                        strehl_ratio = float(line.split(":")[-1].strip(".").strip(" "))
+                    break
+            pupil_grid = pupil_size.lower().replace("x", " by ")
+            image_grid = image_size.lower().replace("x", " by ")
+            info_coords = {}
+        else:
+            ling, x, y, info, _ = _do_psf_mode_("Linear", field_idx=fieldidx)
+            logm1g, logm2g, logm3g, logm4g, logm5g = [
+                _do_psf_mode_(f"Log_Minus_{n}", field_idx=fieldidx, read_info=False)[0]
+                for n in range(1, 6)
+            ]
+            phaseg, _, _, _, _ = _do_psf_mode_(
+                "phase", field_idx=fieldidx, read_info=False
+            )
+            realg, _, _, _, _ = _do_psf_mode_(
+                "real", field_idx=fieldidx, read_info=False
+            )
+            imagg, _, _, _, _ = _do_psf_mode_(
+                "imaginary", field_idx=fieldidx, read_info=False
+            )
+            data_spacing = float(
+                " ".join(info[1].split(" ")[-2::]).strip(".").split(" ")[0]
+            )
+            data_spacing_units = str(
+                " ".join(info[1].split(" ")[-2::]).strip(".").split(" ")[1]
+            )
+            center_point = [
+                int(x.split(" ")[-1].strip(" ").strip(","))
+                for x in info[6].split(":")[-1].strip(" ").strip(".").split(", ")
+            ]
+            strehl_ratio = float(info[3].split(":")[-1].strip(".").strip(" "))
+            pupil_grid = str(info[4].split(":")[-1].strip(" ").strip("."))
+            image_grid = str(info[5].split(":")[-1].strip(" ").strip("."))
+            info_coords = {
+                "center_coord_row": (
+                    ("field"),
+                    np.array(
+                        [
+                            [
+                                float(x.strip(" ").split(" ")[0])
+                                for x in info[7]
+                                .split(":")[-1]
+                                .strip(".")
+                                .strip(" ")
+                                .split(",")
+                            ][0]
+                        ]
+                    ),
+                    {
+                        "units": str(
+                            info[7]
+                            .split(":")[-1]
+                            .strip(".")
+                            .strip(" ")
+                            .split(",")[-1]
+                            .split(" ")[-1]
+                        )
+                    },
+                ),
+                "center_coord_col": (
+                    ("field"),
+                    np.array(
+                        [
+                            [
+                                float(x.strip(" ").split(" ")[0])
+                                for x in info[7]
+                                .split(":")[-1]
+                                .strip(".")
+                                .strip(" ")
+                                .split(",")
+                            ][1]
+                        ]
+                    ),
+                    {
+                        "units": str(
+                            info[7]
+                            .split(":")[-1]
+                            .strip(".")
+                            .strip(" ")
+                            .split(",")[-1]
+                            .split(" ")[-1]
+                        )
+                    },
+                ),
+                "center_offset_row": (
+                    ("field"),
+                    np.array(
+                        [
+                            [
+                                float(x.strip(" ").split(" ")[0])
+                                for x in info[8]
+                                .split(":")[-1]
+                                .strip(".")
+                                .strip(" ")
+                                .split(",")
+                            ][0]
+                        ]
+                    ),
+                    {
+                        "units": str(
+                            info[8]
+                            .split(":")[-1]
+                            .strip(".")
+                            .strip(" ")
+                            .split(",")[-1]
+                            .split(" ")[-1]
+                        )
+                    },
+                ),
+                "center_offset_col": (
+                    ("field"),
+                    np.array(
+                        [
+                            [
+                                float(x.strip(" ").split(" ")[0])
+                                for x in info[8]
+                                .split(":")[-1]
+                                .strip(".")
+                                .strip(" ")
+                                .split(",")
+                            ][1]
+                        ]
+                    ),
+                    {
+                        "units": str(
+                            info[8]
+                            .split(":")[-1]
+                            .strip(".")
+                            .strip(" ")
+                            .split(",")[-1]
+                            .split(" ")[-1]
+                        )
+                    },
+                ),
+                "centroid_coord_row": (
+                    ("field"),
+                    np.array(
+                        [
+                            [
+                                float(x.strip(" ").split(" ")[0])
+                                for x in info[9]
+                                .split(":")[-1]
+                                .strip(".")
+                                .strip(" ")
+                                .split(",")
+                            ][0]
+                        ]
+                    ),
+                    {
+                        "units": str(
+                            info[9]
+                            .split(":")[-1]
+                            .strip(".")
+                            .strip(" ")
+                            .split(",")[-1]
+                            .split(" ")[-1]
+                        )
+                    },
+                ),
+                "centroid_coord_col": (
+                    ("field"),
+                    np.array(
+                        [
+                            [
+                                float(x.strip(" ").split(" ")[0])
+                                for x in info[9]
+                                .split(":")[-1]
+                                .strip(".")
+                                .strip(" ")
+                                .split(",")
+                            ][1]
+                        ]
+                    ),
+                    {
+                        "units": str(
+                            info[9]
+                            .split(":")[-1]
+                            .strip(".")
+                            .strip(" ")
+                            .split(",")[-1]
+                            .split(" ")[-1]
+                        )
+                    },
+                ),
+            }
         units = self.Utilities_GetAllSystemUnits()
         lsf_x, lsf_y, esf_x, esf_y = self._Analysis_CalcLsfEsfFrom2DPsf_(
             psf=ling, x=x, y=y, normalize=True
@@ -1237,27 +2365,10 @@ def Analyses_HuygensPSF(
                     "imag_part": (("field", "y", "x"), imagg.astype(float)[np.newaxis]),
                     "data_spacing": (
                         "field",
-                        np.array(
-                            [
-                                float(
-                                    " ".join(info[1].split(" ")[-2::])
-                                    .strip(".")
-                                    .split(" ")[0]
-                                )
-                            ]
-                        ),
-                        {
-                            "units": str(
-                                " ".join(info[1].split(" ")[-2::])
-                                .strip(".")
-                                .split(" ")[1]
-                            )
-                        },
-                    ),
-                    "strehl_ratio": (
-                        "field",
-                        np.array([float(info[3].split(":")[-1].strip(".").strip(" "))]),
+                        np.array([data_spacing]),
+                        {"units": data_spacing_units},
                     ),
+                    "strehl_ratio": ("field", np.array([strehl_ratio])),
                 },
                 coords={
                     "field": (
@@ -1282,200 +2393,244 @@ def Analyses_HuygensPSF(
                         y.astype(float)[np.newaxis],
                         {"units": "micrometers"},
                     ),
-                    "center_point_row": (
-                        ("field"),
-                        np.array(
-                            [
-                                [
-                                    int(x.split(" ")[-1].strip(" ").strip(","))
-                                    for x in info[6]
-                                    .split(":")[-1]
-                                    .strip(" ")
-                                    .strip(".")
-                                    .split(", ")
-                                ][0]
-                            ]
-                        ),
-                    ),
-                    "center_point_col": (
-                        ("field"),
-                        np.array(
-                            [
-                                [
-                                    int(x.split(" ")[-1].strip(" ").strip(","))
-                                    for x in info[6]
-                                    .split(":")[-1]
-                                    .strip(" ")
-                                    .strip(".")
-                                    .split(", ")
-                                ][1]
-                            ]
-                        ),
-                    ),
-                    "center_coord_row": (
-                        ("field"),
-                        np.array(
-                            [
-                                [
-                                    float(x.strip(" ").split(" ")[0])
-                                    for x in info[7]
-                                    .split(":")[-1]
-                                    .strip(".")
-                                    .strip(" ")
-                                    .split(",")
-                                ][0]
-                            ]
-                        ),
-                        {
-                            "units": str(
-                                info[7]
-                                .split(":")[-1]
-                                .strip(".")
-                                .strip(" ")
-                                .split(",")[-1]
-                                .split(" ")[-1]
-                            )
-                        },
-                    ),
-                    "center_coord_col": (
-                        ("field"),
-                        np.array(
-                            [
-                                [
-                                    float(x.strip(" ").split(" ")[0])
-                                    for x in info[7]
-                                    .split(":")[-1]
-                                    .strip(".")
-                                    .strip(" ")
-                                    .split(",")
-                                ][1]
-                            ]
-                        ),
-                        {
-                            "units": str(
-                                info[7]
-                                .split(":")[-1]
-                                .strip(".")
-                                .strip(" ")
-                                .split(",")[-1]
-                                .split(" ")[-1]
-                            )
-                        },
-                    ),
-                    "center_offset_row": (
-                        ("field"),
-                        np.array(
-                            [
-                                [
-                                    float(x.strip(" ").split(" ")[0])
-                                    for x in info[8]
-                                    .split(":")[-1]
-                                    .strip(".")
-                                    .strip(" ")
-                                    .split(",")
-                                ][0]
-                            ]
-                        ),
-                        {
-                            "units": str(
-                                info[8]
-                                .split(":")[-1]
-                                .strip(".")
-                                .strip(" ")
-                                .split(",")[-1]
-                                .split(" ")[-1]
-                            )
-                        },
-                    ),
-                    "center_offset_col": (
-                        ("field"),
-                        np.array(
-                            [
-                                [
-                                    float(x.strip(" ").split(" ")[0])
-                                    for x in info[8]
-                                    .split(":")[-1]
-                                    .strip(".")
-                                    .strip(" ")
-                                    .split(",")
-                                ][1]
-                            ]
-                        ),
-                        {
-                            "units": str(
-                                info[8]
-                                .split(":")[-1]
-                                .strip(".")
-                                .strip(" ")
-                                .split(",")[-1]
-                                .split(" ")[-1]
-                            )
-                        },
-                    ),
-                    "centroid_coord_row": (
-                        ("field"),
-                        np.array(
-                            [
-                                [
-                                    float(x.strip(" ").split(" ")[0])
-                                    for x in info[9]
-                                    .split(":")[-1]
-                                    .strip(".")
-                                    .strip(" ")
-                                    .split(",")
-                                ][0]
-                            ]
-                        ),
-                        {
-                            "units": str(
-                                info[9]
-                                .split(":")[-1]
-                                .strip(".")
-                                .strip(" ")
-                                .split(",")[-1]
-                                .split(" ")[-1]
-                            )
-                        },
-                    ),
-                    "centroid_coord_col": (
-                        ("field"),
-                        np.array(
-                            [
-                                [
-                                    float(x.strip(" ").split(" ")[0])
-                                    for x in info[9]
-                                    .split(":")[-1]
-                                    .strip(".")
-                                    .strip(" ")
-                                    .split(",")
-                                ][1]
-                            ]
-                        ),
-                        {
-                            "units": str(
-                                info[9]
-                                .split(":")[-1]
-                                .strip(".")
-                                .strip(" ")
-                                .split(",")[-1]
-                                .split(" ")[-1]
-                            )
-                        },
-                    ),
+                    "center_point_row": (("field"), np.array([center_point[0]])),
+                    "center_point_col": (("field"), np.array([center_point[1]])),
+                    **info_coords,
                 },
                 attrs={
                     "Field_Type": str(self.Field_GetFieldType()),
                     "Lens_Units": str(units["LensUnits"]),
-                    "Pupil_Grid": str(info[4].split(":")[-1].strip(" ").strip(".")),
-                    "Image_Grid": str(info[5].split(":")[-1].strip(" ").strip(".")),
+                    "Pupil_Grid": pupil_grid,
+                    "Image_Grid": image_grid,
                     "MCE_Configuration": int(self.MCE_GetCurrentConfig()),
                 },
             )
         )
-    self.MCE_SetActiveConfig(CURRENT_CONFIG)
     return xr.concat(out_list, dim="field", join="exact")
 
 
+def _Analysis_ThroughFocusSweep_(
+    self,
+    defocus_microns: list,
+    analysis: str,
+    analysis_kwargs: dict,
+    defocus_surface: int,
+) -> xr.Dataset:
+    """
+    Worker of :func:`Analyses_ThroughFocus` which runs an analysis for each defocus by changing the thickness of `defocus_surface`.
+
+    The configuration, wavelength, and field of the analysis are resolved once. The analysis is then run through its undecorated function
+    (no result cache or system preservation per defocus) in an :func:`_Analysis_Sweep_`, so each analysis object is opened and configured
+    on the first defocus, and only re-run for the others.
+    The thickness (and any solve on it) and the active configuration are restored afterwards.
+
+    :return: The analysis results concatenated along a 'defocus' dimension.
+    :rtype: xr.Dataset
+    """
+    defocus_microns = np.atleast_1d(np.asarray(defocus_microns, dtype=float))
+    analysis_kwargs = dict(analysis_kwargs)
+    configuration = analysis_kwargs.pop("configuration", None)
+    analysis_function = inspect.unwrap(getattr(type(self), f"Analyses_{analysis}"))
+    out_list = []
+    with self.System_Preserve(wavelengths=False, fields=False, config=True):
+        if configuration is not None:
+            self.MCE_SetActiveConfig(configuration)
+        wavelength = analysis_kwargs.get("wavelength", 0)
+        if not (isinstance(wavelength, int) and wavelength == 0):
+            analysis_kwargs["wavelength"] = int(
+                self._convert_raw_wavelength_input_(wavelength, return_index=True)
+            )
+        field = analysis_kwargs.get("field", 0)
+        if not (isinstance(field, int) and field == 0):
+            analysis_kwargs["field"] = int(
+                self._convert_raw_field_input_(field, return_index=True)
+            )
+        surface_obj = self.LDE_GetSurface(int(defocus_surface))
+        thickness_cell = surface_obj.ThicknessCell
+        thickness_solve = thickness_cell.GetSolveData()
+        nominal_thickness = float(surface_obj.Thickness)
+        microns_per_lens_unit = _MICROMETERS_PER_LENS_UNIT_.get(
+            str(self.Utilities_GetAllSystemUnits()["LensUnits"]), 1e3
+        )
+        try:
+            # A solve on the thickness would override the defocus.
+            thickness_cell.MakeSolveFixed()
+            with self.Analyses_Session(), self._Analysis_Sweep_():
+                for defocus_idx, defocus in enumerate(defocus_microns):
+                    if self._verbose:
+                        cp(
+                            f"!@lg!@Analyses_ThroughFocus :: Running [!@lm!@{analysis}!@lg!@] at defocus [!@lm!@{defocus:g}!@lg!@] um."
+                        )
+                    surface_obj.Thickness = (
+                        nominal_thickness + defocus / microns_per_lens_unit
+                    )
+                    self._System_MarkDirty_("LDE", int(defocus_surface))
+                    if defocus_idx > 0:
+                        self._Analysis_SweepReplay_()
+                    out_list.append(analysis_function(self, **analysis_kwargs))
+        finally:
+            surface_obj.Thickness = nominal_thickness
+            thickness_cell.SetSolveData(thickness_solve)
+            self._System_MarkDirty_("LDE", int(defocus_surface))
+    if any(x is None for x in out_list):
+        return None
+    return xr.concat(
+        out_list,
+        dim=xr.DataArray(
+            defocus_microns, dims="defocus", attrs={"units": "micrometers"}
+        ),
+        data_vars="all",
+        coords="minimal",
+        compat="override",
+        join="override",
+        combine_attrs="override",
+    )
+
+
+def Analyses_ThroughFocus(
+    self,
+    defocus_microns: np.ndarray | list,
+    analysis: str = "FFTPSF",
+    analysis_kwargs: dict | None = None,
+    defocus_surface: int | ZOSAPI_Editors_LDE_ILDERow | None = None,
+    metric_frequency: float | None = None,
+    depth_of_focus_fraction: float = 0.8,
+    number_of_workers: int = 1,
+) -> xr.Dataset:
+    """
+    Runs a PSF or MTF analysis through focus, for an array of focus offsets, and finds the best focus and depth of focus.
+
+    The focus is shifted by changing the thickness of the surface before the image surface (or `defocus_surface`), which is restored afterwards.
+    The analysis objects are opened and configured once, and only re-run for the other focus offsets (see :func:`_Analysis_ThroughFocusSweep_`).
+    The focus offsets are not looked up in, or stored to, the analysis results cache (see :func:`AnalysisCache_Enable`).
+
+    The focus metric is the peak of the PSF ('linear'), which is the Strehl ratio when the PSF is not normalized (the default here),
+    or the MTF 'modulation' at `metric_frequency`.
+
+    .. code-block:: python
+
+        through_focus = skZemax.Analyses_ThroughFocus(
+            np.linspace(-50, 50, 21), analysis="FFTMTF", analysis_kwargs={"wavelength": 1}, metric_frequency=50
+        )
+        through_focus.best_focus
+
+    :param defocus_microns: Focus offsets in micrometers.
+    :type defocus_microns: np.ndarray | list
+    :param analysis: The analysis to run through focus. 'FFTPSF', 'HuygensPSF', 'FFTMTF', or 'HuygensMTF', defaults to "FFTPSF"
+    :type analysis: str, optional
+    :param analysis_kwargs: Keyword arguments of the analysis (e.g. {"wavelength": 1} for :func:`Analyses_FFTPSF`), defaults to None
+    :type analysis_kwargs: dict | None, optional
+    :param defocus_surface: Surface (index or object) whose thickness is changed. If None the surface before the image surface is used, defaults to None
+    :type defocus_surface: int | ZOSAPI_Editors_LDE_ILDERow | None, optional
+    :param metric_frequency: Spatial frequency of the MTF focus metric. If None, half of the largest frequency of the analysis is used, defaults to None
+    :type metric_frequency: float | None, optional
+    :param depth_of_focus_fraction: Fraction of the best focus metric which bounds the depth of focus, defaults to 0.8
+    :type depth_of_focus_fraction: float, optional
+    :param number_of_workers: If more than 1, the focus offsets are split over this many worker OpticStudio instances (see :func:`Parallel_RunAnalyses`), defaults to 1
+    :type number_of_workers: int, optional
+    :return: The analysis results along a 'defocus' dimension, with the 'focus_metric', and the 'best_focus', 'best_focus_metric',
+             'depth_of_focus_lower', 'depth_of_focus_upper', and 'depth_of_focus'.
+    :rtype: xr.Dataset
+    """
+    metric_variables = {
+        "FFTPSF": "linear",
+        "HuygensPSF": "linear",
+        "FFTMTF": "modulation",
+        "HuygensMTF": "modulation",
+    }
+    if analysis not in metric_variables:
+        cp(
+            f"!@lr!@Analyses_ThroughFocus :: Unsupported analysis [!@lm!@{analysis}!@lr!@]. Use one of [!@lm!@{', '.join(metric_variables)}!@lr!@]."
+        )
+        return None
+    analysis_kwargs = dict(analysis_kwargs) if analysis_kwargs is not None else {}
+    # The worker split is over the focus offsets, so each analysis runs on its own.
+    analysis_kwargs.pop("number_of_workers", None)
+    if "PSF" in analysis:
+        analysis_kwargs.setdefault("use_normalization", False)
+        if analysis_kwargs["use_normalization"] and self._verbose:
+            cp(
+                "!@ly!@Analyses_ThroughFocus :: The PSFs are normalized to a peak of 1, so the focus metric is not meaningful."
+            )
+    if defocus_surface is None:
+        defocus_surface = self.LDE_GetNumberOfSurfaces() - 2
+    defocus_surface = self._convert_raw_surface_input_(
+        defocus_surface, return_index=True
+    )
+    defocus_microns = np.sort(np.atleast_1d(np.asarray(defocus_microns, dtype=float)))
+
+    if number_of_workers > 1 and defocus_microns.shape[0] > 1:
+        out = self.Parallel_RunAnalyses(
+            "_Analysis_ThroughFocusSweep_",
+            [
+                {
+                    "defocus_microns": x.tolist(),
+                    "analysis": analysis,
+                    "analysis_kwargs": analysis_kwargs,
+                    "defocus_surface": int(defocus_surface),
+                }
+                for x in np.array_split(
+                    defocus_microns, min(number_of_workers, defocus_microns.shape[0])
+                )
+            ],
+            number_of_workers=number_of_workers,
+        )
+        if any(x is None for x in out):
+            return None
+        out = xr.concat(
+            out,
+            dim="defocus",
+            data_vars="all",
+            coords="minimal",
+            compat="override",
+            join="override",
+            combine_attrs="override",
+        )
+    else:
+        out = self._Analysis_ThroughFocusSweep_(
+            defocus_microns, analysis, analysis_kwargs, defocus_surface
+        )
+    if out is None:
+        return None
+
+    if "PSF" in analysis:
+        metric = out[metric_variables[analysis]].max(("y", "x"))
+        metric_description = "Peak of the PSF"
+    else:
+        if metric_frequency is None:
+            metric_frequency = float(out.freq.max()) / 2
+        metric = out[metric_variables[analysis]].interp(freq=float(metric_frequency))
+        metric = metric.drop_vars("freq")
+        metric_description = f"MTF modulation at {float(metric_frequency):g} {out.freq.attrs.get('units', '')}".strip()
+    metric = metric.transpose(..., "defocus")
+    best_focus, best_metric, lower, upper, cut_off = (
+        self._Analysis_BestFocusAndDepthOfFocus_(
+            defocus_microns, metric.values, float(depth_of_focus_fraction)
+        )
+    )
+    if cut_off and self._verbose:
+        cp(
+            "!@ly!@Analyses_ThroughFocus :: The depth of focus reaches the end of the defocus range for some fields. Widen the range for the full depth of focus."
+        )
+    dims = metric.dims[:-1]
+    units = {"units": "micrometers"}
+    return out.assign(
+        focus_metric=metric,
+        best_focus=(dims, best_focus, units),
+        best_focus_metric=(dims, best_metric),
+        depth_of_focus_lower=(dims, lower, units),
+        depth_of_focus_upper=(dims, upper, units),
+        depth_of_focus=(dims, upper - lower, units),
+    ).assign_attrs(
+        {
+            "Through_Focus_Analysis": str(analysis),
+            "Focus_Metric": metric_description,
+            "Defocus_Surface": int(defocus_surface),
+            "Depth_Of_Focus_Fraction": float(depth_of_focus_fraction),
+        }
+    )
+
+
 def Analyses_ImageSimulation(
     self,
     input_image_full_path: str = None,
@@ -1494,7 +2649,10 @@ def Analyses_ImageSimulation(
     oversampling: int = None,  # 2, 4, 8, 16, 32, 64
     gaurdband: int = None,  # 2, 4, 8, 16, 32, 64
     abberations: str = "diffraction",  # None, geometric, diffraciton
+    output_zarr_path: str | None = None,
 ):
+    # If output_zarr_path is given, each simulated image is written to a Zarr store as it is produced and the input image is
+    # only referenced by path (not loaded), so memory holds one simulated image at a time. See ImageSimulation_Convolve().
     # TODO add flipping and rotation, and add field selection (maybe)
     # TODO add polychormatics image simulation
 
@@ -1505,11 +2663,6 @@ def Analyses_ImageSimulation(
     else:
         wavelengths = np.arange(1, self.Wavelength_GetNumberOfWavelengths() + 1)
 
-    # Always have the field be the optical axis
-    field = self._convert_raw_field_input_(
-        self.Fields_AddField(0, 0), return_index=True
-    )
-
     # Load image for storage in xarray. Need to flipud to both make nice in xarray plot
     if input_image_full_path is None:
         input_image_full_path = (
@@ -1520,19 +2673,22 @@ def Analyses_ImageSimulation(
         IMAGE_GIVEN = False
     else:
         IMAGE_GIVEN = True
-    img = Image.open(input_image_full_path)
-    input_image_rgb = np.flipud(np.array(img.convert("RGB")))
-    input_image_mono = np.flipud(np.array(img.convert("L")))
+    if output_zarr_path is None:
+        img = Image.open(input_image_full_path)
+        input_image_rgb = np.flipud(np.array(img.convert("RGB")))
+        input_image_mono = np.flipud(np.array(img.convert("L")))
 
     if IMAGE_GIVEN:
         # Copy the given image to where Zemax can find it.
         zemax_input_image_file_path = shutil.copy(
             input_image_full_path, self.Utilities_ZemaxInstallationImageDir()
         )
+    else:
+        zemax_input_image_file_path = input_image_full_path
 
     if field_height is None:
         # Assign such that the image matches the input field/size to fill the detector - based on paraxial magnifcation (values are rounded for this paraixal reason)
-        lens_data = self.Analyses_GetGeneralLensData()
+        lens_data = self.System_GetFirstOrderData()
         if "height" in self.Field_GetFieldType().lower():
             field_height = np.round(
                 np.abs(
@@ -1548,7 +2704,7 @@ def Analyses_ImageSimulation(
                 np.rad2deg(
                     np.arctan(
                         lens_data.EntrancePupilDiameter
-                        / (2 * lens_data.EffectiveFocalLengthInImageSpace)
+                        / (2 * lens_data.EffectiveFocalLength)
                     )
                 ),
                 2,
@@ -1565,6 +2721,9 @@ def Analyses_ImageSimulation(
         analysis_obj, analysis_settings_obj, analysis_enum = (
             self._Analysis_GetZOSObjectAndSettings_(analysis="ImageSimulation")
         )
+        # The settings are edited directly below, so start from the defaults and drop the record of the applied settings.
+        self._Analysis_ResetZOSObjectSettings_(analysis_settings_obj, analysis_enum)
+        self._Analysis_ForgetAppliedSettings_(analysis_settings_obj)
         analysis_settings_obj = analysis_settings_obj.__implementation__
         analysis_settings_obj.InputFile = str(
             zemax_input_image_file_path.split(os.sep)[-1]
@@ -1626,6 +2785,7 @@ def Analyses_ImageSimulation(
             self.Utilities_ZemaxInstallationImageDir() + os.sep + "TEMP.png"
         )
         analysis_obj.ApplyAndWaitForCompletion()
+        self._Analysis_ReleaseZOSObject_(analysis_obj)
         sim_image = np.flipud(
             np.array(
                 Image.open(
@@ -1636,11 +2796,70 @@ def Analyses_ImageSimulation(
         os.remove(self.Utilities_ZemaxInstallationImageDir() + os.sep + "TEMP.png")
         return sim_image
 
-    sim_images = []
-    for wvln in wavelengths:
-        sim_images.append(_do_sim_(wvln))
-    # Removed added on-axis field
-    self.Field_DeleteField(field)
+    coords = {
+        "x": (
+            ("x"),
+            np.arange(0, number_of_pixels_x).astype(int) * pixel_pitch_mm,
+            {"units": "mm"},
+        ),
+        "image_x": (
+            ("x"),
+            np.arange(0, number_of_pixels_x).astype(int),
+            {"units": "pixels"},
+        ),
+        "y": (
+            ("y"),
+            np.arange(0, number_of_pixels_y).astype(int) * pixel_pitch_mm,
+            {"units": "mm"},
+        ),
+        "image_y": (
+            ("y"),
+            np.arange(0, number_of_pixels_y).astype(int),
+            {"units": "pixelsmm"},
+        ),
+        "wavelength": (
+            ("wavelength"),
+            np.array(
+                [self.Wavelength_GetWavelength(x).Wavelength for x in wavelengths]
+            ).astype(float),
+            {"units": "micrometers"},
+        ),
+    }
+    attrs = {
+        "Input_Image_Path": str(input_image_full_path),
+    }
+    if output_zarr_path is not None:
+        store = self._ImageSimulation_CreateZarrStore_(
+            output_zarr_path,
+            {
+                "sim_image_mono": (
+                    ("wavelength", "y", "x"),
+                    (len(wavelengths), number_of_pixels_y, number_of_pixels_x),
+                    (1, number_of_pixels_y, number_of_pixels_x),
+                )
+            },
+            coords,
+            attrs,
+        )
+
+    # Always have the field be the optical axis. The added field is removed on exit.
+    with self.System_Preserve(wavelengths=False, fields=True, config=False):
+        field = self._convert_raw_field_input_(
+            self.Fields_AddField(0, 0), return_index=True
+        )
+        if output_zarr_path is None:
+            sim_images = [_do_sim_(wvln) for wvln in wavelengths]
+        elif store is not None:
+            for wvln_idx, wvln in enumerate(wavelengths):
+                store["sim_image_mono"][wvln_idx] = _do_sim_(wvln)
+
+    if output_zarr_path is not None:
+        if IMAGE_GIVEN:
+            os.remove(zemax_input_image_file_path)
+        if store is None:
+            return None
+        return xr.open_zarr(output_zarr_path, chunks=None, consolidated=False)
+
     # Make xarray output
     out = xr.Dataset(
         {
@@ -1668,37 +2887,9 @@ def Analyses_ImageSimulation(
                 np.arange(0, input_image_mono.shape[0]).astype(int),
                 {"units": "pixels"},
             ),
-            "x": (
-                ("x"),
-                np.arange(0, number_of_pixels_x).astype(int) * pixel_pitch_mm,
-                {"units": "mm"},
-            ),
-            "image_x": (
-                ("x"),
-                np.arange(0, number_of_pixels_x).astype(int),
-                {"units": "pixels"},
-            ),
-            "y": (
-                ("y"),
-                np.arange(0, number_of_pixels_y).astype(int) * pixel_pitch_mm,
-                {"units": "mm"},
-            ),
-            "image_y": (
-                ("y"),
-                np.arange(0, number_of_pixels_y).astype(int),
-                {"units": "pixelsmm"},
-            ),
-            "wavelength": (
-                ("wavelength"),
-                np.array(
-                    [self.Wavelength_GetWavelength(x).Wavelength for x in wavelengths]
-                ).astype(float),
-                {"units": "micrometers"},
-            ),
-        },
-        attrs={
-            "Input_Image_Path": str(input_image_full_path),
+            **coords,
         },
+        attrs=attrs,
     )
 
     if IMAGE_GIVEN:
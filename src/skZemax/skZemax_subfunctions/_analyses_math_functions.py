@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import numpy as np
+
+# NumPy post-processing of analysis results. Nothing here needs the ZOS-API, so the module can be used (and tested) without OpticStudio.
+
+
+def _Analysis_SquareWaveFromMTF_(
+    self, freq: np.ndarray, mtf: np.ndarray, axis: int = -1
+) -> np.ndarray:
+    """
+    Computes the square wave response from the (sine wave) MTF through the Coltman series:
+
+        S(f) = 4/pi * [ M(f) - M(3f)/3 + M(5f)/5 - M(7f)/7 + ... ]
+
+    M(kf) is linearly interpolated on the frequency grid and taken to be zero beyond the largest frequency.
+    At zero frequency the series sums to M(0).
+
+    :param freq: Spatial frequencies (ascending, starting at or above 0).
+    :type freq: np.ndarray
+    :param mtf: MTF values. The frequency axis is given by `axis`.
+    :type mtf: np.ndarray
+    :param axis: Axis of `mtf` which corresponds to `freq`, defaults to -1
+    :type axis: int, optional
+    :return: The square wave response, same shape as `mtf`.
+    :rtype: np.ndarray
+    """
+    freq = np.asarray(freq, dtype=float)
+    mtf = np.moveaxis(np.asarray(mtf, dtype=float), axis, -1)
+    flat_mtf = mtf.reshape(-1, freq.size)
+    out = np.zeros_like(flat_mtf)
+    nonzero = freq > 0
+    max_order = int(np.floor(freq[-1] / freq[nonzero].min())) if nonzero.any() else 0
+    for order in range(1, max_order + 1, 2):
+        sign = 1.0 if (order // 2) % 2 == 0 else -1.0
+        harmonic = order * freq[nonzero]
+        in_range = harmonic <= freq[-1]
+        if not in_range.any():
+            break
+        for row in range(flat_mtf.shape[0]):
+            out[row, nonzero] += (
+                sign
+                * np.interp(harmonic, freq, flat_mtf[row], right=0.0)
+                * in_range
+                / order
+            )
+    out[:, nonzero] *= 4.0 / np.pi
+    out[:, ~nonzero] = flat_mtf[:, ~nonzero]
+    return np.moveaxis(out.reshape(mtf.shape), -1, axis)
+
+
+def _Analysis_BestFocusAndDepthOfFocus_(
+    self, defocus: np.ndarray, metric: np.ndarray, fraction: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, bool]:
+    """
+    Worker of :func:`Analyses_ThroughFocus` which finds the best focus and depth of focus of a focus metric (larger is better).
+
+    The best focus is the vertex of a parabola through the best sample and its neighbours. The depth of focus is the contiguous range around it
+    where the metric is at least `fraction` of its best value, with the edges linearly interpolated between the samples and the vertex.
+
+    :param defocus: Defocus values (ascending).
+    :type defocus: np.ndarray
+    :param metric: Focus metric with the defocus as the last axis.
+    :type metric: np.ndarray
+    :param fraction: Fraction of the best metric which bounds the depth of focus.
+    :type fraction: float
+    :return: The best focus, the metric at it, the lower and upper edges of the depth of focus, and if any range was cut off by the end of the sweep.
+    :rtype: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, bool]
+    """
+    flat = metric.reshape(-1, metric.shape[-1])
+    best_focus = np.full(flat.shape[0], np.nan)
+    best_metric = np.full(flat.shape[0], np.nan)
+    lower = np.full(flat.shape[0], np.nan)
+    upper = np.full(flat.shape[0], np.nan)
+    cut_off = False
+    for idx, values in enumerate(flat):
+        if not np.any(np.isfinite(values)):
+            continue
+        peak = int(np.nanargmax(values))
+        best_focus[idx], best_metric[idx] = defocus[peak], values[peak]
+        if 0 < peak < values.shape[0] - 1:
+            a, b, c = np.polyfit(
+                defocus[peak - 1 : peak + 2], values[peak - 1 : peak + 2], 2
+            )
+            if a < 0:
+                best_focus[idx] = -b / (2 * a)
+                best_metric[idx] = c - b**2 / (4 * a)
+        # The edges are searched on the samples with the best focus added as a point, so they bracket it even if the
+        # threshold (from the fitted vertex) is above the best sample.
+        vertex = int(np.searchsorted(defocus, best_focus[idx]))
+        curve_defocus = np.insert(defocus, vertex, best_focus[idx])
+        curve_values = np.insert(values, vertex, best_metric[idx])
+        threshold = min(fraction * best_metric[idx], best_metric[idx])
+        below = np.flatnonzero(curve_values[:vertex] < threshold)
+        if below.shape[0] > 0:
+            i = below[-1]
+            lower[idx] = np.interp(
+                threshold, curve_values[i : i + 2], curve_defocus[i : i + 2]
+            )
+        else:
+            lower[idx], cut_off = defocus[0], True
+        above = np.flatnonzero(curve_values[vertex:] < threshold)
+        if above.shape[0] > 0:
+            i = vertex + above[0]
+            upper[idx] = np.interp(
+                threshold,
+                curve_values[i - 1 : i + 1][::-1],
+                curve_defocus[i - 1 : i + 1][::-1],
+            )
+        else:
+            upper[idx], cut_off = defocus[-1], True
+    shape = metric.shape[:-1]
+    return (
+        best_focus.reshape(shape),
+        best_metric.reshape(shape),
+        lower.reshape(shape),
+        upper.reshape(shape),
+        cut_off,
+    )
+
+
+def _Analysis_PsfLog_(self, linear: np.ndarray, decades: int) -> np.ndarray:
+    """
+    Worker of the single pass mode of :func:`Analyses_FFTPSF` and :func:`Analyses_HuygensPSF` which computes a log view of a linear PSF:
+    the log10 of the PSF relative to its peak, floored at 10^-decades (as the OpticStudio 'Log -N' PSF views).
+
+    :param linear: The linear PSF.
+    :type linear: np.ndarray
+    :param decades: Number of decades below the peak at which the log view is floored.
+    :type decades: int
+    :return: The log view, between -decades and 0.
+    :rtype: np.ndarray
+    """
+    peak = np.nanmax(linear)
+    relative = linear / peak if peak > 0 else linear
+    return np.log10(np.maximum(relative, 10.0**-decades))
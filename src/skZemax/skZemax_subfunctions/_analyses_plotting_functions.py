@@ -7,6 +7,8 @@ import numpy as np
 import xarray as xr
 from matplotlib.patches import Ellipse
 
+from skZemax.skZemax_subfunctions._c_print import c_print as cp
+
 
 def get_colormap(
     num_lines: int, should_reverse: bool = False, cmap_type="viridis"
@@ -80,3 +82,45 @@ def AnalysisPlotting_Footprint(
     ax.set_ylim(
         (in_footprint_xarray.y_min.min().item(), in_footprint_xarray.y_max.max().item())
     )
+
+
+def AnalysisPlotting_FootprintRays(
+    self,
+    in_footprint_xarray: xr.Dataset,
+    ax: plt.Axes = None,
+    color_by_idx: int = 0,
+    marker_size: float = 1,
+) -> None:
+    """
+    This function plots the ray hits of the output of :func:`Analyses_FootprintFromRayTrace` (with keep_rays=True), showing the real footprint shapes.
+
+    :param in_footprint_xarray: Output of :func:`Analyses_FootprintFromRayTrace`.
+    :type in_footprint_xarray: xr.Dataset
+    :param ax: axis to put the footprint plot on, defaults to None (makes a new plot)
+    :type ax: plt.Axes, optional
+    :param color_by_idx: How to color the footprint plot. 0=configuration, 1=wavelength, 2=field, defaults to 0
+    :type color_by_idx: int, optional
+    :param marker_size: Size of the ray markers, defaults to 1
+    :type marker_size: float, optional
+    """
+    if "ray_x" not in in_footprint_xarray:
+        cp(
+            "!@lr!@AnalysisPlotting_FootprintRays :: Needs the output of Analyses_FootprintFromRayTrace with keep_rays=True."
+        )
+        return
+    if ax is None:
+        plt.figure()
+        ax = plt.gca()
+    color_dim = ["conf", "wvln", "fld"][int(color_by_idx)]
+    cmap = get_colormap(in_footprint_xarray[color_dim].shape[0])
+    for idx in range(in_footprint_xarray[color_dim].shape[0]):
+        at_settings = in_footprint_xarray.isel({color_dim: idx})
+        ax.scatter(
+            at_settings.ray_x.values.ravel(),
+            at_settings.ray_y.values.ravel(),
+            s=marker_size,
+            color=cmap[idx],
+        )
+    ax.set_aspect("equal")
+    ax.set_xlabel(f"X [{in_footprint_xarray.attrs.get('Lens_Units', '')}]")
+    ax.set_ylabel(f"Y [{in_footprint_xarray.attrs.get('Lens_Units', '')}]")
@@ -0,0 +1,493 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+import xarray as xr
+from box import Box
+
+from skZemax.skZemax_subfunctions._c_print import c_print as cp
+
+# Section headers of the prescription report are upper case lines ending in a colon, e.g. "SURFACE DATA SUMMARY:".
+_REPORT_SECTION_HEADER_ = re.compile(r"^[A-Z][A-Z0-9 ,/#&\-\(\)\.]*:$")
+# Sub-section headers of the surface prescription report are lines ending in a colon (without the trailing space of empty values), e.g. "Edge Thickness:".
+_REPORT_SUBSECTION_HEADER_ = re.compile(r"^[A-Za-z][^:\t]*:$")
+# Name of the lines before the first section header.
+_REPORT_PREAMBLE_ = "PREAMBLE"
+
+
+def _AnalysisReport_IterLines_(in_file: str | Path | list) -> Iterator[str]:
+    """
+    Streams the non-empty lines of a text report OpticStudio wrote with GetTextFile().
+    The encoding is taken from the byte order mark (OpticStudio writes UTF-16), so the file is decoded once and never held in memory as a whole.
+
+    :param in_file: Path to the text file, or a list of lines (passed through).
+    :type in_file: str | Path | list
+    :return: Iterator over the lines, without line endings.
+    :rtype: Iterator[str]
+    """
+    if isinstance(in_file, list):
+        yield from (x.rstrip("\r\n") for x in in_file if len(x.strip()) > 0)
+        return
+    with open(in_file, "rb") as file:
+        start = file.read(4)
+    if start[:2] in [b"\xff\xfe", b"\xfe\xff"]:
+        encoding = "utf-16"
+    elif start[:3] == b"\xef\xbb\xbf":
+        encoding = "utf-8-sig"
+    elif len(start) > 1 and start[1:2] == b"\x00":
+        encoding = "utf-16-le"
+    else:
+        encoding = "utf-8"
+    with open(in_file, encoding=encoding, errors="replace") as file:
+        for line in file:
+            line = line.rstrip("\r\n").replace("\x00", "")
+            if len(line.strip()) > 0:
+                yield line
+
+
+def _AnalysisReport_ToNumber_(in_value: str) -> float | None:
+    """
+    Converts a report value to a float ("Infinity" is inf, an empty value is nan). Returns None if the value is not a number.
+
+    :param in_value: The report value.
+    :type in_value: str
+    :return: The value as a float, or None.
+    :rtype: float | None
+    """
+    in_value = in_value.strip()
+    if len(in_value) == 0:
+        return np.nan
+    if in_value.lower() in ["infinity", "inf"]:
+        return np.inf
+    if in_value.lower() in ["-infinity", "-inf"]:
+        return -np.inf
+    try:
+        return float(in_value)
+    except ValueError:
+        return None
+
+
+def _AnalysisReport_VariableName_(in_name: str) -> str:
+    """
+    Converts a report column name to a variable name, e.g. "Clear Diam" -> "clear_diam".
+
+    :param in_name: Column name.
+    :type in_name: str
+    :return: Lower case variable name.
+    :rtype: str
+    """
+    return re.sub(r"[^0-9a-z]+", "_", in_name.strip().lower()).strip("_")
+
+
+def _AnalysisReport_ParseKeyValue_(in_key: str, in_value: str) -> tuple:
+    """
+    Formats one "key : value" line of a report the way :func:`Analyses_GetGeneralLensData` does:
+    keys are title-cased without spaces and values are converted to int, float, or bool (On/Off) where possible.
+
+    :param in_key: The text before the colon.
+    :type in_key: str
+    :param in_value: The text after the colon.
+    :type in_value: str
+    :return: (key, value)
+    :rtype: tuple
+    """
+    in_key = in_key.strip().title().replace(" ", "")
+    in_value = in_value.replace("\t", "").strip()
+    if in_key == "EffectiveFocalLength":
+        # Handle the special case of EFL having two entries with description in the values
+        in_key += in_value.split("(")[-1].strip(")").title().replace(" ", "")
+        in_value = in_value.split("(")[0]
+    try:
+        return in_key, int(in_value)
+    except ValueError:
+        try:
+            return in_key, float(in_value)
+        except ValueError:
+            if in_value.lower() == "on":
+                return in_key, True
+            elif in_value.lower() == "off":
+                return in_key, False
+            else:
+                return in_key, in_value
+
+
+def _AnalysisReport_ParseTable_(lines: list, first_column: str = "Surf") -> tuple:
+    """
+    Parses the first tab separated table of a report section, whose header line starts with `first_column`.
+    Cells beyond the header's columns (e.g. the trailing tab or a note after the last column) are dropped.
+    The table ends at the first line without a first cell, or without tab separated cells.
+
+    :param lines: Lines of the report section.
+    :type lines: list
+    :param first_column: Name of the first column of the header, defaults to "Surf"
+    :type first_column: str, optional
+    :return: (list of column names, list of rows), each row a list of stripped strings. ([], []) if there is no table.
+    :rtype: tuple
+    """
+    header_idx = next(
+        (
+            idx
+            for idx, line in enumerate(lines)
+            if line.strip().split("\t")[0].strip() == first_column
+        ),
+        None,
+    )
+    if header_idx is None:
+        return [], []
+    columns = [x.strip() for x in lines[header_idx].split("\t")]
+    rows = []
+    for line in lines[header_idx + 1 :]:
+        row = [x.strip() for x in line.split("\t")]
+        if len(row) < 2 or len(row[0]) == 0:
+            break
+        rows.append((row + [""] * len(columns))[0 : len(columns)])
+    return columns, rows
+
+
+def _AnalysisReport_SurfaceDataSummary_(lines: list) -> xr.Dataset:
+    """
+    Parses the SURFACE DATA SUMMARY section of the prescription report.
+
+    :param lines: Lines of the section.
+    :type lines: list
+    :return: Dataset of every column on 'surf' (numeric columns as floats, the rest as strings).
+    :rtype: xr.Dataset
+    """
+    columns, rows = _AnalysisReport_ParseTable_(lines, first_column="Surf")
+    if len(rows) == 0:
+        return None
+    table = np.array(rows, dtype=object)
+    out = {"surf_label": ("surf", table[:, 0].astype(str))}
+    for idx, name in enumerate(columns[1:], start=1):
+        numbers = [_AnalysisReport_ToNumber_(x) for x in table[:, idx]]
+        if all(x is not None for x in numbers):
+            out[_AnalysisReport_VariableName_(name)] = (
+                "surf",
+                np.array(numbers, dtype=float),
+            )
+        else:
+            out[_AnalysisReport_VariableName_(name)] = (
+                "surf",
+                table[:, idx].astype(str),
+            )
+    return xr.Dataset(out, coords={"surf": ("surf", np.arange(table.shape[0]))})
+
+
+def _AnalysisReport_IndexOfRefraction_(lines: list) -> xr.Dataset:
+    """
+    Parses the INDEX OF REFRACTION DATA section of the prescription report.
+
+    :param lines: Lines of the section.
+    :type lines: list
+    :return: Dataset of the 'index' on (surf, wvln), and the 'glass', 'temperature' and 'pressure' on 'surf'.
+    :rtype: xr.Dataset
+    """
+    columns, rows = _AnalysisReport_ParseTable_(lines, first_column="Surf")
+    if len(rows) == 0:
+        return None
+    # The wavelength columns are the ones whose header is a number (the wavelength in microns).
+    column_numbers = [_AnalysisReport_ToNumber_(x) for x in columns]
+    wavelength_columns = [
+        idx
+        for idx, number in enumerate(column_numbers)
+        if idx > 0 and number is not None and np.isfinite(number)
+    ]
+    table = np.array(rows, dtype=object)
+    out = {
+        "index": (
+            ("surf", "wvln"),
+            np.array(
+                [
+                    [
+                        np.nan if value is None else value
+                        for value in map(_AnalysisReport_ToNumber_, row)
+                    ]
+                    for row in table[:, wavelength_columns]
+                ],
+                dtype=float,
+            ),
+        )
+    }
+    for idx, name in enumerate(columns[1:], start=1):
+        if idx in wavelength_columns:
+            continue
+        variable = {"temp": "temperature", "pres": "pressure"}.get(
+            _AnalysisReport_VariableName_(name), _AnalysisReport_VariableName_(name)
+        )
+        numbers = [_AnalysisReport_ToNumber_(x) for x in table[:, idx]]
+        if variable != "glass" and all(x is not None for x in numbers):
+            out[variable] = ("surf", np.array(numbers, dtype=float))
+        else:
+            out[variable] = ("surf", table[:, idx].astype(str))
+    return xr.Dataset(
+        out,
+        coords={
+            "surf": ("surf", np.array([int(x) for x in table[:, 0]])),
+            "wavelengths": (
+                "wvln",
+                np.array([column_numbers[x] for x in wavelength_columns]),
+                {"units": "microns"},
+            ),
+        },
+    )
+
+
+def _AnalysisReport_GlobalVertex_(lines: list) -> xr.Dataset:
+    """
+    Parses the GLOBAL VERTEX COORDINATES, ORIENTATIONS, AND ROTATION/OFFSET MATRICES section of the prescription report.
+    Every surface is listed as three rows of [R_i1, R_i2, R_i3, offset_i], the first row led by the surface number.
+    Newer versions of OpticStudio follow each row with the tilt about the axis, and the first row with the surface comment. These are skipped.
+
+    :param lines: Lines of the section.
+    :type lines: list
+    :return: Dataset of the 'rotation' matrix on (surf, row, col) and the 'vertex' on (surf, axis).
+    :rtype: xr.Dataset
+    """
+    reference_surface = None
+    surfaces, values = [], []
+    for line in lines:
+        if line.strip().lower().startswith("reference surface"):
+            reference_surface = _AnalysisReport_ToNumber_(line.split(":", 1)[-1])
+            continue
+        parts = [x.strip() for x in line.split("\t")]
+        numbers = [_AnalysisReport_ToNumber_(x) for x in parts[1:5]]
+        if len(numbers) != 4 or any(x is None or np.isnan(x) for x in numbers):
+            continue
+        if len(parts[0]) > 0:
+            surface = _AnalysisReport_ToNumber_(parts[0])
+            if surface is None:
+                continue
+            surfaces.append(int(surface))
+            values.append([numbers])
+        elif len(values) > 0 and len(values[-1]) < 3:
+            values[-1].append(numbers)
+    complete = [idx for idx, x in enumerate(values) if len(x) == 3]
+    if len(complete) == 0:
+        return None
+    matrices = np.array([values[x] for x in complete], dtype=float)
+    return xr.Dataset(
+        {
+            "rotation": (("surf", "row", "col"), matrices[:, :, 0:3]),
+            "vertex": (("surf", "axis"), matrices[:, :, 3]),
+        },
+        coords={
+            "surf": ("surf", np.array([surfaces[x] for x in complete])),
+            "row": ("row", np.arange(1, 4)),
+            "col": ("col", np.arange(1, 4)),
+            "axis": ("axis", np.array(["x", "y", "z"])),
+        },
+        attrs={
+            "Reference_Surface": int(reference_surface)
+            if reference_surface is not None and np.isfinite(reference_surface)
+            else -1
+        },
+    )
+
+
+def _AnalysisReport_ElementVolume_(lines: list) -> xr.Dataset:
+    """
+    Parses the ELEMENT VOLUME DATA section of the prescription report.
+
+    :param lines: Lines of the section.
+    :type lines: list
+    :return: Dataset of the 'first_surface', 'last_surface', 'volume_cc', 'density_g_per_cc', and 'mass_g' on 'element'.
+    :rtype: xr.Dataset
+    """
+    element_line = re.compile(r"element\s+surf\s+(\d+)\s+to\s+(\d+)(.*)", re.IGNORECASE)
+    rows = []
+    total_mass = np.nan
+    for line in lines:
+        match = element_line.search(line)
+        if match is not None:
+            # Volume, density, and mass. Missing values are nan.
+            numbers = [_AnalysisReport_ToNumber_(x) for x in match.group(3).split()]
+            numbers = [np.nan if x is None else x for x in numbers] + [np.nan] * 3
+            rows.append([float(match.group(1)), float(match.group(2))] + numbers[0:3])
+        elif line.strip().lower().startswith("total mass"):
+            total_mass = _AnalysisReport_ToNumber_(line.split(":", 1)[-1])
+    if len(rows) == 0:
+        return None
+    rows = np.array(rows, dtype=float)
+    return xr.Dataset(
+        {
+            "first_surface": ("element", rows[:, 0].astype(int)),
+            "last_surface": ("element", rows[:, 1].astype(int)),
+            "volume_cc": ("element", rows[:, 2]),
+            "density_g_per_cc": ("element", rows[:, 3]),
+            "mass_g": ("element", rows[:, 4]),
+        },
+        coords={"element": ("element", np.arange(1, rows.shape[0] + 1))},
+        attrs={"Total_Mass_g": np.nan if total_mass is None else float(total_mass)},
+    )
+
+
+@staticmethod
+def AnalysisReport_IndexSections(
+    in_file: str | Path | list, sections: list[str] | None = None
+) -> Box:
+    """
+    Reads a text report (e.g. from :func:`Analyses_ReportSystemPrescription`) once, streaming it line by line, and indexes it by section.
+    Sections start at upper case header lines ending in a colon (e.g. "SURFACE DATA SUMMARY:"). Lines before the first header are under "PREAMBLE".
+
+    Unlike :func:`Analyses_ExtractSectionOfTextFile`, which rescans the file for every section, all sections are found in one pass.
+
+    :param in_file: Path to the text file, or a list of its lines.
+    :type in_file: str | Path | list
+    :param sections: If given, only these sections (case insensitive, without the colon) are kept, defaults to None (all)
+    :type sections: list[str] | None, optional
+    :return: dict[section name] = list of lines of the section (without the header).
+    :rtype: Box
+    """
+    wanted = None if sections is None else [x.strip(" :").upper() for x in sections]
+    out = Box({}, box_dots=False)
+    current = _REPORT_PREAMBLE_
+    for line in _AnalysisReport_IterLines_(in_file):
+        if _REPORT_SECTION_HEADER_.match(line.rstrip()):
+            current = line.rstrip()[:-1].strip()
+            if (wanted is None or current in wanted) and current not in out:
+                out[current] = []
+            continue
+        if current in out or (current == _REPORT_PREAMBLE_ and wanted is None):
+            out.setdefault(current, []).append(line)
+    if wanted is not None:
+        for name in [x for x in wanted if x not in out]:
+            cp(
+                f"!@ly!@AnalysisReport_IndexSections :: Section [!@lm!@{name}!@ly!@] not found in report."
+            )
+    return out
+
+
+@staticmethod
+def AnalysisReport_ParseGeneralLensData(lines: list) -> Box:
+    """
+    Parses the lines of the GENERAL LENS DATA section of the prescription report (see :func:`AnalysisReport_IndexSections`)
+    into a boxed dict, the same as :func:`Analyses_GetGeneralLensData`.
+
+    :param lines: Lines of the GENERAL LENS DATA section.
+    :type lines: list
+    :return: dict[quantity] = value, keys sorted alphabetically.
+    :rtype: Box
+    """
+    general_data = []
+    for line in lines:
+        if "fields" in line.lower():
+            break
+        general_data.append(line)
+    return Box(
+        dict(
+            sorted(  # Sort keys alphabetically
+                (
+                    _AnalysisReport_ParseKeyValue_(key, value)
+                    for key, value in (
+                        line.split(":", 1) for line in general_data[:-1] if ":" in line
+                    )
+                )
+            )
+        )
+    )
+
+
+@staticmethod
+def AnalysisReport_ParsePrescription(in_file: str | Path | list) -> Box:
+    """
+    Parses a system prescription report (see :func:`Analyses_ReportSystemPrescription`) in one streaming pass into structured data:
+
+    - general_lens_data
+        Box of the GENERAL LENS DATA section (see :func:`Analyses_GetGeneralLensData`).
+    - surface_data
+        xr.Dataset of the SURFACE DATA SUMMARY table on 'surf'.
+    - index_of_refraction
+        xr.Dataset of the INDEX OF REFRACTION DATA table on (surf, wvln).
+    - global_vertex
+        xr.Dataset of the rotation matrices and vertex coordinates of the GLOBAL VERTEX COORDINATES section.
+    - element_volume
+        xr.Dataset of the ELEMENT VOLUME DATA table on 'element'.
+    - sections
+        Box of the lines of every section, for anything not parsed above.
+
+    Sections missing from the report (e.g. not computed for the system) are None.
+
+    :param in_file: Path to the text file, or a list of its lines.
+    :type in_file: str | Path | list
+    :return: The parsed report.
+    :rtype: Box
+    """
+    sections = AnalysisReport_IndexSections(in_file)
+
+    def _section_(start: str) -> list | None:
+        name = next((x for x in sections if x.startswith(start)), None)
+        return None if name is None else sections[name]
+
+    def _parse_(start: str, parser):
+        lines = _section_(start)
+        return None if lines is None else parser(lines)
+
+    return Box(
+        {
+            "general_lens_data": _parse_(
+                "GENERAL LENS DATA", AnalysisReport_ParseGeneralLensData
+            ),
+            "surface_data": _parse_(
+                "SURFACE DATA SUMMARY", _AnalysisReport_SurfaceDataSummary_
+            ),
+            "index_of_refraction": _parse_(
+                "INDEX OF REFRACTION DATA", _AnalysisReport_IndexOfRefraction_
+            ),
+            "global_vertex": _parse_(
+                "GLOBAL VERTEX COORDINATES", _AnalysisReport_GlobalVertex_
+            ),
+            "element_volume": _parse_(
+                "ELEMENT VOLUME DATA", _AnalysisReport_ElementVolume_
+            ),
+            "sections": sections,
+        },
+        box_dots=False,
+    )
+
+
+@staticmethod
+def AnalysisReport_ParseSurfacePrescription(in_file: str | Path | list) -> Box:
+    """
+    Parses a surface prescription report (see :func:`Analyses_ReportSurfacePrescription`) in one streaming pass.
+    "key : value" lines become entries of a boxed dict (formatted as in :func:`Analyses_GetGeneralLensData`), grouped under their
+    sub-section (e.g. 'EdgeThickness', 'SurfacePowers(AsSituated)'). The index of refraction table is returned as an xr.Dataset under 'IndexOfRefraction.index'.
+
+    :param in_file: Path to the text file, or a list of its lines.
+    :type in_file: str | Path | list
+    :return: The parsed report.
+    :rtype: Box
+    """
+    out = Box({}, box_dots=False)
+    current = out
+    index_rows = []
+    for line in _AnalysisReport_IterLines_(in_file):
+        stripped = line.strip()
+        if _REPORT_SUBSECTION_HEADER_.match(line):
+            current = out.setdefault(
+                stripped[:-1].strip().title().replace(" ", ""), Box({}, box_dots=False)
+            )
+            continue
+        if stripped.startswith("#"):
+            continue
+        numbers = [_AnalysisReport_ToNumber_(x) for x in stripped.split()]
+        if len(numbers) == 3 and all(x is not None for x in numbers):
+            # Row of the index of refraction table: number, wavelength, index
+            index_rows.append(numbers)
+            continue
+        if ":" in line:
+            key, value = _AnalysisReport_ParseKeyValue_(*line.split(":", 1))
+            current[key] = value
+    if len(index_rows) > 0:
+        index_rows = np.array(index_rows, dtype=float)
+        out.setdefault("IndexOfRefraction", Box({}, box_dots=False))["index"] = (
+            xr.Dataset(
+                {"index": ("wvln", index_rows[:, 2])},
+                coords={
+                    "wavelengths": ("wvln", index_rows[:, 1], {"units": "microns"})
+                },
+            )
+        )
+    return out
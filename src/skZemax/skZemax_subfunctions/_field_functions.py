@@ -64,6 +64,7 @@ def Field_DeleteField(self, in_field: int | ZOSAPI_SystemData_IField) -> None:
     :type in_field: Union[int, ZOSAPI_SystemData_IField]
     """
 
+    self._System_MarkDirty_("fields")
     self.TheSystem.SystemData.Fields.DeleteFieldAt(
         self._convert_raw_field_input_(in_field, return_index=True)
     )
@@ -84,6 +85,7 @@ def Fields_AddField(
     :return: The new field object
     :rtype: ZOSAPI_SystemData_IField
     """
+    self._System_MarkDirty_("fields")
     return self.TheSystem.SystemData.Fields.AddField(
         float(field_x), float(field_y), float(field_weight)
     )
@@ -126,6 +128,7 @@ def Field_SetAllDataOfFieldFromDict(
     :type Field_dict: dict|Box
     """
     field_obj = self._convert_raw_field_input_(in_field, return_index=False)
+    self._System_MarkDirty_("fields")
     for key in Field_dict:
         _SetAttrByStringIfValid_(
             self,
@@ -160,6 +163,7 @@ def Field_SetFieldType(self, field_type: str = "Angle") -> None:
     :param field_type: Name of the field type, defaults to 'Angle'
     :type field_type: str, optional
     """
+    self._System_MarkDirty_("fields")
     self.TheSystem.SystemData.Fields.ConvertToFieldType(
         _CheckIfStringValidInDir_(self, self.ZOSAPI.SystemData.FieldType, field_type)
     )
@@ -184,6 +188,7 @@ def Field_SetVignettingFactors(self) -> None:
     marginal rays in the top, bottom, left, and right edges of the pupil pass within the apertures of each surface.
     Only the primary wavelength is used.
     """
+    self._System_MarkDirty_("fields")
     self.TheSystem.SystemData.Fields.SetVignetting()
 
 
@@ -191,6 +196,7 @@ def Field_ClearVignettingFactors(self) -> None:
     """
     Sets vignetting factors to zero.
     """
+    self._System_MarkDirty_("fields")
     self.TheSystem.SystemData.Fields.ClearVignetting()
 
 
@@ -215,6 +221,7 @@ def Field_SetNormalization(self, normalization: str = "Radial") -> None:
         self, self.ZOSAPI.SystemData.FieldNormalizationType, normalization
     )
     if norm is not None:
+        self._System_MarkDirty_("fields")
         self.TheSystem.SystemData.Fields.Normalization = norm
 
 
@@ -225,4 +232,4 @@ def Field_GetNormalization(self) -> str:
     :return: The name of the set normalization.
     :rtype: str
     """
-    return str(self.TheSystem.SystemData.Fields.get_Normalization())
+    return self._System_GetMetadata_()["normalization"]
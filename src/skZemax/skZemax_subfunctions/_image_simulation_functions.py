@@ -0,0 +1,656 @@
+from __future__ import annotations
+
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import numpy as np
+import xarray as xr
+from PIL import Image
+from scipy.ndimage import map_coordinates, uniform_filter
+from scipy.signal import fftconvolve
+
+from skZemax.skZemax_subfunctions._c_print import c_print as cp
+
+type ZOSAPI_SystemData_IWavelength = object  # <- ZOSAPI.SystemData.IWavelength # The actual module is referenced by the base PythonStandaloneApplication class.
+
+# Largest PSF kernel (in detector pixels) chosen automatically by ImageSimulation_GetPSFGrid().
+_IMAGE_SIMULATION_MAX_PSF_SIZE_ = 129
+
+
+@staticmethod
+def ImageSimulation_ResamplePSF(
+    psf: np.ndarray, spacing_um: float, pixel_pitch_mm: float, size: int
+) -> np.ndarray:
+    """
+    Resamples PSFs onto a detector pixel grid (e.g. the 'psf' of :func:`Wavefront_ComputePSF` or the data of :func:`Analyses_HuygensPSF`).
+
+    The PSFs are integrated over the pixel area (box filtered) before being sampled at the pixel centers, and each kernel is normalized to unit energy.
+    The PSF is taken to be centered at the index (rows // 2, columns // 2) of its last two axes.
+
+    :param psf: Array of PSFs with the image (y, x) as its last two axes.
+    :type psf: np.ndarray
+    :param spacing_um: Sample spacing of the PSF in micrometers.
+    :type spacing_um: float
+    :param pixel_pitch_mm: Detector pixel pitch in mm.
+    :type pixel_pitch_mm: float
+    :param size: Number of pixels across the (square) output kernel. Made odd so the kernel has a center pixel.
+    :type size: int
+    :return: Array of float32 kernels of shape (..., size, size).
+    :rtype: np.ndarray
+    """
+    psf = np.asarray(psf, dtype=float)
+    size = int(size) + (1 - int(size) % 2)
+    samples_per_pixel = float(pixel_pitch_mm) * 1e3 / float(spacing_um)
+    box = max(1, int(np.round(samples_per_pixel)))
+    if box > 1:
+        psf = uniform_filter(
+            psf, size=(1,) * (psf.ndim - 2) + (box, box), mode="constant"
+        )
+    offsets = (np.arange(size) - size // 2) * samples_per_pixel
+    rows, cols = np.meshgrid(
+        offsets + psf.shape[-2] // 2, offsets + psf.shape[-1] // 2, indexing="ij"
+    )
+    flat = psf.reshape((-1,) + psf.shape[-2:])
+    out = np.stack(
+        [map_coordinates(x, [rows, cols], order=1, cval=0.0) for x in flat]
+    ).reshape(psf.shape[:-2] + (size, size))
+    energy = out.sum(axis=(-2, -1), keepdims=True)
+    energy[energy == 0] = 1.0
+    return (out / energy).astype(np.float32)
+
+
+def _ImageSimulation_LoadScene_(
+    self,
+    scene: str | np.ndarray,
+    number_of_pixels_x: int,
+    number_of_pixels_y: int,
+    rows_per_strip: int | None = None,
+) -> np.ndarray:
+    """
+    Worker to load a scene (image file path or array) as a float32 mono image on the detector pixel grid.
+    Image files are converted to mono, resized to the detector, and flipped up-down (as in :func:`Analyses_ImageSimulation`) so row 0 is the bottom of the image.
+    Array-likes that are not in memory (e.g. a np.memmap or a zarr array) are returned as they are, to be read tile by tile.
+
+    With `rows_per_strip`, an image file is instead staged into a temporary memory mapped float32 file, converting and resizing
+    this many detector rows at a time, so no full float32 copy of the scene is held in memory (the file is still decoded once in its own pixel format).
+    The resized strips match the rows of the full resize to about 1e-5 of the scene range (the resampling weights depend slightly on the offset of each strip).
+
+    :param rows_per_strip: If given, stage an image file strip by strip into a np.memmap, defaults to None
+    :type rows_per_strip: int | None, optional
+    :return: Array of shape (number_of_pixels_y, number_of_pixels_x).
+    :rtype: np.ndarray
+    """
+    if isinstance(scene, str) and rows_per_strip is not None:
+        size_x, size_y = int(number_of_pixels_x), int(number_of_pixels_y)
+        with Image.open(scene) as img:
+            scale_y = img.size[1] / size_y
+            # Source rows beyond the strip which the (bilinear) resize filter reaches.
+            margin = int(np.ceil(max(scale_y, 1.0))) + 1
+            # The mapping outlives the file object, and the file is deleted once the mapping is released.
+            with tempfile.TemporaryFile() as staging_file:
+                staged = np.memmap(
+                    staging_file, dtype=np.float32, mode="w+", shape=(size_y, size_x)
+                )
+            for strip_start in range(0, size_y, int(rows_per_strip)):
+                strip_end = min(strip_start + int(rows_per_strip), size_y)
+                source_start = max(int(np.floor(strip_start * scale_y)) - margin, 0)
+                source_end = min(
+                    int(np.ceil(strip_end * scale_y)) + margin, img.size[1]
+                )
+                strip = img.crop((0, source_start, img.size[0], source_end)).convert(
+                    "F"
+                )
+                strip = strip.resize(
+                    (size_x, strip_end - strip_start),
+                    resample=Image.BILINEAR,
+                    box=(
+                        0,
+                        strip_start * scale_y - source_start,
+                        img.size[0],
+                        strip_end * scale_y - source_start,
+                    ),
+                )
+                staged[size_y - strip_end : size_y - strip_start] = np.flipud(
+                    np.array(strip, dtype=np.float32)
+                )
+            staged.flush()
+        return staged
+    if isinstance(scene, str):
+        with Image.open(scene) as source:
+            img = source.convert("F")
+        if img.size != (int(number_of_pixels_x), int(number_of_pixels_y)):
+            img = img.resize(
+                (int(number_of_pixels_x), int(number_of_pixels_y)),
+                resample=Image.BILINEAR,
+            )
+        return np.flipud(np.array(img, dtype=np.float32))
+    if isinstance(scene, np.ndarray) and not isinstance(scene, np.memmap):
+        scene = np.asarray(scene, dtype=np.float32)
+    if tuple(scene.shape) != (int(number_of_pixels_y), int(number_of_pixels_x)):
+        cp(
+            f"!@lr!@_ImageSimulation_LoadScene_ :: Scene shape [!@lm!@{scene.shape}!@lr!@] does not match the detector [!@lm!@({number_of_pixels_y}, {number_of_pixels_x})!@lr!@]."
+        )
+        return None
+    return scene
+
+
+def _ImageSimulation_CreateZarrStore_(
+    self, store_path: str, variables: dict, coords: dict, attrs: dict
+):
+    """
+    Worker to create a Zarr store laid out as an xarray Dataset (readable with xr.open_zarr), for images to be written into tile by tile.
+    The coordinates are written, and the float32 data variables are created zero filled.
+
+    :param store_path: Path of the Zarr store. An existing store is overwritten.
+    :type store_path: str
+    :param variables: Dictionary of the data variables as name: (dims, shape, chunks).
+    :type variables: dict
+    :param coords: Dictionary of the coordinates as name: (dims, values, attrs), as given to xr.Dataset.
+    :type coords: dict
+    :param attrs: Attributes of the Dataset.
+    :type attrs: dict
+    :return: The zarr group of the store, or None if zarr is not installed.
+    :rtype: zarr.Group
+    """
+    try:
+        import zarr
+    except ModuleNotFoundError:
+        cp(
+            "!@lr!@_ImageSimulation_CreateZarrStore_ :: Writing to a Zarr store needs the optional [!@lm!@zarr!@lr!@] package (pip install zarr)."
+        )
+        return None
+    root = zarr.open_group(str(store_path), mode="w")
+    root.attrs.update(attrs)
+    for name, (dims, values, coord_attrs) in coords.items():
+        values = np.asarray(values)
+        array = root.create_array(
+            name,
+            shape=values.shape,
+            dtype=values.dtype,
+            dimension_names=[dims] if isinstance(dims, str) else list(dims),
+        )
+        array[...] = values
+        array.attrs.update(coord_attrs)
+    # Coordinates that are not dimensions are tied to the data variables through the CF 'coordinates' attribute.
+    non_index_coords = " ".join(
+        [name for name, (dims, _, _) in coords.items() if name != dims]
+    )
+    for name, (dims, shape, chunks) in variables.items():
+        array = root.create_array(
+            name,
+            shape=tuple(shape),
+            chunks=tuple(chunks),
+            dtype="float32",
+            fill_value=0.0,
+            dimension_names=list(dims),
+        )
+        if non_index_coords:
+            array.attrs["coordinates"] = non_index_coords
+    if self._verbose:
+        cp(
+            f"!@lg!@_ImageSimulation_CreateZarrStore_ :: Created Zarr store [!@lm!@{store_path}!@lg!@]."
+        )
+    return root
+
+
+def ImageSimulation_GetPSFGrid(
+    self,
+    number_of_pixels_x: int = 1280,
+    number_of_pixels_y: int = 1024,
+    pixel_pitch_mm: float = 0.01,
+    psf_x_points: int = 15,
+    psf_y_points: int = 15,
+    wavelength: int | float | ZOSAPI_SystemData_IWavelength = 0,
+    pupil_sampling: int = 64,
+    padding_factor: int | float = 4,
+    psf_size: int | None = None,
+) -> xr.Dataset:
+    """
+    Computes a grid of PSFs over the detector with the local PSF engine (:func:`Wavefront_GetPupilFunction` and :func:`Wavefront_ComputePSF`),
+    resampled onto the detector pixels (:func:`ImageSimulation_ResamplePSF`) for :func:`ImageSimulation_Convolve`.
+
+    The PSF nodes are evenly spaced from the first to the last pixel center along each detector axis, with the detector centered on the optical axis.
+    The field point of each node is found by scaling the image height of the chief ray at the edge of the normalized field (Hx=1 and Hy=1),
+    so distortion within the field is not accounted for when placing the nodes. All nodes are traced in a single batch ray trace.
+
+    :param number_of_pixels_x: Number of detector pixels in x, defaults to 1280
+    :type number_of_pixels_x: int, optional
+    :param number_of_pixels_y: Number of detector pixels in y, defaults to 1024
+    :type number_of_pixels_y: int, optional
+    :param pixel_pitch_mm: Detector pixel pitch in mm, defaults to 0.01
+    :type pixel_pitch_mm: float, optional
+    :param psf_x_points: Number of PSF nodes across the detector in x, defaults to 15
+    :type psf_x_points: int, optional
+    :param psf_y_points: Number of PSF nodes across the detector in y, defaults to 15
+    :type psf_y_points: int, optional
+    :param wavelength: System wavelength (as index, microns, or object). An int of 0 selects all wavelengths, defaults to 0
+    :type wavelength: int | float | ZOSAPI_SystemData_IWavelength, optional
+    :param pupil_sampling: Number of rays across the pupil diameter, defaults to 64
+    :type pupil_sampling: int, optional
+    :param padding_factor: FFT zero-padding factor of the PSF, defaults to 4
+    :type padding_factor: int | float, optional
+    :param psf_size: Number of pixels across the PSF kernels. If None, the extent of the computed PSF (up to 129 pixels) is used, defaults to None
+    :type psf_size: int | None, optional
+    :return: Dataset of the 'psf' kernels on (wvln, node_y, node_x, ky, kx) and the 'strehl_ratio' on (wvln, node_y, node_x).
+    :rtype: xr.Dataset
+    """
+    if not (isinstance(wavelength, int) and wavelength == 0):
+        wavelength_idx = self._convert_raw_wavelength_input_(
+            wavelength, return_index=True
+        )
+        trace_wavelength_um = float(
+            self.Wavelength_GetAllSystemWavelengthsAsMicrometers()[wavelength_idx - 1]
+        )
+    else:
+        trace_wavelength_um = self.Wavelength_GetPrimaryWavelengthAsMicrometers()
+
+    # Image heights of the chief rays at the edge of the normalized field set the node -> field mapping.
+    edge = 1 - 1e-12
+    chief = self.LDE_BuildRayTraceNormalizedUnpolarizedRays(
+        Hx=np.array([edge, 0.0]),
+        Hy=np.array([0.0, edge]),
+        Px=np.zeros(2),
+        Py=np.zeros(2),
+        do_all_surfaces_to_ending=False,
+        primary_wavelength=trace_wavelength_um,
+        wavelengths=trace_wavelength_um,
+        should_take_rays_one_to_one=True,
+    )
+    chief = self.LDE_RunRayTrace(chief).isel(surf=-1, wvln=0)
+    image_scale = np.array([float(chief.X.values[0]), float(chief.Y.values[1])])
+    if np.any(chief.error.values.astype(bool)) or not np.any(np.abs(image_scale) > 0):
+        cp(
+            "!@lr!@ImageSimulation_GetPSFGrid :: Could not trace the chief rays at the edge of the field to the image."
+        )
+        return None
+    # A field with no extent along one axis (e.g. y-only fields with a rectangular normalization) borrows the scale of the other axis.
+    image_scale[image_scale == 0] = np.abs(image_scale[image_scale != 0][0])
+
+    node_x = np.linspace(0, int(number_of_pixels_x) - 1, int(psf_x_points))
+    node_y = np.linspace(0, int(number_of_pixels_y) - 1, int(psf_y_points))
+    node_x_mm = (node_x - (int(number_of_pixels_x) - 1) / 2) * pixel_pitch_mm
+    node_y_mm = (node_y - (int(number_of_pixels_y) - 1) / 2) * pixel_pitch_mm
+    NX, NY = np.meshgrid(node_x_mm, node_y_mm)
+    if self._verbose:
+        cp(
+            f"!@lg!@ImageSimulation_GetPSFGrid :: Computing a [!@lm!@{int(psf_x_points)}x{int(psf_y_points)}!@lg!@] PSF grid."
+        )
+    pupil = self.Wavefront_GetPupilFunction(
+        wavelength=wavelength,
+        pupil_sampling=pupil_sampling,
+        field_coordinates=np.stack(
+            [NX.ravel() / image_scale[0], NY.ravel() / image_scale[1]], axis=-1
+        ),
+    )
+    if pupil is None:
+        return None
+    psf = self.Wavefront_ComputePSF(pupil, padding_factor=padding_factor)
+    spacing_um = float(psf.attrs["Data_Spacing_um"])
+    if psf_size is None:
+        psf_size = min(
+            int(np.ceil(psf.x.shape[0] * spacing_um / (pixel_pitch_mm * 1e3))),
+            _IMAGE_SIMULATION_MAX_PSF_SIZE_,
+        )
+    kernels = ImageSimulation_ResamplePSF(
+        psf.psf.transpose("wvln", "field", "y", "x").values,
+        spacing_um,
+        pixel_pitch_mm,
+        psf_size,
+    )
+    shape = (kernels.shape[0], int(psf_y_points), int(psf_x_points))
+    offsets = np.arange(kernels.shape[-1]) - kernels.shape[-1] // 2
+    return xr.Dataset(
+        {
+            "psf": (
+                ("wvln", "node_y", "node_x", "ky", "kx"),
+                kernels.reshape(shape + kernels.shape[-2:]),
+            ),
+            "strehl_ratio": (
+                ("wvln", "node_y", "node_x"),
+                psf.strehl_ratio.transpose("wvln", "field").values.reshape(shape),
+            ),
+        },
+        coords={
+            "node_x": ("node_x", node_x, {"units": "pixels"}),
+            "node_y": ("node_y", node_y, {"units": "pixels"}),
+            "Hx": (("node_y", "node_x"), pupil.Hx.values.reshape(shape[1:])),
+            "Hy": (("node_y", "node_x"), pupil.Hy.values.reshape(shape[1:])),
+            "wavelengths": psf.wavelengths,
+            "weights": psf.weights,
+            "kx": ("kx", offsets, {"units": "pixels"}),
+            "ky": ("ky", offsets, {"units": "pixels"}),
+        },
+        attrs={
+            **pupil.attrs,
+            "Pixel_Pitch_mm": float(pixel_pitch_mm),
+            "Number_Of_Pixels_X": int(number_of_pixels_x),
+            "Number_Of_Pixels_Y": int(number_of_pixels_y),
+            "PSF_Data_Spacing_um": spacing_um,
+        },
+    )
+
+
+def _ImageSimulation_NodeWeights_(
+    nodes: np.ndarray, number_of_pixels: int
+) -> np.ndarray:
+    """
+    Worker to compute the (tent) linear interpolation weights of each PSF node along one detector axis.
+    The weights of all nodes sum to one at every pixel; pixels beyond the outer nodes take the outer node's PSF.
+
+    :return: Array of shape (number of nodes, number_of_pixels).
+    :rtype: np.ndarray
+    """
+    pixels = np.arange(int(number_of_pixels))
+    if nodes.shape[0] == 1:
+        return np.ones((1, pixels.shape[0]), dtype=np.float32)
+    return np.array(
+        [np.interp(pixels, nodes, x) for x in np.eye(nodes.shape[0])]
+    ).astype(np.float32)
+
+
+def ImageSimulation_Convolve(
+    self,
+    scene: str | np.ndarray,
+    psf_grid: xr.Dataset,
+    polychromatic: bool = True,
+    number_of_workers: int | None = None,
+    output_zarr_path: str | None = None,
+    zarr_chunk_size: int = 512,
+) -> xr.Dataset:
+    """
+    Convolves a scene with spatially varying PSFs by overlap-add of FFT tiles in float32.
+
+    The PSF between the nodes of the grid is the bilinear interpolation of the PSFs at the surrounding nodes. This is applied exactly
+    by weighting the scene with the (tent) interpolation weight of each node, convolving that tile (spanning the neighbouring nodes) with the
+    node's PSF, and adding the results. The tiles are independent and are convolved in parallel.
+
+    The polychromatic image convolves the scene with the weighted (see :func:`Wavelength_GetAllSystemWavelengthsWeights`) sum of the
+    unit energy PSFs of each wavelength, so it costs the same as a single wavelength.
+
+    .. code-block:: python
+
+        psf_grid = skZemax.ImageSimulation_GetPSFGrid(number_of_pixels_x=640, number_of_pixels_y=480, psf_x_points=9, psf_y_points=7)
+        sim = skZemax.ImageSimulation_Convolve("my_scene.png", psf_grid)
+
+    :param scene: Path of an image file (resized to the detector) or an array of shape (number_of_pixels_y, number_of_pixels_x).
+                  The scene is the ideal (geometric) image on the detector, with row 0 at the bottom.
+    :type scene: str | np.ndarray
+    :param psf_grid: PSF grid from :func:`ImageSimulation_GetPSFGrid`, or any Dataset with the same 'psf' kernels, 'node_x'/'node_y' (pixels), and 'weights'.
+    :type psf_grid: xr.Dataset
+    :param polychromatic: If True simulate the wavelength weighted image, else one image per wavelength, defaults to True
+    :type polychromatic: bool, optional
+    :param number_of_workers: Number of threads convolving tiles. If None, the number of CPU cores is used, defaults to None
+    :type number_of_workers: int | None, optional
+    :param output_zarr_path: If given, the simulated image is streamed to a Zarr store at this path as it is produced (needs the optional 'zarr' package).
+                             Only one row of PSF nodes is held in memory, and the scene is only referenced by the 'Input_Image_Path' attribute.
+                             An image file scene is staged once (zarr_chunk_size rows at a time) into a temporary memory mapped file, and read from it tile by tile.
+                             For scenes too large to decode at once, give a np.memmap or zarr array instead. Defaults to None
+    :type output_zarr_path: str | None, optional
+    :param zarr_chunk_size: Chunk size (in pixels along y and x) of the Zarr store, defaults to 512
+    :type zarr_chunk_size: int, optional
+    :return: Dataset of the 'input_image_mono' on (y, x) and the 'sim_image_polychromatic' on (y, x) or the 'sim_image_mono' on (wavelength, y, x).
+             With an output_zarr_path, the (lazily loaded) Dataset of the Zarr store, without the 'input_image_mono'.
+    :rtype: xr.Dataset
+    """
+    number_of_pixels_x = int(psf_grid.attrs["Number_Of_Pixels_X"])
+    number_of_pixels_y = int(psf_grid.attrs["Number_Of_Pixels_Y"])
+    pixel_pitch_mm = float(psf_grid.attrs["Pixel_Pitch_mm"])
+    image = self._ImageSimulation_LoadScene_(
+        scene,
+        number_of_pixels_x,
+        number_of_pixels_y,
+        rows_per_strip=int(zarr_chunk_size) if output_zarr_path is not None else None,
+    )
+    if image is None:
+        return None
+    kernels = psf_grid.psf.transpose("wvln", "node_y", "node_x", "ky", "kx").values
+    kernels = kernels.astype(np.float32)
+    if polychromatic:
+        weights = psf_grid.weights.values.astype(np.float32)
+        weights = weights / weights.sum() if weights.sum() > 0 else weights
+        kernels = np.einsum("wjiyx,w->jiyx", kernels, weights)[np.newaxis]
+    node_x = psf_grid.node_x.values.astype(float)
+    node_y = psf_grid.node_y.values.astype(float)
+    weights_x = _ImageSimulation_NodeWeights_(node_x, number_of_pixels_x)
+    weights_y = _ImageSimulation_NodeWeights_(node_y, number_of_pixels_y)
+    kernel_y, kernel_x = kernels.shape[-2:]
+
+    def _support_(in_weights: np.ndarray) -> slice:
+        nonzero = np.flatnonzero(in_weights > 0)
+        return slice(int(nonzero[0]), int(nonzero[-1]) + 1)
+
+    def _convolve_tile_(in_wvln: int, in_j: int, in_i: int):
+        rows, cols = _support_(weights_y[in_j]), _support_(weights_x[in_i])
+        tile = (
+            np.asarray(image[rows, cols], dtype=np.float32)
+            * weights_y[in_j, rows, np.newaxis]
+            * weights_x[in_i, np.newaxis, cols]
+        )
+        return (
+            in_wvln,
+            rows,
+            cols,
+            fftconvolve(tile, kernels[in_wvln, in_j, in_i], mode="full"),
+        )
+
+    coords = {
+        "x": (
+            ("x"),
+            np.arange(0, number_of_pixels_x).astype(int) * pixel_pitch_mm,
+            {"units": "mm"},
+        ),
+        "image_x": (
+            ("x"),
+            np.arange(0, number_of_pixels_x).astype(int),
+            {"units": "pixels"},
+        ),
+        "y": (
+            ("y"),
+            np.arange(0, number_of_pixels_y).astype(int) * pixel_pitch_mm,
+            {"units": "mm"},
+        ),
+        "image_y": (
+            ("y"),
+            np.arange(0, number_of_pixels_y).astype(int),
+            {"units": "pixels"},
+        ),
+    }
+    if polychromatic:
+        sim_name, sim_dims = "sim_image_polychromatic", ("y", "x")
+    else:
+        sim_name, sim_dims = "sim_image_mono", ("wavelength", "y", "x")
+        coords["wavelength"] = (
+            ("wavelength"),
+            psf_grid.wavelengths.values.astype(float),
+            {"units": "micrometers"},
+        )
+    attrs = {
+        "Input_Image_Path": str(scene) if isinstance(scene, str) else "",
+        "PSF_X_Points": int(node_x.shape[0]),
+        "PSF_Y_Points": int(node_y.shape[0]),
+    }
+    sim_shape = (kernels.shape[0], number_of_pixels_y, number_of_pixels_x)
+    if output_zarr_path is not None:
+        store = self._ImageSimulation_CreateZarrStore_(
+            output_zarr_path,
+            {
+                sim_name: (
+                    sim_dims,
+                    sim_shape[-len(sim_dims) :],
+                    (1,) * (len(sim_dims) - 2)
+                    + (
+                        min(int(zarr_chunk_size), number_of_pixels_y),
+                        min(int(zarr_chunk_size), number_of_pixels_x),
+                    ),
+                )
+            },
+            coords,
+            attrs,
+        )
+        if store is None:
+            return None
+        sim_images = store[sim_name]
+    else:
+        sim_images = np.zeros(sim_shape[-len(sim_dims) :], dtype=np.float32)
+
+    if self._verbose:
+        cp(
+            f"!@lg!@ImageSimulation_Convolve :: Convolving [!@lm!@{kernels.shape[0] * node_y.shape[0] * node_x.shape[0]}!@lg!@] tiles with [!@lm!@{kernel_y}x{kernel_x}!@lg!@] pixel PSFs."
+        )
+    # The tiles are processed one row of nodes at a time, accumulating the full (padded) convolution in a band of rows.
+    # Once a row of nodes is done, the rows above the next row's tiles are final: they are cropped to the detector and written out.
+    padded_rows = number_of_pixels_y + kernel_y - 1
+    band = np.zeros(
+        (kernels.shape[0], 0, number_of_pixels_x + kernel_x - 1), np.float32
+    )
+    band_start = 0
+    with ThreadPoolExecutor(
+        max_workers=number_of_workers if number_of_workers else os.cpu_count()
+    ) as executor:
+        for j in range(node_y.shape[0]):
+            futures = [
+                executor.submit(_convolve_tile_, w, j, i)
+                for w in range(kernels.shape[0])
+                for i in range(node_x.shape[0])
+            ]
+            band_end = _support_(weights_y[j]).stop + kernel_y - 1
+            if band_end > band_start + band.shape[1]:
+                band = np.concatenate(
+                    [
+                        band,
+                        np.zeros(
+                            band.shape[:1]
+                            + (band_end - band_start - band.shape[1],)
+                            + band.shape[2:],
+                            np.float32,
+                        ),
+                    ],
+                    axis=1,
+                )
+            for future in as_completed(futures):
+                wvln_idx, rows, cols, result = future.result()
+                band[
+                    wvln_idx,
+                    rows.start - band_start : rows.start - band_start + result.shape[0],
+                    cols.start : cols.start + result.shape[1],
+                ] += result
+            final_end = (
+                _support_(weights_y[j + 1]).start
+                if j + 1 < node_y.shape[0]
+                else padded_rows
+            )
+            # Padded rows [band_start, final_end) -> detector rows, offset by the kernel center.
+            out_start = max(band_start - kernel_y // 2, 0)
+            out_end = min(final_end - kernel_y // 2, number_of_pixels_y)
+            if out_end > out_start:
+                offset = kernel_y // 2 - band_start
+                rows_out = band[
+                    :,
+                    out_start + offset : out_end + offset,
+                    kernel_x // 2 : kernel_x // 2 + number_of_pixels_x,
+                ]
+                if polychromatic:
+                    sim_images[out_start:out_end, :] = rows_out[0]
+                else:
+                    sim_images[:, out_start:out_end, :] = rows_out
+            band = band[:, final_end - band_start :]
+            band_start = final_end
+
+    if output_zarr_path is not None:
+        return xr.open_zarr(output_zarr_path, chunks=None, consolidated=False)
+    return xr.Dataset(
+        {
+            "input_image_mono": (("y", "x"), np.asarray(image)),
+            sim_name: (sim_dims, sim_images),
+        },
+        coords=coords,
+        attrs=attrs,
+    )
+
+
+def Analyses_ImageSimulationLocal(
+    self,
+    input_image_full_path: str | np.ndarray = None,
+    wavelengths: int | float | ZOSAPI_SystemData_IWavelength = 0,
+    number_of_pixels_x: int = 1280,
+    number_of_pixels_y: int = 1024,
+    pixel_pitch_mm: float = 0.01,
+    psf_x_points: int = 15,
+    psf_y_points: int = 15,
+    pupil_sampling: int = 64,
+    padding_factor: int | float = 4,
+    psf_size: int | None = None,
+    polychromatic: bool = True,
+    number_of_workers: int | None = None,
+    output_zarr_path: str | None = None,
+) -> xr.Dataset:
+    """
+    Local alternative to :func:`Analyses_ImageSimulation`: builds a PSF grid with :func:`ImageSimulation_GetPSFGrid` and convolves the
+    scene with it using :func:`ImageSimulation_Convolve`. Nothing is written to the OpticStudio image folder and the simulated
+    image is kept in float32 rather than read back as an 8-bit image.
+
+    Unlike :func:`Analyses_ImageSimulation` the scene is resized to fill the detector (i.e. it is the geometric image), and each PSF has unit energy (no relative illumination).
+
+    :param input_image_full_path: Path of the scene image or an array on the detector pixels. If None, OpticStudio's 'ColorChart_Speos_4800x3600.png' is used, defaults to None
+    :type input_image_full_path: str | np.ndarray, optional
+    :param wavelengths: System wavelength (as index, microns, or object). An int of 0 selects all wavelengths, defaults to 0
+    :type wavelengths: int | float | ZOSAPI_SystemData_IWavelength, optional
+    :param number_of_pixels_x: Number of detector pixels in x, defaults to 1280
+    :type number_of_pixels_x: int, optional
+    :param number_of_pixels_y: Number of detector pixels in y, defaults to 1024
+    :type number_of_pixels_y: int, optional
+    :param pixel_pitch_mm: Detector pixel pitch in mm, defaults to 0.01
+    :type pixel_pitch_mm: float, optional
+    :param psf_x_points: Number of PSF nodes across the detector in x, defaults to 15
+    :type psf_x_points: int, optional
+    :param psf_y_points: Number of PSF nodes across the detector in y, defaults to 15
+    :type psf_y_points: int, optional
+    :param pupil_sampling: Number of rays across the pupil diameter, defaults to 64
+    :type pupil_sampling: int, optional
+    :param padding_factor: FFT zero-padding factor of the PSF, defaults to 4
+    :type padding_factor: int | float, optional
+    :param psf_size: Number of pixels across the PSF kernels. See :func:`ImageSimulation_GetPSFGrid`, defaults to None
+    :type psf_size: int | None, optional
+    :param polychromatic: If True simulate the wavelength weighted image, else one image per wavelength, defaults to True
+    :type polychromatic: bool, optional
+    :param number_of_workers: Number of threads convolving tiles. If None, the number of CPU cores is used, defaults to None
+    :type number_of_workers: int | None, optional
+    :param output_zarr_path: If given, the simulated image is streamed to a Zarr store at this path. See :func:`ImageSimulation_Convolve`, defaults to None
+    :type output_zarr_path: str | None, optional
+    :return: Dataset of the input and simulated images (see :func:`ImageSimulation_Convolve`), with the 'strehl_ratio' of the PSF grid.
+    :rtype: xr.Dataset
+    """
+    if input_image_full_path is None:
+        input_image_full_path = (
+            self.Utilities_ZemaxInstallationImageDir()
+            + os.sep
+            + "ColorChart_Speos_4800x3600.png"
+        )
+    psf_grid = self.ImageSimulation_GetPSFGrid(
+        number_of_pixels_x=number_of_pixels_x,
+        number_of_pixels_y=number_of_pixels_y,
+        pixel_pitch_mm=pixel_pitch_mm,
+        psf_x_points=psf_x_points,
+        psf_y_points=psf_y_points,
+        wavelength=wavelengths,
+        pupil_sampling=pupil_sampling,
+        padding_factor=padding_factor,
+        psf_size=psf_size,
+    )
+    if psf_grid is None:
+        return None
+    out = self.ImageSimulation_Convolve(
+        input_image_full_path,
+        psf_grid,
+        polychromatic=polychromatic,
+        number_of_workers=number_of_workers,
+        output_zarr_path=output_zarr_path,
+    )
+    if out is None:
+        return None
+    return out.assign(
+        strehl_ratio=psf_grid.strehl_ratio.assign_coords(
+            wavelengths=psf_grid.wavelengths
+        )
+    )
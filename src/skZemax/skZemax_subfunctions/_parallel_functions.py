@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import os
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+
+import xarray as xr
+
+from skZemax.skZemax_subfunctions._c_print import c_print as cp
+
+# The skZemaxClass instance of a worker process. Set by _Parallel_WorkerInitializer_().
+_WORKER_SKZEMAX_ = None
+
+
+def _Parallel_WorkerInitializer_(lens_file: str, zemax_path: str | None) -> None:
+    """
+    Runs once in each worker process: starts an OpticStudio instance and loads the lens file.
+
+    :param lens_file: Path to the lens file the worker should load.
+    :type lens_file: str
+    :param zemax_path: Path to the installed version of OpticStudio (None to find it automatically).
+    :type zemax_path: str | None
+    """
+    global _WORKER_SKZEMAX_
+    from skZemax.skZemaxClass import skZemaxClass
+
+    _WORKER_SKZEMAX_ = skZemaxClass(path=zemax_path, verbose=False)
+    _WORKER_SKZEMAX_.Utilities_OpenZemaxFile(lens_file)
+
+
+def _Parallel_WorkerTask_(function_name: str, function_kwargs: dict):
+    """
+    Runs one task in a worker process.
+
+    :param function_name: Name of the skZemaxClass function to call.
+    :type function_name: str
+    :param function_kwargs: Keyword arguments of the call.
+    :type function_kwargs: dict
+    :return: The return of the function (must be picklable, e.g. an xarray Dataset).
+    """
+    return getattr(_WORKER_SKZEMAX_, function_name)(**function_kwargs)
+
+
+def Parallel_GetNumberOfWorkers(
+    self, number_of_tasks: int, number_of_workers: int | None = None
+) -> int:
+    """
+    Returns the number of worker OpticStudio instances to use: the requested number, capped by the number of tasks and CPU cores.
+
+    Every worker is a separate OpticStudio instance and uses an API license seat. OpticStudio does not report how many seats are free,
+    so set `number_of_workers` to no more than the number of instances your license allows.
+
+    :param number_of_tasks: Number of tasks to distribute.
+    :type number_of_tasks: int
+    :param number_of_workers: Requested number of workers, defaults to None (number of CPU cores)
+    :type number_of_workers: int | None, optional
+    :return: The number of workers.
+    :rtype: int
+    """
+    cores = os.cpu_count() or 1
+    requested = cores if number_of_workers is None else int(number_of_workers)
+    return max(1, min(requested, cores, int(number_of_tasks)))
+
+
+def _Parallel_SaveTemporaryCopyOfSystem_(self) -> str:
+    """
+    Saves a copy of the current optical system (including unsaved changes) for worker processes to load.
+    The current system and its file path are not changed.
+
+    :return: Path to the temporary lens file. The caller removes it when done.
+    :rtype: str
+    """
+    extension = os.path.splitext(str(self.TheSystem.SystemFile))[-1]
+    if extension.lower() not in [".zmx", ".zos"]:
+        extension = ".zmx"
+    lens_file = (
+        self.Utilities_AnalysesFilesDir()
+        + os.sep
+        + "skZemax_worker_"
+        + uuid.uuid4().hex
+        + extension
+    )
+    system_copy = self.TheSystem.CopySystem()
+    system_copy.SaveAs(lens_file)
+    system_copy.Close(False)
+    return lens_file
+
+
+def Parallel_RunAnalyses(
+    self,
+    function_name: str,
+    task_kwargs: list[dict],
+    number_of_workers: int | None = None,
+    concat_dim: str | None = None,
+    **concat_kwargs,
+) -> list | xr.Dataset:
+    """
+    Runs an skZemax function for each set of keyword arguments in a pool of worker OpticStudio instances, each loaded with a copy of the current system.
+    This is useful to spread e.g. field, wavelength, or configuration sweeps of analyses over several cores.
+
+    .. code-block:: python
+
+        # Huygens PSF of the primary wavelength in every configuration, four at a time.
+        psfs = skZemax.Parallel_RunAnalyses(
+            "Analyses_HuygensPSF",
+            [{"wavelength": 1, "configuration": c} for c in range(1, skZemax.MCE_GetNumberOfConfigs() + 1)],
+            number_of_workers=4,
+        )
+
+    Starting the worker instances takes some seconds, so this pays off for long analyses.
+
+    :param function_name: Name of the skZemax function to run, e.g. 'Analyses_HuygensPSF'.
+    :type function_name: str
+    :param task_kwargs: Keyword arguments of each call. Values must be picklable (use indices rather than ZOS-API objects).
+    :type task_kwargs: list[dict]
+    :param number_of_workers: Number of worker instances, see :func:`Parallel_GetNumberOfWorkers`, defaults to None
+    :type number_of_workers: int | None, optional
+    :param concat_dim: If given, the results are concatenated with xr.concat along this dimension, defaults to None (list of results)
+    :type concat_dim: str | None, optional
+    :param concat_kwargs: Extra keyword arguments for xr.concat.
+    :return: The results in the order of `task_kwargs`, or their concatenation.
+    :rtype: list | xr.Dataset
+    """
+    if not hasattr(self, function_name):
+        cp(
+            f"!@lr!@Parallel_RunAnalyses :: skZemax has no function [!@lm!@{function_name}!@lr!@]."
+        )
+        return None
+    workers = self.Parallel_GetNumberOfWorkers(len(task_kwargs), number_of_workers)
+    if self._verbose:
+        cp(
+            f"!@lg!@Parallel_RunAnalyses :: Running [!@lm!@{len(task_kwargs)}!@lg!@] [!@lm!@{function_name}!@lg!@] tasks on [!@lm!@{workers}!@lg!@] workers."
+        )
+    lens_file = self._Parallel_SaveTemporaryCopyOfSystem_()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_Parallel_WorkerInitializer_,
+            initargs=(lens_file, self._zemax_path),
+        ) as executor:
+            futures = [
+                executor.submit(_Parallel_WorkerTask_, function_name, kwargs)
+                for kwargs in task_kwargs
+            ]
+            results = [x.result() for x in futures]
+    finally:
+        os.remove(lens_file)
+    if self._verbose:
+        cp("!@lg!@Parallel_RunAnalyses :: Done.")
+    if concat_dim is None:
+        return results
+    return xr.concat(results, dim=concat_dim, **concat_kwargs)
@@ -54,6 +54,7 @@ def RayAiming_SetAimingMethod(self, method: str = "Off"):
             self.ZOSAPI.SystemData.RayAimingMethod,
             str(available_aiming_methods[int(np.where(bool_mask)[0][0])]),
         )
+        self._System_MarkDirty_("system")
     else:
         cp(
             f"!@ly!@RayAiming_SetAimingMethod :: Ray aiming method [!@lm!@{method}!@ly!@] not found."
@@ -133,6 +134,7 @@ def RayAiming_SetAimingProperty(
             str(available_aiming_props[int(np.where(bool_mask)[0][0])]),
             aiming_value,
         )
+        self._System_MarkDirty_("system")
     else:
         cp(
             f"!@ly!@RayAiming_SetAimingProperty :: Ray aiming property [!@lm!@{aiming_property}!@ly!@] not found."
@@ -32,6 +32,7 @@ def Solver_QuickFocus(
     quickFocus.UseCentroid = use_centroid
     quickFocus.RunAndWaitForCompletion()
     quickFocus.Close()
+    self._System_MarkDirty_()
 
 
 def Solver_QuickAdjust(
@@ -71,6 +72,7 @@ def Solver_QuickAdjust(
             self.ZOSAPI.Tools.General.QuickAdjustType, "Radius"
         )
     quickAdjust.RunAndWaitForCompletion()
+    self._System_MarkDirty_()
     quickAdjust.Close()
 
 
@@ -108,6 +110,7 @@ def Solver_LocalOptimization(
         cp("!@lg!@Solver_LocalOptimization :: Running Local Optimization ...")
     LocalOpt.RunAndWaitForCompletion()
     LocalOpt.Close()
+    self._System_MarkDirty_()
     if self._verbose:
         cp("!@lg!@Solver_LocalOptimization :: Done Local Optimization")
 
@@ -143,6 +146,7 @@ def Solver_HammerOptimization(self, secondsRunning: float = 10.0):
         HammerOpt.Cancel()
     HammerOpt.WaitForCompletion()
     HammerOpt.Close()
+    self._System_MarkDirty_()
     if self._verbose:
         cp("!@lg!@Solver_HammerOptimization :: Done Hammer Optimization.")
 
@@ -203,6 +207,7 @@ def Solver_LDEMakeSurfacePropertyAutomatic(
         cell.SetSolveData(cell.CreateSolveType(self.ZOSAPI.Editors.SolveType.Automatic))
     except:
         pass
+    self._System_MarkDirty_()
 
 
 def Solver_GetNamesOfAllSolveTypes(
@@ -354,6 +359,7 @@ def Solver_LDESurfaceProperty_ForValue(
         )
     # Set the solver
     CellPropertyCallback.SetSolveData(Solver)
+    self._System_MarkDirty_()
 
 
 ##############################################################
@@ -425,4 +431,5 @@ def Solver_MCEMakeConfigOp_ForValue(
             in_value=params[key],
         )
     in_op.GetOperandCell(config_number).SetSolveData(Solver)
+    self._System_MarkDirty_()
     return in_op
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import contextlib
+import functools
+import hashlib
 
 import numpy as np
+import System
+from box import Box
 
 from skZemax.skZemax_subfunctions._c_print import c_print as cp
 from skZemax.skZemax_subfunctions._LDE_functions import (
@@ -13,6 +18,19 @@ from skZemax.skZemax_subfunctions._ZOSAPI_interface_functions import (
     _SetAttrByStringIfValid_,
 )
 
+# Regions of the system hashed (and marked as changed) separately by System_Fingerprint().
+_SYSTEM_FINGERPRINT_REGIONS_ = (
+    "config",
+    "system",
+    "fields",
+    "wavelengths",
+    "MCE",
+    "LDE",
+    "NCE",
+)
+# Field properties read (and restored) per field.
+_SYSTEM_FIELD_PROPERTIES_ = ("X", "Y", "Weight", "VDX", "VDY", "VCX", "VCY", "VAN")
+
 
 def System_GetNamesOfAllMaterialCatalogs(self, print_to_console: bool = False) -> list:
     """
@@ -135,6 +153,7 @@ def System_SetApertureProperty(
     self._SetAttrByStringIfValid_(
         self.TheSystem.SystemData.Aperture, apertureProperty, value
     )
+    self._System_MarkDirty_("system")
 
 
 def System_SetGlobalCoordinateReferenceSurface(
@@ -214,6 +233,7 @@ def System_SetEnvironmentProperty(
         environmentProperty,
         environmentValue,
     )
+    self._System_MarkDirty_("system")
 
 
 def System_SetPolarizationProperty(
@@ -273,6 +293,7 @@ def System_SetPolarizationProperty(
     _SetAttrByStringIfValid_(
         self, self.TheSystem.SystemData.Polarization, polarizationProperty, value
     )
+    self._System_MarkDirty_("system")
 
 
 def System_SetAdvancedProperty(
@@ -394,6 +415,7 @@ def System_SetAdvancedProperty(
     _SetAttrByStringIfValid_(
         self, self.TheSystem.SystemData.Advanced, advancedProperty, value
     )
+    self._System_MarkDirty_("system")
 
 
 def System_GetMode(self) -> str:
@@ -403,7 +425,7 @@ def System_GetMode(self) -> str:
     :return: A string of "Sequential" or "NonSequential" indicating the current mode.
     :rtype: str
     """
-    return str(self.TheSystem.Mode)
+    return self._System_GetMetadata_()["mode"]
 
 
 def System_GetIfInSequentialMode(self) -> bool:
@@ -413,7 +435,7 @@ def System_GetIfInSequentialMode(self) -> bool:
     :return: if True the system is in Sequential mode.
     :rtype: bool
     """
-    return int(self.TheSystem.Mode) == 0
+    return self._System_GetMetadata_()["mode_index"] == 0
 
 
 def System_GetIfInNonSequentialMode(self) -> bool:
@@ -423,7 +445,7 @@ def System_GetIfInNonSequentialMode(self) -> bool:
     :return: if True the system is in Non-Sequential mode.
     :rtype: bool
     """
-    return int(self.TheSystem.Mode) == 1
+    return self._System_GetMetadata_()["mode_index"] == 1
 
 
 def System_SetSequentialMode(self) -> bool:
@@ -439,6 +461,8 @@ def System_SetSequentialMode(self) -> bool:
             "!@lg!@System_SetSequentialMode :: Switching from Non-Sequential mode to Sequential."
         )
     ok = self.TheSystem.MakeSequential()
+    self._NCE_InvalidateDetectorIndex_()
+    self._System_MarkDirty_()
     if ok and self._verbose:
         cp("!@lg!@System_SetSequentialMode :: Sequential mode is set.")
     elif not ok and self._verbose:
@@ -458,6 +482,8 @@ def System_SetNonSequentialMode(self) -> bool:
             "!@lg!@System_SetNonSequentialMode :: Switching from Sequential mode to Non-Sequential."
         )
     ok = self.TheSystem.MakeNonSequential()
+    self._NCE_InvalidateDetectorIndex_()
+    self._System_MarkDirty_()
     if ok and self._verbose:
         cp("!@lg!@System_SetNonSequentialMode :: Non-Sequential mode is set.")
     elif not ok and self._verbose:
@@ -505,6 +531,7 @@ def System_Lockdown(
         LockdownTool.ConvertSDToMaxApertures = bool(convertSDtoMaxApertures)
     LockdownTool.RunAndWaitForCompletion()
     LockdownTool.Close()
+    self._System_MarkDirty_()
     if self._verbose:
         cp("!@lg!@System_Lockdown :: Done locking system down.")
 
@@ -579,6 +606,8 @@ def System_ConvertSequentialToNonSequential(
                 f"S_{int(high_fidelity_resolution)}x{int(high_fidelity_resolution)}",
             )
         converter.RunAndWaitForCompletion()
+        self._NCE_InvalidateDetectorIndex_()
+        self._System_MarkDirty_()
         converter.Close()
         if self._verbose:
             cp(
@@ -589,3 +618,553 @@ def System_ConvertSequentialToNonSequential(
             cp(
                 "!@lg!@System_ConvertSequentialToNonSequential :: System is already Non-Sequential."
             )
+
+
+def _System_MarkDirty_(self, region: str | None = None, row: int | None = None) -> None:
+    """
+    Worker which marks part of the system as changed, so that :func:`System_Fingerprint` re-reads (only) that part.
+    Changes to the system settings, fields, or wavelengths also drop the cached system metadata (see :func:`_System_GetMetadata_`),
+    and changes to the MCE or NCE drop the cached NCE detector index (see :func:`_NCE_GetDetectorIndex_`).
+    Called by any skZemax function that can change the system.
+
+    The LDE/NCE row hashes are kept per configuration, so switching the active configuration ('config') only re-reads the
+    (cheap) system settings, fields, and wavelengths, which the MCE can vary, and the rows of configurations not hashed yet.
+
+    :param region: One of 'config', 'system', 'fields', 'wavelengths', 'MCE', 'LDE', or 'NCE'. If None, the whole system is marked, defaults to None
+    :type region: str | None, optional
+    :param row: The surface/object index within the 'LDE'/'NCE' region. If None, the whole region is marked, defaults to None
+    :type row: int | None, optional
+    """
+    if region in (None, "config", "system", "fields", "wavelengths"):
+        self._system_metadata = None
+    if region in (None, "config", "MCE", "NCE"):
+        # Detector sizes are NCE parameters, which the MCE can vary by configuration.
+        self._NCE_InvalidateDetectorIndex_()
+    if region is None:
+        self._system_fingerprint_dirty.update(_SYSTEM_FINGERPRINT_REGIONS_)
+        self._system_fingerprint_rows = {}
+    elif region == "config":
+        self._system_fingerprint_dirty.update(
+            ("config", "system", "fields", "wavelengths")
+        )
+    elif region == "MCE":
+        # MCE operands set the editor values of every configuration.
+        self._system_fingerprint_dirty.add(region)
+        self._system_fingerprint_rows = {}
+    elif region in ("LDE", "NCE"):
+        # Edits to a surface/object apply to every configuration.
+        for config_rows in self._system_fingerprint_rows.values():
+            if row is None:
+                config_rows[region] = {}
+            else:
+                config_rows[region].pop(int(row), None)
+    else:
+        self._system_fingerprint_dirty.add(region)
+
+
+def _System_GetMetadata_(self, refresh: bool = False) -> dict:
+    """
+    Worker which returns the cached system metadata, reading it all in one pass if it is not cached (or was dropped by :func:`_System_MarkDirty_`).
+    Backs :func:`Utilities_GetAllSystemUnits`, :func:`Wavelength_GetAllSystemWavelengthsAsMicrometers`, :func:`Wavelength_GetAllSystemWavelengthsWeights`,
+    :func:`Field_GetNormalization`, and :func:`System_GetMode`, which are called by nearly every analysis.
+
+    As for :func:`System_Fingerprint`, edits made outside skZemax are not tracked. Use refresh=True (or System_Fingerprint(full_rescan=True)) after such edits.
+
+    :param refresh: If True the metadata is re-read, defaults to False
+    :type refresh: bool, optional
+    :return: dict with keys units (dict), mode (str), mode_index (int), normalization (str), wavelengths_um and wavelength_weights (np.ndarray).
+             Callers should copy anything they return.
+    :rtype: dict
+    """
+    if refresh or self._system_metadata is None:
+        system_data = self.TheSystem.SystemData
+        units = system_data.Units
+        wavelengths = system_data.Wavelengths
+        wavelength_objects = [
+            wavelengths.GetWavelength(x)
+            for x in range(1, wavelengths.NumberOfWavelengths + 1)
+        ]
+        self._system_metadata = {
+            "units": {
+                x.split("get_")[-1]: str(getattr(units, x)())
+                for x in dir(units)
+                if "get_" in x
+            },
+            "mode": str(self.TheSystem.Mode),
+            "mode_index": int(self.TheSystem.Mode),
+            "normalization": str(system_data.Fields.get_Normalization()),
+            "wavelengths_um": np.array(
+                [float(x.Wavelength) for x in wavelength_objects]
+            ),
+            "wavelength_weights": np.array(
+                [float(x.Weight) for x in wavelength_objects]
+            ),
+        }
+    return self._system_metadata
+
+
+def _System_HashRegion_(self, region: str) -> str:
+    """
+    Worker which reads and hashes a (non-editor) region of the system for :func:`System_Fingerprint`.
+
+    :param region: One of 'config', 'system', 'fields', 'wavelengths', or 'MCE'.
+    :type region: str
+    :return: A hex digest of the region. For 'config' the active configuration number.
+    :rtype: str
+    """
+    system_data = self.TheSystem.SystemData
+    if region == "config":
+        return str(self.MCE_GetCurrentConfig())
+    if region == "system":
+        state = [
+            str(self.TheSystem.SystemFile),
+            str(self.TheSystem.Mode),
+            str(system_data.Aperture.ApertureType),
+            float(system_data.Aperture.ApertureValue),
+            str(system_data.Aperture.ApodizationType),
+            str(system_data.Units.LensUnits),
+            str(system_data.RayAiming.RayAiming),
+            float(system_data.Environment.Temperature),
+            float(system_data.Environment.Pressure),
+            bool(system_data.Polarization.IsPolarized),
+            str(system_data.Advanced.ReferenceOPD),
+        ]
+    elif region == "fields":
+        fields = system_data.Fields
+        state = [str(fields.GetFieldType()), str(fields.get_Normalization())]
+        for idx in range(1, fields.NumberOfFields + 1):
+            field = fields.GetField(idx)
+            state += [float(getattr(field, x)) for x in _SYSTEM_FIELD_PROPERTIES_]
+    elif region == "wavelengths":
+        wavelengths = system_data.Wavelengths
+        state = []
+        for idx in range(1, wavelengths.NumberOfWavelengths + 1):
+            wavelength = wavelengths.GetWavelength(idx)
+            state += [
+                float(wavelength.Wavelength),
+                float(wavelength.Weight),
+                bool(wavelength.IsPrimary),
+            ]
+    elif region == "MCE":
+        number_of_configs = self.MCE_GetNumberOfConfigs()
+        state = [number_of_configs]
+        for idx in range(1, self.MCE_GetCurrentNumOperands() + 1):
+            operand = self.MCE_GetConfigOperand(idx)
+            state += [
+                str(operand.Type),
+                operand.Param1,
+                operand.Param2,
+                operand.Param3,
+            ] + [
+                operand.GetOperandCell(x).Value for x in range(1, number_of_configs + 1)
+            ]
+    return hashlib.sha1(repr(state).encode()).hexdigest()
+
+
+def _System_HashEditorRow_(self, region: str, row: int) -> str:
+    """
+    Worker which reads and hashes one LDE surface or NCE object (type, column data, and for surfaces the aperture, stop, and tilt/decenter)
+    for :func:`System_Fingerprint`.
+
+    :param region: 'LDE' or 'NCE'.
+    :type region: str
+    :param row: The surface/object index.
+    :type row: int
+    :return: A hex digest of the row.
+    :rtype: str
+    """
+    if region == "LDE":
+        surface = self.TheSystem.LDE.GetSurfaceAt(row)
+        tilt_decenter = surface.TiltDecenterData
+        state = [
+            str(surface.TypeName),
+            str(surface.ApertureData.CurrentType),
+            bool(surface.IsStop),
+            str(tilt_decenter.BeforeSurfaceOrder),
+            str(tilt_decenter.AfterSurfaceOrder),
+            str(tilt_decenter.AfterSurfaceMode),
+        ] + [
+            float(getattr(tilt_decenter, f"{x}Surface{y}"))
+            for x in ("Before", "After")
+            for y in ("DecenterX", "DecenterY", "TiltX", "TiltY", "TiltZ")
+        ]
+        state += list(self.LDE_GetAllColumnDataOfSurface(surface).items())
+    else:
+        nce_object = self.TheSystem.NCE.GetObjectAt(row)
+        state = [str(nce_object.TypeName)] + list(
+            self.NCE_GetAllColumnDataOfObject(nce_object).items()
+        )
+    return hashlib.sha1(repr(state).encode()).hexdigest()
+
+
+def System_Fingerprint(self, full_rescan: bool = False) -> str:
+    """
+    Returns a stable hash of the system: the active configuration, the system settings (lens file, mode, aperture, units, ray aiming, environment, and polarization),
+    fields, wavelengths, MCE operands, and all LDE surface (Sequential mode) or NCE object (Non-Sequential mode) data.
+    The fingerprint changes when the system changes, so it can be used to key cached data (see :func:`AnalysisCache_Enable`).
+
+    The hash is incremental. skZemax functions which change the system mark the region (or single surface/object) they changed,
+    and only those are re-read. Surface/object hashes are kept per configuration, so switching between configurations does not re-read the editors.
+    Edits made outside skZemax (e.g. directly through the ZOS-API objects, or in the OpticStudio GUI)
+    are not tracked, so call with full_rescan=True after such edits.
+
+    .. code-block:: python
+
+        fingerprint = skZemax.System_Fingerprint()
+        skZemax.LDE_SetAllColumnDataOfSurfaceFromDict(2, surface_data)  # Only surface 2 is re-read below.
+        fingerprint != skZemax.System_Fingerprint()
+        skZemax.TheSystem.LDE.GetSurfaceAt(2).Thickness = 5.0  # Not tracked.
+        skZemax.System_Fingerprint(full_rescan=True)
+
+    :param full_rescan: If True the whole system is re-read, defaults to False
+    :type full_rescan: bool, optional
+    :return: A hex digest that changes when the system changes.
+    :rtype: str
+    """
+    if full_rescan:
+        self._System_MarkDirty_()
+    dirty = self._system_fingerprint_dirty
+    hashes = self._system_fingerprint_hashes
+    for region in _SYSTEM_FINGERPRINT_REGIONS_:
+        if region in ("LDE", "NCE"):
+            if (region == "LDE") != self.System_GetIfInSequentialMode():
+                hashes[region] = ""
+                continue
+            # The 'config' region is hashed first, and holds the active configuration number.
+            row_hashes = self._system_fingerprint_rows.setdefault(
+                int(hashes["config"]), {"LDE": {}, "NCE": {}}
+            )[region]
+            number_of_rows = (
+                self.LDE_GetNumberOfSurfaces()
+                if region == "LDE"
+                else self.NCE_GetNumberOfObjects() + 1
+            )
+            # The NCE has no object 0.
+            for row in range(int(region == "NCE"), number_of_rows):
+                if row not in row_hashes:
+                    row_hashes[row] = self._System_HashEditorRow_(region, row)
+            hashes[region] = hashlib.sha1(
+                "".join(
+                    row_hashes[x] for x in range(int(region == "NCE"), number_of_rows)
+                ).encode()
+            ).hexdigest()
+        elif region in dirty or region not in hashes:
+            hashes[region] = self._System_HashRegion_(region)
+    dirty.clear()
+    return hashlib.sha1(
+        "".join(hashes[x] for x in _SYSTEM_FINGERPRINT_REGIONS_).encode()
+    ).hexdigest()
+
+
+def _System_TakeSnapshot_(
+    self, wavelengths: bool = True, fields: bool = True, config: bool = True
+) -> dict:
+    """
+    Worker of :func:`System_Preserve` which reads the selected parts of the system state.
+
+    :return: The snapshot, to be given to :func:`_System_RestoreSnapshot_`.
+    :rtype: dict
+    """
+    snapshot = {}
+    if config:
+        snapshot["config"] = self.MCE_GetCurrentConfig()
+    if wavelengths:
+        system_wavelengths = self.TheSystem.SystemData.Wavelengths
+        wavelength_objects = [
+            system_wavelengths.GetWavelength(x)
+            for x in range(1, system_wavelengths.NumberOfWavelengths + 1)
+        ]
+        snapshot["wavelengths"] = [
+            (float(x.Wavelength), float(x.Weight)) for x in wavelength_objects
+        ]
+        snapshot["primary_wavelength"] = 1 + int(
+            np.argmax([bool(x.IsPrimary) for x in wavelength_objects])
+        )
+    if fields:
+        system_fields = self.TheSystem.SystemData.Fields
+        snapshot["field_type"] = system_fields.GetFieldType()
+        snapshot["field_normalization"] = system_fields.get_Normalization()
+        snapshot["fields"] = [
+            tuple(
+                float(getattr(system_fields.GetField(x), y))
+                for y in _SYSTEM_FIELD_PROPERTIES_
+            )
+            for x in range(1, system_fields.NumberOfFields + 1)
+        ]
+    return snapshot
+
+
+def _System_RestoreSnapshot_(self, snapshot: dict) -> int:
+    """
+    Worker of :func:`System_Preserve` which restores a snapshot of :func:`_System_TakeSnapshot_` with the fewest edits:
+    entries which are unchanged are left alone, changed entries are edited in place, and only missing (extra) entries are added (removed).
+
+    :param snapshot: The output of :func:`_System_TakeSnapshot_`.
+    :type snapshot: dict
+    :return: The number of edits made to the system.
+    :rtype: int
+    """
+    number_of_edits = 0
+    # The editors show the values of the active configuration, so it is restored first.
+    if "config" in snapshot and self.MCE_GetCurrentConfig() != snapshot["config"]:
+        self.MCE_SetActiveConfig(snapshot["config"])
+        number_of_edits += 1
+    if "wavelengths" in snapshot:
+        system_wavelengths = self.TheSystem.SystemData.Wavelengths
+        number_of_wavelengths = int(system_wavelengths.NumberOfWavelengths)
+        edits_before = number_of_edits
+        for idx, (wavelength_um, weight) in enumerate(snapshot["wavelengths"], 1):
+            if idx > number_of_wavelengths:
+                system_wavelengths.AddWavelength(wavelength_um, weight)
+                number_of_edits += 1
+                continue
+            wavelength = system_wavelengths.GetWavelength(idx)
+            if float(wavelength.Wavelength) != wavelength_um:
+                wavelength.Wavelength = wavelength_um
+                number_of_edits += 1
+            if float(wavelength.Weight) != weight:
+                wavelength.Weight = weight
+                number_of_edits += 1
+        primary = system_wavelengths.GetWavelength(snapshot["primary_wavelength"])
+        if not primary.IsPrimary:
+            primary.MakePrimary()
+            number_of_edits += 1
+        # Extra wavelengths are removed from the end, after the primary is restored.
+        for idx in range(number_of_wavelengths, len(snapshot["wavelengths"]), -1):
+            system_wavelengths.RemoveWavelength(idx)
+            number_of_edits += 1
+        if number_of_edits > edits_before:
+            self._System_MarkDirty_("wavelengths")
+    if "fields" in snapshot:
+        system_fields = self.TheSystem.SystemData.Fields
+        edits_before = number_of_edits
+        if str(system_fields.GetFieldType()) != str(snapshot["field_type"]):
+            system_fields.ConvertToFieldType(snapshot["field_type"])
+            number_of_edits += 1
+        if str(system_fields.get_Normalization()) != str(
+            snapshot["field_normalization"]
+        ):
+            system_fields.Normalization = snapshot["field_normalization"]
+            number_of_edits += 1
+        number_of_fields = int(system_fields.NumberOfFields)
+        for idx, values in enumerate(snapshot["fields"], 1):
+            if idx > number_of_fields:
+                field = system_fields.AddField(values[0], values[1], values[2])
+                number_of_edits += 1
+            else:
+                field = system_fields.GetField(idx)
+            for name, value in zip(_SYSTEM_FIELD_PROPERTIES_, values, strict=True):
+                if float(getattr(field, name)) != value:
+                    setattr(field, name, value)
+                    number_of_edits += 1
+        for idx in range(number_of_fields, len(snapshot["fields"]), -1):
+            system_fields.DeleteFieldAt(idx)
+            number_of_edits += 1
+        if number_of_edits > edits_before:
+            self._System_MarkDirty_("fields")
+    return number_of_edits
+
+
+@contextlib.contextmanager
+def System_Preserve(
+    self, wavelengths: bool = True, fields: bool = True, config: bool = True
+):
+    """
+    Context manager which takes a snapshot of the system wavelengths, fields, and/or active configuration, and restores them when it exits (also on errors).
+    Only the selected parts are read, and they are restored with the fewest edits (unchanged wavelengths/fields are not touched),
+    so the cached system data (see :func:`System_Fingerprint`) is kept when nothing changed.
+
+    .. code-block:: python
+
+        with skZemax.System_Preserve(wavelengths=True, fields=True, config=True):
+            skZemax.Fields_AddField(0, 0)
+            skZemax.MCE_SetActiveConfig(2)
+            ...
+        # The added field is removed, and the active configuration is back to what it was.
+
+    :param wavelengths: If True the wavelengths (values, weights, and primary) are restored, defaults to True
+    :type wavelengths: bool, optional
+    :param fields: If True the fields (type, normalization, values, weights, and vignetting factors) are restored, defaults to True
+    :type fields: bool, optional
+    :param config: If True the active configuration is restored, defaults to True
+    :type config: bool, optional
+    :yield: This skZemax instance.
+    """
+    snapshot = self._System_TakeSnapshot_(
+        wavelengths=wavelengths, fields=fields, config=config
+    )
+    try:
+        yield self
+    finally:
+        self._System_RestoreSnapshot_(snapshot)
+
+
+def _System_Preserved_(
+    wavelengths: bool = False, fields: bool = False, config: bool = False
+):
+    """
+    Decorator which runs a skZemax function inside :func:`System_Preserve`, so the selected parts of the system state are restored when it returns (or raises).
+    """
+
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(self, *args, **kwargs):
+            with self.System_Preserve(
+                wavelengths=wavelengths, fields=fields, config=config
+            ):
+                return function(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextlib.contextmanager
+def _System_SuspendUpdates_(self):
+    """
+    Worker context manager which groups many editor writes. If the application shows changes in the OpticStudio UI
+    (e.g. when connected as an interactive extension), this is turned off until it exits, so the UI is not refreshed for every write.
+    """
+    show_changes = bool(getattr(self.TheApplication, "ShowChangesInUI", False))
+    if show_changes:
+        self.TheApplication.ShowChangesInUI = False
+    try:
+        yield
+    finally:
+        if show_changes:
+            self.TheApplication.ShowChangesInUI = True
+
+
+def _System_StateFingerprint_(self) -> str:
+    """
+    Worker to compute a fingerprint of the system state that first-order (paraxial) quantities depend on:
+    the lens file, mode, active configuration, aperture, fields, wavelengths, and the type, radius, thickness, material, conic,
+    and semi-diameter of every LDE surface. Used to invalidate cached data (see :func:`System_GetFirstOrderData`).
+    Unlike :func:`System_Fingerprint`, it is always read from the system, so it also sees edits made directly through the ZOS-API.
+
+    :return: A hex digest that changes when the system state changes.
+    :rtype: str
+    """
+    state = [
+        str(self.TheSystem.SystemFile),
+        str(self.TheSystem.Mode),
+        int(self.TheSystem.MCE.CurrentConfiguration),
+        str(self.TheSystem.SystemData.Aperture.ApertureType),
+        float(self.TheSystem.SystemData.Aperture.ApertureValue),
+        str(self.TheSystem.SystemData.Fields.GetFieldType()),
+        str(self.TheSystem.SystemData.Fields.get_Normalization()),
+    ]
+    fields = self.TheSystem.SystemData.Fields
+    for idx in range(1, fields.NumberOfFields + 1):
+        field = fields.GetField(idx)
+        state += [float(field.X), float(field.Y), float(field.Weight)]
+    wavelengths = self.TheSystem.SystemData.Wavelengths
+    for idx in range(1, wavelengths.NumberOfWavelengths + 1):
+        wavelength = wavelengths.GetWavelength(idx)
+        state += [
+            float(wavelength.Wavelength),
+            float(wavelength.Weight),
+            bool(wavelength.IsPrimary),
+        ]
+    # The mode is read directly (not from the cached metadata), as everything else here.
+    if int(self.TheSystem.Mode) == 0:
+        for idx in range(self.TheSystem.LDE.NumberOfSurfaces):
+            surface = self.TheSystem.LDE.GetSurfaceAt(idx)
+            state += [
+                str(surface.TypeName),
+                float(surface.Radius),
+                float(surface.Thickness),
+                str(surface.Material),
+                float(surface.Conic),
+                float(surface.SemiDiameter),
+            ]
+    return hashlib.sha1(repr(state).encode()).hexdigest()
+
+
+def System_GetFirstOrderData(self, use_cache: bool = True) -> Box:
+    """
+    Returns first-order (paraxial) data of the sequential system, read directly through the ZOS-API (LDE.GetFirstOrderData() and LDE.GetPupil()).
+    This is much faster than :func:`Analyses_GetGeneralLensData`, which writes and parses the whole prescription report.
+    If the direct ZOS-API calls fail, the data is taken from :func:`Analyses_GetGeneralLensData` instead.
+
+    The data is cached and only re-read when the system state changes (see :func:`_System_StateFingerprint_`). The state is read on every call,
+    so edits made directly through the ZOS-API (e.g. `surface.Thickness = x`) are seen as well.
+
+    Returned keys are:
+
+    - EffectiveFocalLength
+    - WorkingFNumber (real)
+    - ParaxialWorkingFNumber
+    - ImageSpaceFNumber
+    - ParaxialImageHeight
+    - ParaxialMagnification
+    - EntrancePupilDiameter
+    - EntrancePupilPosition
+    - ExitPupilDiameter
+    - ExitPupilPosition
+    - ApertureType
+    - ApertureValue
+
+    :param use_cache: If False the data is always re-read, defaults to True
+    :type use_cache: bool, optional
+    :return: dict[quantity] = value, in lens units.
+    :rtype: Box
+    """
+    fingerprint = self._System_StateFingerprint_()
+    if (
+        use_cache
+        and self._first_order_cache is not None
+        and self._first_order_cache[0] == fingerprint
+    ):
+        return Box(self._first_order_cache[1].to_dict())
+    try:
+        # Out parameters are returned as a tuple (led by the return value, if any).
+        efl, working_fno, paraxial_fno, image_height, magnification = list(
+            self.TheSystem.LDE.GetFirstOrderData(0.0, 0.0, 0.0, 0.0, 0.0)
+        )[-5:]
+        pupil = self.TheSystem.LDE.GetPupil()
+        out = Box(
+            {
+                "EffectiveFocalLength": float(efl),
+                "WorkingFNumber": float(working_fno),
+                "ParaxialWorkingFNumber": float(paraxial_fno),
+                "ImageSpaceFNumber": float(efl) / float(pupil.EntrancePupilDiameter),
+                "ParaxialImageHeight": float(image_height),
+                "ParaxialMagnification": float(magnification),
+                "EntrancePupilDiameter": float(pupil.EntrancePupilDiameter),
+                "EntrancePupilPosition": float(pupil.EntrancePupilPosition),
+                "ExitPupilDiameter": float(pupil.ExitPupilDiameter),
+                "ExitPupilPosition": float(pupil.ExitPupilPosition),
+                "ApertureType": str(pupil.ApertureType),
+                "ApertureValue": float(pupil.ApertureValue),
+            }
+        )
+    except (AttributeError, TypeError, ValueError, System.Exception) as e:
+        if self._verbose:
+            cp(
+                f"!@ly!@System_GetFirstOrderData :: Direct ZOS-API read failed ([!@lm!@{e}!@ly!@]). Parsing the prescription report instead."
+            )
+        lens_data = self.Analyses_GetGeneralLensData()
+        text_keys = {
+            "EffectiveFocalLength": "EffectiveFocalLengthInAirAtSystemTemperatureAndPressure",
+            "WorkingFNumber": "WorkingF/#",
+            "ParaxialWorkingFNumber": "ParaxialWorkingF/#",
+            "ImageSpaceFNumber": "ImageSpaceF/#",
+            "ParaxialImageHeight": "ParaxialImageHeight",
+            "ParaxialMagnification": "ParaxialMagnification",
+            "EntrancePupilDiameter": "EntrancePupilDiameter",
+            "EntrancePupilPosition": "EntrancePupilPosition",
+            "ExitPupilDiameter": "ExitPupilDiameter",
+            "ExitPupilPosition": "ExitPupilPosition",
+        }
+        out = Box(
+            {
+                key: lens_data[value]
+                for key, value in text_keys.items()
+                if value in lens_data
+            }
+        )
+        out["ApertureType"] = str(self.TheSystem.SystemData.Aperture.ApertureType)
+        out["ApertureValue"] = float(self.TheSystem.SystemData.Aperture.ApertureValue)
+    self._first_order_cache = (fingerprint, out)
+    return Box(out.to_dict())
@@ -208,7 +208,12 @@ def Utilities_OpenZemaxFile(self, in_file_path: str, save_first: bool = False):
                 "Saved current Zemax file." if save_first else "", in_file_path
             )
         )
+    self.Analyses_CloseAllAnalyses()
     self.TheSystem.LoadFile(in_file_path, save_first)
+    self._NCE_InvalidateDetectorIndex_()
+    self._Analysis_ClearSettingsCache_()
+    self._first_order_cache = None
+    self._System_MarkDirty_()
 
 
 def Utilities_MakeNewZemaxFile(
@@ -222,8 +227,13 @@ def Utilities_MakeNewZemaxFile(
     :param save_first: Indicates if one should save the current Zemax file (if any) before making the new file, defaults to False
     :type save_first: bool, optional
     """
+    self.Analyses_CloseAllAnalyses()
     self.TheSystem.New(save_first)
     self.TheSystem.SaveAs(str(in_file_path))
+    self._NCE_InvalidateDetectorIndex_()
+    self._Analysis_ClearSettingsCache_()
+    self._first_order_cache = None
+    self._System_MarkDirty_()
     if self._verbose:
         cp(
             "!@lg!@MakeNewZemaxFile :: {} New Zemax file [!@lm!@{}!@lg!@] created.".format(
@@ -262,11 +272,4 @@ def Utilities_GetAllSystemUnits(self) -> Box:
     :return: dict[property] = "units"
     :rtype: Box
     """
-    out = Box({})
-    unit_kinds = [
-        x for x in dir(self.TheSystem.SystemData.Units) if "get_" in x
-    ]  # and 'Prefix' not in x]
-    for kind in unit_kinds:
-        f = getattr(self.TheSystem.SystemData.Units, kind)
-        out[kind.split("get_")[-1]] = str(f())
-    return out
+    return Box(self._System_GetMetadata_()["units"])
@@ -0,0 +1,430 @@
+from __future__ import annotations
+
+import numpy as np
+import xarray as xr
+from scipy.ndimage import map_coordinates
+
+from skZemax.skZemax_subfunctions._c_print import c_print as cp
+from skZemax.skZemax_subfunctions._field_functions import (
+    ZOSAPI_SystemData_IField,
+)
+from skZemax.skZemax_subfunctions._wavelength_functions import (
+    ZOSAPI_SystemData_IWavelength,
+)
+
+# Micrometers per lens unit. Used to convert OPD given in lens units to waves.
+_MICROMETERS_PER_LENS_UNIT_ = {
+    "Millimeters": 1e3,
+    "Centimeters": 1e4,
+    "Inches": 25.4e3,
+    "Meters": 1e6,
+}
+
+
+def _Wavefront_FieldNormalization_(self) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Worker to return the system field values and the (x, y) values that normalize them to (Hx, Hy).
+    See :func:`LDE_BuildRayTraceNormalizedUnpolarizedRays` for the radial and rectangular normalization definitions.
+
+    :return: Array of shape (number of fields, 2) with the (X, Y) of each field, and the array of the (x, y) normalization.
+    :rtype: tuple[np.ndarray, np.ndarray]
+    """
+    all_fields = np.array(
+        [
+            [
+                float(self.Field_GetField(x + 1).X),
+                float(self.Field_GetField(x + 1).Y),
+            ]
+            for x in range(self.Fields_GetNumberOfFields())
+        ]
+    )
+    if "Rect" in self.Field_GetNormalization():
+        norm = np.abs(all_fields).max(axis=0)
+    else:
+        norm = np.repeat(np.hypot(all_fields[:, 0], all_fields[:, 1]).max(), 2)
+    norm[norm == 0] = 1.0
+    return all_fields, norm
+
+
+def _Wavefront_NormalizedFieldCoordinates_(self, fields: np.ndarray) -> np.ndarray:
+    """
+    Worker to compute the normalized field coordinates (Hx, Hy) of system fields.
+
+    :param fields: Field numbers.
+    :type fields: np.ndarray
+    :return: Array of shape (number of fields, 2) with the (Hx, Hy) of each field.
+    :rtype: np.ndarray
+    """
+    all_fields, norm = self._Wavefront_FieldNormalization_()
+    # Shrink by a hair so the ray builder's |H| <= 1 checks never drop an edge field to round-off.
+    return all_fields[np.asarray(fields) - 1] / norm * (1 - 1e-12)
+
+
+def Wavefront_GetPupilFunction(
+    self,
+    wavelength: int | float | ZOSAPI_SystemData_IWavelength = 0,
+    field: int | ZOSAPI_SystemData_IField = 0,
+    pupil_sampling: int = 64,
+    opd_in_waves: bool = True,
+    field_coordinates: np.ndarray | None = None,
+) -> xr.Dataset:
+    """
+    Traces a square grid of rays over the (normalized, circular) entrance pupil to the image surface with :func:`LDE_RunRayTrace`
+    and arranges the OPD (`OPD_mode="CurrentAndChief"`), intensity, and vignetting of each ray into pupil grids.
+    All fields and wavelengths are traced in a single batch ray trace.
+
+    :param wavelength: System wavelength (as index, microns, or object). An int of 0 selects all wavelengths, defaults to 0
+    :type wavelength: int | float | ZOSAPI_SystemData_IWavelength, optional
+    :param field: System field (index or object). An int of 0 selects all fields, defaults to 0
+    :type field: int | ZOSAPI_SystemData_IField, optional
+    :param pupil_sampling: Number of rays across the pupil diameter, defaults to 64
+    :type pupil_sampling: int, optional
+    :param opd_in_waves: If True the ray trace OPD is taken to be in waves, else in lens units (and converted to waves), defaults to True
+    :type opd_in_waves: bool, optional
+    :param field_coordinates: Array of shape (number of points, 2) of normalized field coordinates (Hx, Hy) to trace instead of the system fields.
+                              Points outside of the normalized field are moved onto its edge. The 'field' coordinate is then the point number (from 1), defaults to None
+    :type field_coordinates: np.ndarray | None, optional
+    :return: Dataset of the 'opd' (waves), 'amplitude', and 'mask' (valid, unvignetted rays) on (field, wvln, py, px).
+    :rtype: xr.Dataset
+    """
+    all_fields, norm = self._Wavefront_FieldNormalization_()
+    if field_coordinates is not None:
+        H = np.atleast_2d(np.asarray(field_coordinates, dtype=float))
+        if "Rect" in self.Field_GetNormalization():
+            H = np.clip(H, -1.0, 1.0)
+        else:
+            H = H / np.maximum(np.hypot(H[:, 0], H[:, 1]), 1.0)[:, np.newaxis]
+        H = H * (1 - 1e-12)
+        fields = np.arange(1, H.shape[0] + 1)
+        field_values = H * norm
+    else:
+        if not (isinstance(field, int) and field == 0):
+            fields = np.array(
+                [self._convert_raw_field_input_(field, return_index=True)]
+            )
+        else:
+            fields = np.arange(1, self.Fields_GetNumberOfFields() + 1)
+        H = self._Wavefront_NormalizedFieldCoordinates_(fields)
+        field_values = all_fields[fields - 1]
+    system_wavelengths_um = self.Wavelength_GetAllSystemWavelengthsAsMicrometers()
+    system_weights = self.Wavelength_GetAllSystemWavelengthsWeights()
+    if not (isinstance(wavelength, int) and wavelength == 0):
+        wavelength_idx = self._convert_raw_wavelength_input_(
+            wavelength, return_index=True
+        )
+        wavelengths_um = np.array([system_wavelengths_um[wavelength_idx - 1]])
+    else:
+        wavelengths_um = np.array(system_wavelengths_um)
+    working_f_number = float(self.System_GetFirstOrderData().WorkingFNumber)
+    units = self.Utilities_GetAllSystemUnits()
+
+    # Square pupil grid, keeping the points inside the unit circle (the same check the ray builder does).
+    pupil_coords = np.linspace(-1, 1, int(pupil_sampling))
+    PX, PY = np.meshgrid(pupil_coords, pupil_coords)
+    inside = np.sqrt(PX**2 + PY**2) <= 1
+    rays = self.LDE_BuildRayTraceNormalizedUnpolarizedRays(
+        Hx=np.repeat(H[:, 0], inside.sum()),
+        Hy=np.repeat(H[:, 1], inside.sum()),
+        Px=np.tile(PX[inside], fields.shape[0]),
+        Py=np.tile(PY[inside], fields.shape[0]),
+        do_all_surfaces_to_ending=False,
+        primary_wavelength=float(wavelengths_um[0]),
+        wavelengths=wavelengths_um.astype(float),
+        OPD_mode="CurrentAndChief",
+        should_take_rays_one_to_one=True,
+    )
+    if rays is None or rays.ray.shape[0] != fields.shape[0] * inside.sum():
+        cp(
+            "!@lr!@Wavefront_GetPupilFunction :: Could not build one ray per pupil grid point and field."
+        )
+        return None
+    if self._verbose:
+        cp(
+            f"!@lg!@Wavefront_GetPupilFunction :: Tracing [!@lm!@{rays.ray.shape[0]}!@lg!@] rays over [!@lm!@{rays.wvln.shape[0]}!@lg!@] wavelengths."
+        )
+    traced = self._LDE_RaysByField_(self.LDE_RunRayTrace(rays).isel(surf=-1), fields)
+
+    def _to_grid_(in_values: np.ndarray, fill_value) -> np.ndarray:
+        # (wvln, field, pupil_ray) -> (field, wvln, py, px)
+        grid = np.full(
+            (fields.shape[0], in_values.shape[0]) + inside.shape,
+            fill_value,
+            dtype=in_values.dtype,
+        )
+        grid[:, :, inside] = np.moveaxis(in_values, 1, 0)
+        return grid
+
+    traced_wavelengths_um = traced.wavelengths.values.astype(float)
+    opd = traced.OPD.transpose("wvln", "field", "pupil_ray").values.astype(float)
+    if not opd_in_waves:
+        opd = (
+            opd
+            * _MICROMETERS_PER_LENS_UNIT_.get(str(units["LensUnits"]), 1e3)
+            / traced_wavelengths_um[:, np.newaxis, np.newaxis]
+        )
+    valid = np.logical_and(
+        ~traced.error.transpose("wvln", "field", "pupil_ray").values.astype(bool),
+        traced.vignette.transpose("wvln", "field", "pupil_ray").values == 0,
+    )
+    intensity = traced.intensity.transpose("wvln", "field", "pupil_ray").values
+    weights = np.array(
+        [
+            system_weights[np.argmin(np.abs(system_wavelengths_um - x))]
+            for x in traced_wavelengths_um
+        ]
+    ).astype(float)
+    mask = _to_grid_(valid, False)
+    return xr.Dataset(
+        {
+            "opd": (
+                ("field", "wvln", "py", "px"),
+                np.where(mask, _to_grid_(opd, np.nan), np.nan),
+                {"units": "waves"},
+            ),
+            "amplitude": (
+                ("field", "wvln", "py", "px"),
+                np.where(mask, np.sqrt(np.abs(_to_grid_(intensity, 0.0))), 0.0),
+            ),
+            "mask": (("field", "wvln", "py", "px"), mask),
+        },
+        coords={
+            "field": ("field", fields),
+            "field_x": ("field", field_values[:, 0]),
+            "field_y": ("field", field_values[:, 1]),
+            "Hx": ("field", H[:, 0]),
+            "Hy": ("field", H[:, 1]),
+            "wavelengths": ("wvln", traced_wavelengths_um, {"units": "microns"}),
+            "weights": ("wvln", weights),
+            "px": ("px", pupil_coords),
+            "py": ("py", pupil_coords),
+        },
+        attrs={
+            "Field_Type": str(self.Field_GetFieldType()),
+            "Lens_Units": str(units["LensUnits"]),
+            "Working_F_Number": working_f_number,
+            "MCE_Configuration": int(self.MCE_GetCurrentConfig()),
+        },
+    )
+
+
+def Wavefront_ComputePSF(
+    self,
+    pupil: xr.Dataset,
+    padding_factor: int | float = 4,
+    normalize: bool = False,
+) -> xr.Dataset:
+    """
+    Computes the PSF of pupil functions from :func:`Wavefront_GetPupilFunction` by zero-padded FFT, batched over all fields and wavelengths.
+
+    The PSF of each wavelength has an image spacing of wavelength * working F/# * (pupil_sampling - 1) / (padding_factor * pupil_sampling).
+    All PSFs are interpolated onto the grid of the first (primary) wavelength, where the polychromatic PSF is the weighted sum of the
+    monochromatic PSFs, each normalized to unit energy first.
+
+    Without normalization the PSFs are relative to the peak of the diffraction limited PSF (i.e. the peak is the Strehl ratio).
+
+    :param pupil: Pupil functions from :func:`Wavefront_GetPupilFunction`.
+    :type pupil: xr.Dataset
+    :param padding_factor: Size of the FFT grid relative to the pupil sampling. Must be at least 2 for an unaliased MTF, defaults to 4
+    :type padding_factor: int | float, optional
+    :param normalize: If True every PSF is normalized to a peak of 1, defaults to False
+    :type normalize: bool, optional
+    :return: Dataset of the 'psf' on (field, wvln, y, x), the 'psf_polychromatic' on (field, y, x), and the 'strehl_ratio' on (field, wvln).
+    :rtype: xr.Dataset
+    """
+    number_of_pupil_points = pupil.px.shape[0]
+    fft_size = int(np.round(number_of_pupil_points * padding_factor))
+    wavelengths_um = pupil.wavelengths.values.astype(float)
+    spacing_um = (
+        wavelengths_um
+        * float(pupil.attrs["Working_F_Number"])
+        * (number_of_pupil_points - 1)
+        / fft_size
+    )
+    amplitude = pupil.amplitude.values
+    pupil_function = amplitude * np.exp(2j * np.pi * np.nan_to_num(pupil.opd.values))
+    # Peak of the diffraction limited PSF is the square of the summed amplitude.
+    diffraction_peak = amplitude.sum(axis=(-2, -1)) ** 2
+    diffraction_peak[diffraction_peak == 0] = 1.0
+    psf = (
+        np.abs(
+            np.fft.fftshift(
+                np.fft.fft2(pupil_function, s=(fft_size, fft_size)), axes=(-2, -1)
+            )
+        )
+        ** 2
+        / diffraction_peak[..., np.newaxis, np.newaxis]
+    )
+    diffraction_psf = (
+        np.abs(
+            np.fft.fftshift(
+                np.fft.fft2(amplitude, s=(fft_size, fft_size)), axes=(-2, -1)
+            )
+        )
+        ** 2
+        / diffraction_peak[..., np.newaxis, np.newaxis]
+    )
+    strehl_ratio = psf.max(axis=(-2, -1))
+
+    # Resample all wavelengths onto the grid of the first wavelength.
+    center = fft_size // 2
+    reference_coords = (np.arange(fft_size) - center) * spacing_um[0]
+    for wvln_idx in range(1, wavelengths_um.shape[0]):
+        sample_idx = reference_coords / spacing_um[wvln_idx] + center
+        rows, cols = np.meshgrid(sample_idx, sample_idx, indexing="ij")
+        for field_idx in range(psf.shape[0]):
+            for grid in [psf, diffraction_psf]:
+                grid[field_idx, wvln_idx] = map_coordinates(
+                    grid[field_idx, wvln_idx], [rows, cols], order=1, cval=0.0
+                )
+
+    def _polychromatic_(in_psf: np.ndarray) -> np.ndarray:
+        energy = in_psf.sum(axis=(-2, -1), keepdims=True)
+        energy[energy == 0] = 1.0
+        weights = pupil.weights.values.astype(float)
+        weights = weights / weights.sum() if weights.sum() > 0 else weights
+        return np.einsum("fwyx,w->fyx", in_psf / energy, weights)
+
+    psf_polychromatic = _polychromatic_(psf)
+    diffraction_polychromatic_peak = _polychromatic_(diffraction_psf).max(
+        axis=(-2, -1), keepdims=True
+    )
+    diffraction_polychromatic_peak[diffraction_polychromatic_peak == 0] = 1.0
+    psf_polychromatic = psf_polychromatic / diffraction_polychromatic_peak
+    if normalize:
+        psf = psf / np.maximum(
+            psf.max(axis=(-2, -1), keepdims=True), np.finfo(float).tiny
+        )
+        psf_polychromatic = psf_polychromatic / np.maximum(
+            psf_polychromatic.max(axis=(-2, -1), keepdims=True), np.finfo(float).tiny
+        )
+    return xr.Dataset(
+        {
+            "psf": (("field", "wvln", "y", "x"), psf),
+            "psf_polychromatic": (("field", "y", "x"), psf_polychromatic),
+            "strehl_ratio": (("field", "wvln"), strehl_ratio),
+        },
+        coords={
+            "field": pupil.field,
+            "field_x": pupil.field_x,
+            "field_y": pupil.field_y,
+            "Hx": pupil.Hx,
+            "Hy": pupil.Hy,
+            "wavelengths": pupil.wavelengths,
+            "weights": pupil.weights,
+            "x": ("x", reference_coords, {"units": "micrometers"}),
+            "y": ("y", reference_coords, {"units": "micrometers"}),
+        },
+        attrs={
+            **pupil.attrs,
+            "Padding_Factor": float(padding_factor),
+            "Pupil_Sampling": int(number_of_pupil_points),
+            "Data_Spacing_um": float(spacing_um[0]),
+        },
+    )
+
+
+def Wavefront_ComputeMTF(
+    self, psf: xr.Dataset, variable: str = "psf_polychromatic"
+) -> xr.Dataset:
+    """
+    Computes the MTF and PTF from a PSF of :func:`Wavefront_ComputePSF` (the normalized Fourier transform of the PSF),
+    along the x and y directions of the image grid.
+
+    :param psf: PSF dataset from :func:`Wavefront_ComputePSF`.
+    :type psf: xr.Dataset
+    :param variable: The PSF variable to use ('psf_polychromatic' or 'psf'), defaults to "psf_polychromatic"
+    :type variable: str, optional
+    :return: Dataset of the 'modulation', 'phase' (degrees), 'real_part', 'imag_part', and 'square_wave' on (..., freq, direction).
+    :rtype: xr.Dataset
+    """
+    data = psf[variable].transpose(..., "y", "x")
+    values = data.values
+    fft_size = values.shape[-1]
+    otf = np.fft.fft2(np.fft.ifftshift(values, axes=(-2, -1)), axes=(-2, -1))
+    zero = otf[..., 0:1, 0:1].copy()
+    zero[zero == 0] = 1.0
+    otf = otf / zero
+    number_of_freq = fft_size // 2
+    freq = np.fft.fftfreq(fft_size, d=float(psf.attrs["Data_Spacing_um"]) * 1e-3)[
+        :number_of_freq
+    ]
+    otf_xy = np.stack(
+        [otf[..., 0, :number_of_freq], otf[..., :number_of_freq, 0]], axis=-1
+    )
+    modulation = np.abs(otf_xy)
+    dims = data.dims[:-2] + ("freq", "direction")
+    return xr.Dataset(
+        {
+            "modulation": (dims, modulation),
+            "phase": (dims, np.rad2deg(np.angle(otf_xy))),
+            "real_part": (dims, otf_xy.real),
+            "imag_part": (dims, otf_xy.imag),
+            "square_wave": (
+                dims,
+                self._Analysis_SquareWaveFromMTF_(freq, modulation, axis=-2),
+            ),
+        },
+        coords={
+            **{k: v for k, v in data.coords.items() if k not in ["x", "y"]},
+            "freq": ("freq", freq, {"units": "cycles/mm"}),
+            "direction": ("direction", np.array(["x", "y"])),
+        },
+        attrs={
+            **psf.attrs,
+            "Cutoff_Frequency": float(
+                1.0
+                / (
+                    psf.wavelengths.values[0]
+                    * 1e-3
+                    * float(psf.attrs["Working_F_Number"])
+                )
+            ),
+        },
+    )
+
+
+def Wavefront_GetPSFAndMTF(
+    self,
+    wavelength: int | float | ZOSAPI_SystemData_IWavelength = 0,
+    field: int | ZOSAPI_SystemData_IField = 0,
+    pupil_sampling: int = 64,
+    padding_factor: int | float = 4,
+    normalize: bool = False,
+    opd_in_waves: bool = True,
+) -> xr.Dataset:
+    """
+    Computes the PSF and MTF of the system locally from a batch ray trace of the pupil OPD (see :func:`Wavefront_GetPupilFunction`,
+    :func:`Wavefront_ComputePSF`, and :func:`Wavefront_ComputeMTF`). This is much faster than :func:`Analyses_FFTPSF`/:func:`Analyses_FFTMTF`
+    for many fields and wavelengths, at the cost of OpticStudio's refinements (e.g. polarization, pupil aberration corrections).
+
+    :param wavelength: System wavelength (as index, microns, or object). An int of 0 selects all wavelengths, defaults to 0
+    :type wavelength: int | float | ZOSAPI_SystemData_IWavelength, optional
+    :param field: System field (index or object). An int of 0 selects all fields, defaults to 0
+    :type field: int | ZOSAPI_SystemData_IField, optional
+    :param pupil_sampling: Number of rays across the pupil diameter, defaults to 64
+    :type pupil_sampling: int, optional
+    :param padding_factor: Size of the FFT grid relative to the pupil sampling, defaults to 4
+    :type padding_factor: int | float, optional
+    :param normalize: If True every PSF is normalized to a peak of 1, defaults to False
+    :type normalize: bool, optional
+    :param opd_in_waves: If True the ray trace OPD is taken to be in waves, else in lens units, defaults to True
+    :type opd_in_waves: bool, optional
+    :return: Dataset of the PSF variables and the polychromatic MTF variables (prefixed 'mtf_').
+    :rtype: xr.Dataset
+    """
+    pupil = self.Wavefront_GetPupilFunction(
+        wavelength=wavelength,
+        field=field,
+        pupil_sampling=pupil_sampling,
+        opd_in_waves=opd_in_waves,
+    )
+    if pupil is None:
+        return None
+    psf = self.Wavefront_ComputePSF(
+        pupil, padding_factor=padding_factor, normalize=normalize
+    )
+    mtf = self.Wavefront_ComputeMTF(psf)
+    return psf.merge(
+        mtf.rename({x: f"mtf_{x}" for x in mtf.data_vars}),
+        combine_attrs="drop_conflicts",
+    )
@@ -69,6 +69,7 @@ def Wavelength_SelectWavelengthPreset(self, preset: str = "d_0p587") -> None:
             self.ZOSAPI.SystemData.WavelengthPreset,
             str(wvln_presets[int(np.where(bool_mask)[0][0])]),
         )
+        self._System_MarkDirty_("wavelengths")
         self.TheSystem.SystemData.Wavelengths.SelectWavelengthPreset(preset_enum)
     else:
         cp(
@@ -93,12 +94,7 @@ def Wavelength_GetAllSystemWavelengthsAsMicrometers(self) -> np.ndarray:
     :return: The wavelengths configured in the system.
     :rtype: np.ndarray
     """
-    return np.array(
-        [
-            self._convert_raw_wavelength_input_(x, return_index=False).Wavelength
-            for x in range(1, self.Wavelength_GetNumberOfWavelengths() + 1, 1)
-        ]
-    )
+    return self._System_GetMetadata_()["wavelengths_um"].copy()
 
 
 def Wavelength_GetAllSystemWavelengthsWeights(self) -> np.ndarray:
@@ -108,12 +104,7 @@ def Wavelength_GetAllSystemWavelengthsWeights(self) -> np.ndarray:
     :return: The wavelength weights configured in the system.
     :rtype: np.ndarray
     """
-    return np.array(
-        [
-            self._convert_raw_wavelength_input_(x, return_index=False).Weight
-            for x in range(1, self.Wavelength_GetNumberOfWavelengths() + 1, 1)
-        ]
-    )
+    return self._System_GetMetadata_()["wavelength_weights"].copy()
 
 
 def Wavelength_GetWavelength(
@@ -188,6 +179,7 @@ def Wavelength_RemoveWavelength(
     :return: True if the wavelength is valid and there were at least two wavelengths in the system, else False.
     :rtype: bool
     """
+    self._System_MarkDirty_("wavelengths")
     return self.TheSystem.SystemData.Wavelengths.RemoveWavelength(
         self._convert_raw_wavelength_input_(in_wavelength, return_index=True)
     )
@@ -251,6 +243,7 @@ def Wavelength_AddWavelength(
     :return: The newly added wavelength object.
     :rtype: ZOSAPI_SystemData_IWavelength
     """
+    self._System_MarkDirty_("wavelengths")
     return self.TheSystem.SystemData.Wavelengths.AddWavelength(
         float(wavelength_micrometers), float(wavelength_weight)
     )
@@ -271,6 +264,7 @@ def Wavelength_SetPrimaryWavelength(
         in_wavelength, return_index=False
     )
     wavelength_object.MakePrimary()
+    self._System_MarkDirty_("wavelengths")
     return wavelength_object
 
 
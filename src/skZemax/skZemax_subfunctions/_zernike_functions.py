@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import hashlib
+from math import factorial
+
+import numpy as np
+import xarray as xr
+
+from skZemax.skZemax_subfunctions._c_print import c_print as cp
+
+# Number of basis matrices kept by _Zernike_GetBasis_().
+_ZERNIKE_BASIS_CACHE_SIZE_ = 16
+
+
+@staticmethod
+def Zernike_GetTermIndices(
+    number_of_terms: int = 37, ordering: str = "Fringe"
+) -> np.ndarray:
+    """
+    Returns the radial order n and the azimuthal frequency m of the first Zernike terms in either ordering:
+
+    - Fringe
+        The Zemax 'Zernike Fringe' ordering of up to 37 terms (Z1 piston, Z2/Z3 tilt, Z4 focus, ..., Z37 is the 12th order spherical).
+        The terms are not normalized (peak of 1 at the pupil edge).
+    - Standard
+        The Zemax 'Zernike Standard' (Noll) ordering. The terms are normalized to an RMS of 1 over the unit circle.
+
+    A positive m is a cos(m*theta) term and a negative m a sin(|m|*theta) term.
+
+    :param number_of_terms: Number of Zernike terms, defaults to 37
+    :type number_of_terms: int, optional
+    :param ordering: 'Fringe' or 'Standard', defaults to "Fringe"
+    :type ordering: str, optional
+    :return: Array of shape (number_of_terms, 2) of (n, m) per term.
+    :rtype: np.ndarray
+    """
+    out = []
+    if ordering.lower() == "standard":
+        for j in range(1, int(number_of_terms) + 1):
+            n, j1 = 0, j - 1
+            while j1 > n:
+                n += 1
+                j1 -= n
+            m = (-1) ** j * ((n % 2) + 2 * int((j1 + ((n + 1) % 2)) / 2.0))
+            out.append([n, m])
+    elif ordering.lower() == "fringe":
+        if int(number_of_terms) > 37:
+            cp(
+                f"!@lr!@Zernike_GetTermIndices :: The Fringe ordering has 37 terms, [!@lm!@{number_of_terms}!@lr!@] were requested."
+            )
+            return None
+        # Terms are grouped by (n + |m|)/2, each group in order of decreasing m. The 37th term is the 12th order spherical.
+        for k in range(6):
+            for m in range(k, -1, -1):
+                out.append([2 * k - m, m])
+                if m > 0:
+                    out.append([2 * k - m, -m])
+        out.append([12, 0])
+    else:
+        cp(
+            f"!@lr!@Zernike_GetTermIndices :: Unknown ordering [!@lm!@{ordering}!@lr!@]. Use 'Fringe' or 'Standard'."
+        )
+        return None
+    return np.array(out[0 : int(number_of_terms)]).astype(int)
+
+
+@staticmethod
+def Zernike_Evaluate(
+    Px: np.ndarray, Py: np.ndarray, number_of_terms: int = 37, ordering: str = "Fringe"
+) -> np.ndarray:
+    """
+    Evaluates Zernike terms (see :func:`Zernike_GetTermIndices`) at normalized pupil coordinates.
+
+    :param Px: Normalized x pupil coordinates.
+    :type Px: np.ndarray
+    :param Py: Normalized y pupil coordinates.
+    :type Py: np.ndarray
+    :param number_of_terms: Number of Zernike terms, defaults to 37
+    :type number_of_terms: int, optional
+    :param ordering: 'Fringe' or 'Standard', defaults to "Fringe"
+    :type ordering: str, optional
+    :return: Array of shape (number of points, number_of_terms).
+    :rtype: np.ndarray
+    """
+    indices = Zernike_GetTermIndices(number_of_terms, ordering)
+    if indices is None:
+        return None
+    rho = np.hypot(np.asarray(Px, dtype=float), np.asarray(Py, dtype=float))
+    theta = np.arctan2(np.asarray(Py, dtype=float), np.asarray(Px, dtype=float))
+    out = np.zeros((rho.shape[0], indices.shape[0]))
+    for idx, (n, m) in enumerate(indices):
+        radial = np.zeros_like(rho)
+        for k in range((n - abs(m)) // 2 + 1):
+            radial += (
+                (-1) ** k
+                * factorial(n - k)
+                / (
+                    factorial(k)
+                    * factorial((n + abs(m)) // 2 - k)
+                    * factorial((n - abs(m)) // 2 - k)
+                )
+                * rho ** (n - 2 * k)
+            )
+        if m > 0:
+            radial *= np.cos(m * theta)
+        elif m < 0:
+            radial *= np.sin(-m * theta)
+        if ordering.lower() == "standard":
+            radial *= np.sqrt(n + 1) if m == 0 else np.sqrt(2 * (n + 1))
+        out[:, idx] = radial
+    return out
+
+
+def _Zernike_GetBasis_(
+    self, Px: np.ndarray, Py: np.ndarray, number_of_terms: int, ordering: str
+) -> np.ndarray:
+    """
+    Worker to return the Zernike basis matrix of a pupil sampling pattern (see :func:`Zernike_Evaluate`).
+    Basis matrices are cached by the pupil coordinates, so repeated fits with the same pupil sampling only evaluate the polynomials once.
+
+    :return: Array of shape (number of points, number_of_terms).
+    :rtype: np.ndarray
+    """
+    Px = np.ascontiguousarray(Px, dtype=float)
+    Py = np.ascontiguousarray(Py, dtype=float)
+    key = (
+        ordering.lower(),
+        int(number_of_terms),
+        hashlib.sha1(Px.tobytes() + Py.tobytes()).hexdigest(),
+    )
+    if key not in self._zernike_basis_cache:
+        basis = Zernike_Evaluate(Px, Py, number_of_terms, ordering)
+        if basis is None:
+            return None
+        if len(self._zernike_basis_cache) >= _ZERNIKE_BASIS_CACHE_SIZE_:
+            self._zernike_basis_cache.pop(next(iter(self._zernike_basis_cache)))
+        self._zernike_basis_cache[key] = basis
+    return self._zernike_basis_cache[key]
+
+
+def Zernike_FitRayTraceOPD(
+    self,
+    ray_trace_rays: xr.Dataset,
+    number_of_terms: int = 37,
+    ordering: str = "Fringe",
+) -> xr.Dataset:
+    """
+    Fits Zernike terms to the OPD of a ray trace from :func:`LDE_RunRayTrace` (traced to the image surface with an `OPD_mode` other than 'None').
+
+    The rays are grouped into fields by their unique normalized field coordinates (Hx, Hy). Errored and vignetted rays are masked out.
+    All fields and wavelengths are fit at once by batched (masked) least squares, with the basis matrix cached per pupil sampling pattern.
+
+    .. code-block:: python
+
+        rays = skZemax.LDE_BuildRayTraceNormalizedUnpolarizedRays(
+            Hx=np.array([0.0, 0.0, 0.0]),
+            Hy=np.array([0.0, 0.7, 1.0]),
+            Px=np.linspace(-1, 1, 33),
+            Py=np.linspace(-1, 1, 33),
+            do_all_surfaces_to_ending=False,
+            OPD_mode="CurrentAndChief",
+        )
+        zernikes = skZemax.Zernike_FitRayTraceOPD(skZemax.LDE_RunRayTrace(rays))
+
+    :param ray_trace_rays: Traced rays from :func:`LDE_RunRayTrace`.
+    :type ray_trace_rays: xr.Dataset
+    :param number_of_terms: Number of Zernike terms to fit, defaults to 37
+    :type number_of_terms: int, optional
+    :param ordering: 'Fringe' or 'Standard' (see :func:`Zernike_GetTermIndices`), defaults to "Fringe"
+    :type ordering: str, optional
+    :return: Dataset of the 'coefficient' on (wvln, field, term), and the 'rms_residual', 'rms_wavefront', and 'number_of_rays' on (wvln, field).
+    :rtype: xr.Dataset
+    """
+    if "OPD" not in ray_trace_rays or str(ray_trace_rays.attrs["OPD_mode"]) == "None":
+        cp(
+            "!@lr!@Zernike_FitRayTraceOPD :: The rays have no OPD. Trace them to the image surface with an OPD_mode other than 'None'."
+        )
+        return None
+    rays = (
+        ray_trace_rays.isel(surf=-1)
+        if "surf" in ray_trace_rays.dims
+        else ray_trace_rays
+    )
+    indices = Zernike_GetTermIndices(number_of_terms, ordering)
+    if indices is None:
+        return None
+    basis = self._Zernike_GetBasis_(
+        rays.Px.values, rays.Py.values, number_of_terms, ordering
+    )
+    field_coords, field_of_ray = np.unique(
+        np.stack([rays.Hx.values, rays.Hy.values], axis=-1),
+        axis=0,
+        return_inverse=True,
+    )
+    field_of_ray = field_of_ray.ravel()
+    opd = rays.OPD.transpose("wvln", "ray").values.astype(float)
+    valid = np.logical_and(
+        ~rays.error.transpose("wvln", "ray").values.astype(bool),
+        rays.vignette.transpose("wvln", "ray").values == 0,
+    )
+    valid = np.logical_and(valid, np.isfinite(opd))
+    # Weights of shape (wvln, field, ray): 1 for the valid rays of each field.
+    weights = np.logical_and(
+        valid[:, np.newaxis, :],
+        field_of_ray[np.newaxis, np.newaxis, :]
+        == np.arange(field_coords.shape[0])[np.newaxis, :, np.newaxis],
+    ).astype(float)
+    opd = np.where(valid, opd, 0.0)
+    if self._verbose:
+        cp(
+            f"!@lg!@Zernike_FitRayTraceOPD :: Fitting [!@lm!@{number_of_terms}!@lg!@] {ordering} terms to [!@lm!@{field_coords.shape[0]}!@lg!@] fields and [!@lm!@{opd.shape[0]}!@lg!@] wavelengths."
+        )
+    normal_matrix = np.einsum("rt,wfr,rs->wfts", basis, weights, basis, optimize=True)
+    normal_vector = np.einsum("rt,wfr,wr->wft", basis, weights, opd, optimize=True)
+    coefficient = np.einsum(
+        "wfts,wfs->wft", np.linalg.pinv(normal_matrix), normal_vector
+    )
+    number_of_rays = weights.sum(axis=-1)
+    counts = np.maximum(number_of_rays, 1)
+    residual = opd[:, np.newaxis, :] - np.einsum("rt,wft->wfr", basis, coefficient)
+    rms_residual = np.sqrt((weights * residual**2).sum(axis=-1) / counts)
+    mean_opd = (weights * opd[:, np.newaxis, :]).sum(axis=-1) / counts
+    rms_wavefront = np.sqrt(
+        (weights * (opd[:, np.newaxis, :] - mean_opd[..., np.newaxis]) ** 2).sum(
+            axis=-1
+        )
+        / counts
+    )
+    if np.any(number_of_rays < indices.shape[0]):
+        cp(
+            "!@ly!@Zernike_FitRayTraceOPD :: Some fields/wavelengths have fewer valid rays than Zernike terms. Their coefficients are not unique."
+        )
+    opd_units = rays.OPD.attrs.get("units", "")
+    return xr.Dataset(
+        {
+            "coefficient": (
+                ("wvln", "field", "term"),
+                coefficient,
+                {"units": opd_units},
+            ),
+            "rms_residual": (("wvln", "field"), rms_residual, {"units": opd_units}),
+            "rms_wavefront": (("wvln", "field"), rms_wavefront, {"units": opd_units}),
+            "number_of_rays": (("wvln", "field"), number_of_rays.astype(int)),
+        },
+        coords={
+            "wavelengths": rays.wavelengths,
+            "Hx": ("field", field_coords[:, 0]),
+            "Hy": ("field", field_coords[:, 1]),
+            "term": ("term", np.arange(1, indices.shape[0] + 1)),
+            "n": ("term", indices[:, 0]),
+            "m": ("term", indices[:, 1]),
+        },
+        attrs={
+            "Zernike_Ordering": str(ordering),
+            "OPD_mode": str(rays.attrs["OPD_mode"]),
+        },
+    )
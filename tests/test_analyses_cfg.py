@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import struct
+from pathlib import Path
+
+import pytest
+
+from skZemax.skZemax_subfunctions._analyses_cfg_functions import (
+    AnalysisCfg_Diff,
+    AnalysisCfg_Read,
+    AnalysisCfg_SetSetting,
+    AnalysisCfg_Write,
+)
+
+CFG_DIR = Path(__file__).parents[1] / "src" / "skZemax" / "ZemaxConfigFiles"
+
+
+@pytest.fixture(params=["FFTMTF.CFG", "HuygensMtf.CFG"])
+def cfg_path(request):
+    return CFG_DIR / request.param
+
+
+def test_read_write_round_trip(cfg_path, tmp_path):
+    cfg = AnalysisCfg_Read(cfg_path)
+    assert cfg.header.magic == 2000
+    assert [x.words[1] for x in cfg.blocks] == [8500]
+    out_file = tmp_path / cfg_path.name
+    assert AnalysisCfg_Write(cfg, out_file) == cfg_path.read_bytes()
+    assert out_file.read_bytes() == cfg_path.read_bytes()
+
+
+def test_read_typed_settings():
+    cfg = AnalysisCfg_Read(CFG_DIR / "FFTMTF.CFG")
+    settings = {x.slot: x for x in cfg.settings}
+    assert cfg.header.analysis_id == 340
+    assert settings[0].dtype == "int32"
+    assert settings[0].value == 4
+    assert settings[7].dtype == "float64"
+    assert settings[7].value == 1.0
+    assert 8 not in settings
+
+
+def test_set_int_setting():
+    cfg = AnalysisCfg_SetSetting(AnalysisCfg_Read(CFG_DIR / "FFTMTF.CFG"), 0, 6)
+    raw = AnalysisCfg_Write(cfg)
+    assert struct.unpack_from("<i", raw, 20)[0] == 6
+    assert AnalysisCfg_Read(raw).settings[0].value == 6
+
+
+def test_set_float64_setting():
+    cfg = AnalysisCfg_SetSetting(AnalysisCfg_Read(CFG_DIR / "FFTMTF.CFG"), 7, 42.5)
+    raw = AnalysisCfg_Write(cfg)
+    assert struct.unpack_from("<d", raw, 48)[0] == 42.5
+    assert {x.slot: x.value for x in AnalysisCfg_Read(raw).settings}[7] == 42.5
+
+
+def test_set_int_over_float64_setting_clears_upper_half():
+    cfg = AnalysisCfg_SetSetting(
+        AnalysisCfg_Read(CFG_DIR / "FFTMTF.CFG"), 7, 3, dtype="int32"
+    )
+    raw = AnalysisCfg_Write(cfg)
+    assert struct.unpack_from("<2i", raw, 48) == (3, 0)
+
+
+def test_diff():
+    original = AnalysisCfg_Read(CFG_DIR / "FFTMTF.CFG")
+    assert AnalysisCfg_Diff(original, CFG_DIR / "FFTMTF.CFG") == []
+    edited = AnalysisCfg_SetSetting(AnalysisCfg_Read(CFG_DIR / "FFTMTF.CFG"), 1, 3)
+    changes = AnalysisCfg_Diff(original, edited)
+    assert [(x.name, x.a, x.b) for x in changes] == [("slot_1", 1, 3)]
+    changes = AnalysisCfg_Diff(CFG_DIR / "FFTMTF.CFG", CFG_DIR / "HuygensMtf.CFG")
+    assert ("header_word_1", 340, 345) in [(x.name, x.a, x.b) for x in changes]
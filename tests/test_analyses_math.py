@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import numpy as np
+
+from skZemax.skZemax_subfunctions._analyses_math_functions import (
+    _Analysis_BestFocusAndDepthOfFocus_,
+    _Analysis_PsfLog_,
+    _Analysis_SquareWaveFromMTF_,
+)
+
+
+def test_square_wave_from_linear_mtf():
+    # For a linear MTF with cut-off fc the odd harmonics 3f, 5f, ... beyond fc do not contribute.
+    freq = np.linspace(0, 100, 101)
+    cut_off = 60.0
+    mtf = np.clip(1 - freq / cut_off, 0, None)
+    square = _Analysis_SquareWaveFromMTF_(None, freq, mtf)
+    assert square[0] == mtf[0]
+    only_first = (freq > cut_off / 3) & (freq < cut_off)
+    np.testing.assert_allclose(square[only_first], 4 / np.pi * mtf[only_first])
+    first_two = (freq > cut_off / 5) & (freq <= cut_off / 3)
+    np.testing.assert_allclose(
+        square[first_two],
+        4
+        / np.pi
+        * (mtf[first_two] - np.clip(1 - 3 * freq[first_two] / cut_off, 0, None) / 3),
+    )
+    np.testing.assert_allclose(square[freq >= cut_off], 0.0)
+
+
+def test_square_wave_axis():
+    freq = np.linspace(0, 50, 26)
+    mtf = np.stack([np.exp(-freq / 20), np.exp(-freq / 30)])
+    np.testing.assert_allclose(
+        _Analysis_SquareWaveFromMTF_(None, freq, mtf, axis=1),
+        _Analysis_SquareWaveFromMTF_(None, freq, mtf.T, axis=0).T,
+    )
+
+
+def test_best_focus_and_depth_of_focus():
+    defocus = np.linspace(-50, 50, 21)
+    metric = np.stack([1 - ((defocus - 3) / 20) ** 2, 0.5 - ((defocus + 7) / 40) ** 2])
+    best_focus, best_metric, lower, upper, cut_off = (
+        _Analysis_BestFocusAndDepthOfFocus_(None, defocus, metric, 0.8)
+    )
+    np.testing.assert_allclose(best_focus, [3, -7])
+    np.testing.assert_allclose(best_metric, [1, 0.5])
+    # The edges are interpolated linearly between the samples of the parabolas.
+    np.testing.assert_allclose(lower, [3 - np.sqrt(80), -7 - np.sqrt(160)], atol=0.5)
+    np.testing.assert_allclose(upper, [3 + np.sqrt(80), -7 + np.sqrt(160)], atol=0.5)
+    assert not cut_off
+
+
+def test_best_focus_cut_off_by_sweep():
+    defocus = np.linspace(-10, 10, 11)
+    best_focus, _, lower, upper, cut_off = _Analysis_BestFocusAndDepthOfFocus_(
+        None, defocus, 1 + defocus / 100, 0.8
+    )
+    assert best_focus == 10
+    assert lower == -10
+    assert upper == 10
+    assert cut_off
+
+
+def test_depth_of_focus_brackets_best_focus_above_best_sample():
+    # The fitted vertex is above the best sample, so 0.99 of it is above every sample.
+    defocus = np.linspace(-50, 50, 11)
+    metric = np.exp(-(((defocus - 4) / 10) ** 2))
+    best_focus, best_metric, lower, upper, cut_off = (
+        _Analysis_BestFocusAndDepthOfFocus_(None, defocus, metric, 0.99)
+    )
+    assert best_metric > metric.max()
+    assert lower < best_focus < upper
+    assert upper - lower < defocus[1] - defocus[0]
+    assert not cut_off
+    # Mirroring the sweep mirrors the result.
+    mirrored = _Analysis_BestFocusAndDepthOfFocus_(None, defocus, metric[::-1], 0.99)
+    np.testing.assert_allclose(
+        [mirrored[0], mirrored[2], mirrored[3]], [-best_focus, -upper, -lower]
+    )
+
+
+def test_psf_log_is_relative_to_peak_and_floored():
+    linear = np.array([[0.0, 1e-9, 2e-3], [0.02, 0.2, 0.0]])
+    for decades in (1, 3, 5):
+        log = _Analysis_PsfLog_(None, linear, decades)
+        assert log.max() == 0
+        np.testing.assert_allclose(log.min(), -decades)
+        np.testing.assert_allclose(log[1, 0], -1)
+    np.testing.assert_allclose(
+        _Analysis_PsfLog_(None, linear, 5), _Analysis_PsfLog_(None, 7 * linear, 5)
+    )
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+
+from skZemax.skZemax_subfunctions._analyses_report_functions import (
+    AnalysisReport_IndexSections,
+    AnalysisReport_ParsePrescription,
+)
+
+REPORT = Path(__file__).parent / "data" / "prescription_report.txt"
+
+
+def test_index_sections():
+    sections = AnalysisReport_IndexSections(REPORT)
+    assert list(sections) == [
+        "PREAMBLE",
+        "GENERAL LENS DATA",
+        "SURFACE DATA SUMMARY",
+        "INDEX OF REFRACTION DATA",
+        "GLOBAL VERTEX COORDINATES, ORIENTATIONS, AND ROTATION/OFFSET MATRICES",
+        "ELEMENT VOLUME DATA",
+    ]
+    sections = AnalysisReport_IndexSections(REPORT, sections=["element volume data"])
+    assert list(sections) == ["ELEMENT VOLUME DATA"]
+
+
+def test_general_lens_data():
+    general = AnalysisReport_ParsePrescription(REPORT).general_lens_data
+    assert general.Surfaces == 4
+    assert general.Stop == 1
+    assert general.RayAiming is False
+    assert general.TotalTrack == 437.6094
+    assert general.LensUnits == "Millimeters"
+    assert general.EffectiveFocalLengthInImageSpace == 400
+
+
+def test_surface_data_summary():
+    surface_data = AnalysisReport_ParsePrescription(REPORT).surface_data
+    assert surface_data.surf_label.values.tolist() == ["OBJ", "STO", "2", "3", "IMA"]
+    np.testing.assert_array_equal(
+        surface_data.radius.values, [np.inf, np.inf, 100, 187.1033, np.inf]
+    )
+    assert np.isnan(surface_data.thickness.values[-1])
+    assert surface_data.glass.values[2] == "N-BK7"
+    assert surface_data.comment.values[2] == "Front of lens"
+
+
+def test_index_of_refraction():
+    index = AnalysisReport_ParsePrescription(REPORT).index_of_refraction
+    assert index.surf.values.tolist() == [0, 1, 2, 3, 4]
+    np.testing.assert_allclose(index.wavelengths.values, [0.5875618])
+    np.testing.assert_allclose(index["index"].values[:, 0], [1, 1, 1.5168000345, 1, 1])
+    assert index.glass.values.tolist() == ["", "", "N-BK7", "", ""]
+    np.testing.assert_allclose(index.temperature.values, 20.0)
+
+
+def test_global_vertex():
+    vertex = AnalysisReport_ParsePrescription(REPORT).global_vertex
+    assert vertex.attrs["Reference_Surface"] == 1
+    assert vertex.surf.values.tolist() == [1, 2, 3, 4]
+    np.testing.assert_allclose(
+        vertex.vertex.sel(axis="z").values, [0, 50, 60, 437.6094193]
+    )
+    np.testing.assert_allclose(
+        vertex.rotation.values, np.broadcast_to(np.eye(3), (4, 3, 3))
+    )
+
+
+def test_element_volume():
+    volume = AnalysisReport_ParsePrescription(REPORT).element_volume
+    assert volume.first_surface.values.tolist() == [2]
+    assert volume.last_surface.values.tolist() == [3]
+    np.testing.assert_allclose(volume.mass_g.values, [44.440351])
+    assert volume.attrs["Total_Mass_g"] == 44.440351
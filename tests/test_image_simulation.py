@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import xarray as xr
+from PIL import Image
+
+from skZemax.skZemax_subfunctions._image_simulation_functions import (
+    ImageSimulation_Convolve,
+    _ImageSimulation_LoadScene_,
+)
+
+
+class _Simulator:
+    _verbose = False
+    _ImageSimulation_LoadScene_ = _ImageSimulation_LoadScene_
+    ImageSimulation_Convolve = ImageSimulation_Convolve
+
+
+def _delta_psf_grid(
+    number_of_pixels_x, number_of_pixels_y, nodes_x, nodes_y, number_of_wavelengths=1
+):
+    kernels = np.zeros(
+        (number_of_wavelengths, len(nodes_y), len(nodes_x), 7, 7), dtype=np.float32
+    )
+    kernels[..., 3, 3] = 1.0
+    return xr.Dataset(
+        {
+            "psf": (("wvln", "node_y", "node_x", "ky", "kx"), kernels),
+            "weights": ("wvln", np.ones(number_of_wavelengths)),
+        },
+        coords={
+            "node_x": ("node_x", np.asarray(nodes_x, dtype=float)),
+            "node_y": ("node_y", np.asarray(nodes_y, dtype=float)),
+            "wavelengths": ("wvln", np.linspace(0.5, 0.6, number_of_wavelengths)),
+        },
+        attrs={
+            "Number_Of_Pixels_X": number_of_pixels_x,
+            "Number_Of_Pixels_Y": number_of_pixels_y,
+            "Pixel_Pitch_mm": 0.005,
+        },
+    )
+
+
+def test_convolve_with_delta_kernels_reproduces_scene():
+    scene = np.random.default_rng(0).random((48, 64)).astype(np.float32)
+    psf_grid = _delta_psf_grid(64, 48, [0, 21, 42, 63], [0, 23.5, 47])
+    sim = _Simulator().ImageSimulation_Convolve(scene, psf_grid, number_of_workers=2)
+    assert sim.sim_image_polychromatic.shape == (48, 64)
+    np.testing.assert_allclose(
+        sim.sim_image_polychromatic.values, scene, rtol=0, atol=4e-7
+    )
+    np.testing.assert_array_equal(sim.input_image_mono.values, scene)
+
+
+def test_convolve_mono_with_delta_kernels_reproduces_scene():
+    scene = np.random.default_rng(1).random((30, 20)).astype(np.float32)
+    psf_grid = _delta_psf_grid(20, 30, [0, 19], [0, 10, 29], number_of_wavelengths=2)
+    sim = _Simulator().ImageSimulation_Convolve(scene, psf_grid, polychromatic=False)
+    assert sim.sim_image_mono.dims == ("wavelength", "y", "x")
+    for wavelength_idx in range(2):
+        np.testing.assert_allclose(
+            sim.sim_image_mono.values[wavelength_idx], scene, rtol=0, atol=4e-7
+        )
+
+
+def test_convolve_shifted_kernel_shifts_scene():
+    scene = np.zeros((32, 32), dtype=np.float32)
+    scene[10, 12] = 1.0
+    psf_grid = _delta_psf_grid(32, 32, [0, 31], [0, 31])
+    psf_grid.psf.values[..., 3, 3] = 0.0
+    psf_grid.psf.values[..., 4, 3] = 1.0
+    sim = _Simulator().ImageSimulation_Convolve(scene, psf_grid)
+    assert np.unravel_index(
+        np.argmax(sim.sim_image_polychromatic.values), (32, 32)
+    ) == (11, 12)
+    np.testing.assert_allclose(sim.sim_image_polychromatic.values.sum(), 1.0, atol=1e-6)
+
+
+@pytest.mark.parametrize("detector_size", [(80, 100), (23, 37), (160, 250)])
+def test_load_scene_in_strips_matches_full_load(tmp_path, detector_size):
+    scene_path = tmp_path / "scene.png"
+    rng = np.random.default_rng(2)
+    Image.fromarray(rng.integers(0, 255, (100, 80), dtype=np.uint8)).save(scene_path)
+    sim = _Simulator()
+    full = sim._ImageSimulation_LoadScene_(str(scene_path), *detector_size)
+    for rows_per_strip in (1, 7, 64):
+        staged = sim._ImageSimulation_LoadScene_(
+            str(scene_path), *detector_size, rows_per_strip=rows_per_strip
+        )
+        assert isinstance(staged, np.memmap)
+        # Pillow's resampling weights depend slightly on the (fractional) offset of each strip.
+        np.testing.assert_allclose(staged, full, rtol=0, atol=255 * 1e-5)
+        del staged
+    # Both ways of loading close the scene file.
+    scene_path.unlink()
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import numpy as np
+
+from skZemax.skZemax_subfunctions._zernike_functions import (
+    Zernike_Evaluate,
+    Zernike_GetTermIndices,
+)
+
+
+def test_standard_term_indices():
+    indices = Zernike_GetTermIndices(11, ordering="Standard")
+    assert indices.tolist() == [
+        [0, 0],
+        [1, 1],
+        [1, -1],
+        [2, 0],
+        [2, -2],
+        [2, 2],
+        [3, -1],
+        [3, 1],
+        [3, -3],
+        [3, 3],
+        [4, 0],
+    ]
+
+
+def test_fringe_term_indices():
+    indices = Zernike_GetTermIndices(37, ordering="Fringe")
+    assert indices.shape == (37, 2)
+    assert indices[0:9].tolist() == [
+        [0, 0],
+        [1, 1],
+        [1, -1],
+        [2, 0],
+        [2, 2],
+        [2, -2],
+        [3, 1],
+        [3, -1],
+        [4, 0],
+    ]
+    assert indices[-1].tolist() == [12, 0]
+    assert Zernike_GetTermIndices(38, ordering="Fringe") is None
+
+
+def test_standard_terms_are_orthonormal():
+    # Gauss-Legendre in rho^2 and uniform in theta integrate the polynomials exactly over the unit disk.
+    nodes, weights = np.polynomial.legendre.leggauss(16)
+    rho = np.sqrt((nodes + 1) / 2)
+    theta = np.arange(64) * 2 * np.pi / 64
+    rho_grid, theta_grid = np.meshgrid(rho, theta, indexing="ij")
+    area_weights = np.repeat(weights / 2, theta.shape[0]) / theta.shape[0]
+    basis = Zernike_Evaluate(
+        (rho_grid * np.cos(theta_grid)).ravel(),
+        (rho_grid * np.sin(theta_grid)).ravel(),
+        number_of_terms=28,
+        ordering="Standard",
+    )
+    gram = basis.T @ (basis * area_weights[:, np.newaxis])
+    np.testing.assert_allclose(gram, np.eye(28), atol=1e-10)
+
+
+def test_fringe_terms_peak_at_pupil_edge():
+    basis = Zernike_Evaluate(np.array([1.0]), np.array([0.0]), ordering="Fringe")
+    indices = Zernike_GetTermIndices(37, ordering="Fringe")
+    np.testing.assert_allclose(basis[0, indices[:, 1] == 0], 1.0)